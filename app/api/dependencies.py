@@ -15,8 +15,25 @@ async def get_db():
         raise e  # 데이터베이스 연결 실패 등의 처리
 
 
-async def get_redis():
+# 스트리밍 응답을 위한 세션 생성 함수
+async def get_stream_db():
+    """
+    StreamingResponse 의 본문은 yield 의존성이 정리된 뒤에 전송되므로,
+    get_db 의 세션은 본문을 읽는 동안 이미 닫혀 있다.
+    응답 본문(export_game_log)이 다 보낸 뒤 닫는 세션을 반환하고,
+    응답을 만들기 전에 오류가 나면 여기서 닫는다.
+    """
+    session = AsyncSessionLocal()
     try:
-        yield RedisClient  # FastAPI의 Dependency Injection을 통해 사용
-    finally:
-        await RedisClient.close()
+        yield session
+    except Exception:
+        await session.close()
+        raise
+
+
+async def get_redis():
+    """
+    worker 의 공용 redis 연결 객체를 반환하는 함수
+    요청마다 닫지 않고, 연결은 앱이 종료될 때 lifespan 에서 닫음
+    """
+    return RedisClient
@@ -1,20 +1,51 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import Sequence
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Response
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 from typing import List
 
 from app.models.game import Game
-from app.api.dependencies import get_db
+from app.api.dependencies import get_db, get_redis
+from app.core.conditional import conditional_get
 from app.core.exceptions import UnprocessableEntityException
-from app.schemas.game import GameCreate, GameUpdate, GameResponse
+from app.core.responses import render_json
+from app.crud.version import GAMES
+from app.schemas.game import (
+    GameRow,
+    GameCreate,
+    GameUpdate,
+    GameResponse,
+    LeaderboardParams,
+    LeaderboardEntry,
+    TrendingParams,
+    TrendingEntry,
+    RecommendationParams,
+    SimilarGame,
+    NearestGameParams,
+    NearestGame,
+)
 from app.crud.game import (
     create_game_in_db,
-    get_game_in_db,
+    get_game_rows_in_db,
     update_game_in_db,
     delete_game_in_db,
 )
-from app.services.game import is_not_existing_game, is_existing_game
+from app.crud.leaderboard import (
+    get_game_leaderboard_in_redis,
+    get_player_leaderboard_in_redis,
+    delete_game_from_leaderboard_in_redis,
+)
+from app.crud.trending import get_trending_game_in_redis
+from app.crud.game_similarity import get_similar_games_in_db
+from app.services.game import (
+    is_not_existing_game,
+    is_existing_game,
+    get_existing_game_in_db,
+    find_nearest_games,
+    GAME_LIST_ADAPTER,
+)
 
 from app.models.user import User
 from app.core.security import get_admin_user_in_db
@@ -26,6 +57,7 @@ router = APIRouter()
 async def create_game(
     game_info: GameCreate,
     db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
     admin_user: User = Depends(get_admin_user_in_db),
 ) -> None:
     """
@@ -33,29 +65,87 @@ async def create_game(
     Args:
         game_info: 생성할 게임의 정보
         db: AsyncSession
+        redis_db: redis db
         admin_user: 현재 관리자
     """
     await is_not_existing_game(db, game_name=game_info.name)
-    await create_game_in_db(db, game_info)
+    await create_game_in_db(db, redis_db, game_info)
 
 
-@router.get("/list", status_code=status.HTTP_200_OK, response_model=List[GameResponse])
-async def get_all_game(db: AsyncSession = Depends(get_db)) -> Sequence[Game]:
+@router.get(
+    "/list",
+    status_code=status.HTTP_200_OK,
+    response_model=List[GameResponse],
+    dependencies=[Depends(conditional_get(GAMES))],
+)
+async def get_all_game(
+    response: Response, db: AsyncSession = Depends(get_db)
+) -> Response:
     """
     등록된 모든 게임 목록을 반환하는 API
     Args:
+        response: ETag 등 응답 헤더
         db: AsyncSession
 
     Returns:
         전체 게임 목록
     """
-    return await get_game_in_db(db)
+    return render_json(
+        GAME_LIST_ADAPTER, await get_game_rows_in_db(db), response, validate=False
+    )
+
+
+@router.get(
+    "/leaderboard",
+    status_code=status.HTTP_200_OK,
+    response_model=List[LeaderboardEntry],
+)
+async def get_game_leaderboard(
+    leaderboard: Annotated[LeaderboardParams, Query()],
+    redis_db: Redis = Depends(get_redis),
+) -> list[dict]:
+    """
+    가장 많이 플레이한 게임 순위를 반환하는 API
+    Args:
+        leaderboard: 순위 기준(plays, minutes), 순위 수
+        redis_db: redis db
+
+    Returns:
+        게임 이름과 플레이 수 또는 플레이 시간
+    """
+    return await get_game_leaderboard_in_redis(
+        redis_db, by=leaderboard.by, limit=leaderboard.limit
+    )
+
+
+@router.get(
+    "/trending", status_code=status.HTTP_200_OK, response_model=List[TrendingEntry]
+)
+async def get_trending_game(
+    trending: Annotated[TrendingParams, Query()],
+    redis_db: Redis = Depends(get_redis),
+) -> list[dict]:
+    """
+    최근 기간 동안 많이 플레이된 게임 순위를 반환하는 API
+    Args:
+        trending: 기간(24h, 7d, 30d), 순위 수
+        redis_db: redis db
+
+    Returns:
+        게임 이름과 최근 기록일수록 가중치가 큰 플레이 수
+    """
+    return await get_trending_game_in_redis(
+        redis_db, window=trending.window, limit=trending.limit
+    )
 
 
 @router.get(
-    "/list/{game_name}", status_code=status.HTTP_200_OK, response_model=GameResponse
+    "/list/{game_name}",
+    status_code=status.HTTP_200_OK,
+    response_model=GameResponse,
+    dependencies=[Depends(conditional_get(GAMES))],
 )
-async def get_game(game_name: str, db: AsyncSession = Depends(get_db)) -> Game:
+async def get_game(game_name: str, db: AsyncSession = Depends(get_db)) -> GameRow:
     """
     주어진 게임의 정보를 반환하는 API
     Args:
@@ -69,6 +159,90 @@ async def get_game(game_name: str, db: AsyncSession = Depends(get_db)) -> Game:
     return game
 
 
+@router.get(
+    "/list/{game_name}/leaderboard",
+    status_code=status.HTTP_200_OK,
+    response_model=List[LeaderboardEntry],
+)
+async def get_player_leaderboard(
+    game_name: str,
+    leaderboard: Annotated[LeaderboardParams, Query()],
+    db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
+) -> list[dict]:
+    """
+    주어진 게임을 가장 많이 플레이한 사용자 순위를 반환하는 API
+    Args:
+        game_name: 순위를 볼 게임의 이름
+        leaderboard: 순위 기준(plays, minutes), 순위 수
+        db: AsyncSession
+        redis_db: redis db
+
+    Returns:
+        사용자 이름과 플레이 수 또는 플레이 시간
+    """
+    game = await is_existing_game(db, game_name)
+    return await get_player_leaderboard_in_redis(
+        redis_db, game_name=game.name, by=leaderboard.by, limit=leaderboard.limit
+    )
+
+
+@router.get(
+    "/list/{game_name}/similar",
+    status_code=status.HTTP_200_OK,
+    response_model=List[SimilarGame],
+)
+async def get_similar_game(
+    game_name: str,
+    recommendation: Annotated[RecommendationParams, Query()],
+    db: AsyncSession = Depends(get_db),
+) -> list[dict]:
+    """
+    주어진 게임을 플레이한 사용자들이 함께 플레이한 게임을 반환하는 API
+    Args:
+        game_name: 기준 게임의 이름
+        recommendation: 반환할 게임 수
+        db: AsyncSession
+
+    Returns:
+        유사도가 높은 순으로 정렬된 게임 이름과 유사도
+    """
+    game = await is_existing_game(db, game_name)
+    similarities = await get_similar_games_in_db(
+        db, [game.name], limit=recommendation.limit
+    )
+    return [
+        {"name": similarity.similar_game_name, "score": similarity.score}
+        for similarity in similarities
+    ]
+
+
+@router.get(
+    "/list/{game_name}/nearest",
+    status_code=status.HTTP_200_OK,
+    response_model=List[NearestGame],
+)
+async def get_nearest_game(
+    game_name: str,
+    nearest: Annotated[NearestGameParams, Query()],
+    db: AsyncSession = Depends(get_db),
+) -> list[dict]:
+    """
+    weight, 플레이 인원, 평균 플레이 시간이 비슷한 게임을 반환하는 API
+    Args:
+        game_name: 기준 게임의 이름
+        nearest: 플레이할 인원과 반환할 게임 수
+        db: AsyncSession
+
+    Returns:
+        거리가 가까운 순으로 정렬된 게임 이름과 거리
+    """
+    game = await is_existing_game(db, game_name)
+    return await find_nearest_games(
+        db, game, participant_num=nearest.participant_num, limit=nearest.limit
+    )
+
+
 @router.patch(
     "/patch/{game_name}", status_code=status.HTTP_200_OK, response_model=GameResponse
 )
@@ -76,6 +250,7 @@ async def update_game(
     game_name: str,
     game_update: GameUpdate,
     db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
     admin_user: User = Depends(get_admin_user_in_db),
 ) -> Game:
     """
@@ -84,13 +259,14 @@ async def update_game(
         game_name: 수정하려는 게임의 이름
         game_update: 변경하려는 정보
         db: AsyncSession
+        redis_db: redis db
         admin_user: 현재 관리자
 
     Returns:
         변경한 게임 객체
     """
     update_data = game_update.model_dump(exclude_unset=True)
-    game = await is_existing_game(db=db, game_name=game_name)
+    game = await get_existing_game_in_db(db=db, game_name=game_name)
 
     if "name" in update_data and update_data["name"].strip() is not None:
         await is_not_existing_game(db, game_name=update_data["name"].lower())
@@ -122,13 +298,16 @@ async def update_game(
     if not update_data:  # 변경할 내용이 없을 때
         raise UnprocessableEntityException()
 
-    return await update_game_in_db(db=db, game=game, update_data=update_data)
+    return await update_game_in_db(
+        db=db, redis_db=redis_db, game=game, update_data=update_data
+    )
 
 
 @router.delete("/delete/{game_name}", status_code=status.HTTP_200_OK)
 async def delete_game(
     game_name: str,
     db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
     admin_user: User = Depends(get_admin_user_in_db),
 ) -> dict[str, str]:
     """
@@ -136,10 +315,11 @@ async def delete_game(
     Args:
         game_name: 삭제하고자 하는 게임의 이름
         db: AsyncSession
+        redis_db: redis db
         admin_user: 현재 관리자
 
     Returns:
         게임이 삭제되었다는 메시지
     """
-    game = await is_existing_game(db=db, game_name=game_name)
-    return await delete_game_in_db(db=db, game=game)
+    game = await get_existing_game_in_db(db=db, game_name=game_name)
+    return await delete_game_in_db(db=db, redis_db=redis_db, game=game)
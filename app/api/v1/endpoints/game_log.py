@@ -1,113 +1,388 @@
-from fastapi import APIRouter, Depends
+from typing import Annotated, Any
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Query,
+    UploadFile,
+    Path,
+    Header,
+    Request,
+    Response,
+)
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from app.core.conditional import conditional_get
 from app.core.exceptions import NotAcceptableException, ForbiddenException
-from app.models.user import User
-from app.api.dependencies import get_db
-from app.core.security import get_current_user_in_db
+from app.core.loader import Loaders, get_loaders
+from app.core.responses import ClosingStreamingResponse
+from app.schemas.user import Principal
+from app.api.dependencies import get_db, get_stream_db, get_redis
+from app.core.security import get_current_user_in_db, get_admin_user_in_db
 from app.crud.game_log import (
     create_game_log_in_db,
+    create_game_logs_in_db,
     get_game_log_in_db,
+    search_game_log_in_db,
     update_game_log_in_db,
     delete_game_log_in_db,
 )
-from app.schemas.game_log import GameLogCreate, GameLogUpdate
+from app.crud.version import GAMES, GAME_LOGS, USERS
+from app.schemas.game_log import (
+    GameLogCreate,
+    GameLogUpdate,
+    GameLogPageParams,
+    GameLogSearchParams,
+    GameLogExportParams,
+    GameLogBulkCreate,
+    GameLogBulkResult,
+    GameLogImportResult,
+    GameLogResponse,
+    GameLogPage,
+    GameLogSearchPage,
+)
 from app.services.game import is_existing_game
-from app.services.game_log import validate_participant_num, is_existing_game_log
+from app.services.game_log_import import import_game_log
+from app.services.picture import (
+    store_picture,
+    picture_response,
+    PICTURE_UPLOAD_OPENAPI,
+)
+from app.services.game_log import (
+    validate_participant_num,
+    validate_game_log_bulk,
+    is_existing_game_log,
+    export_game_log,
+    game_log_page_response,
+    game_log_search_response,
+    EXPORT_MEDIA_TYPES,
+)
 
 router = APIRouter()
 
+# include 로 함께 받는 관련 데이터의 테이블 (ETag 에 포함)
+INCLUDE_TABLES = {"game": GAMES, "user": USERS}
+
 
 @router.post("/create", status_code=status.HTTP_201_CREATED)
 async def create_game_log(
     game_log_info: GameLogCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_in_db),
+    redis_db: Redis = Depends(get_redis),
+    current_user: Principal = Depends(get_current_user_in_db),
 ):
     """
     게임 기록 생성하는 API
     Args:
         game_log_info: 생성할 게임 기록이 담긴 데이터
         db: AsyncSession
+        redis_db: redis db
         current_user: 현재 사용자
     """
     game = await is_existing_game(db, game_log_info.game_name)
     await validate_participant_num(game, game_log_info.participant_num)
-    await create_game_log_in_db(db, game_log_info, user=current_user, game=game)
+    await create_game_log_in_db(
+        db, redis_db, game_log_info, user=current_user, game=game
+    )
+
+
+@router.post(
+    "/bulk", status_code=status.HTTP_201_CREATED, response_model=GameLogBulkResult
+)
+async def create_game_log_bulk(
+    bulk_info: GameLogBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
+    current_user: Principal = Depends(get_current_user_in_db),
+) -> dict[str, Any]:
+    """
+    여러 게임 기록을 한 번에 생성하는 API
+    Args:
+        bulk_info: 생성할 게임 기록들
+        db: AsyncSession
+        redis_db: redis db
+        current_user: 현재 사용자
+
+    Returns:
+        생성된 기록 수, 생성하지 못한 기록의 위치와 이유
+    """
+    game_logs, errors = await validate_game_log_bulk(db, bulk_info.game_logs)
+    if game_logs:
+        await create_game_logs_in_db(db, redis_db, game_logs, user=current_user)
+    return {"created": len(game_logs), "errors": errors}
 
 
-@router.get("/list", status_code=status.HTTP_200_OK)
-async def get_all_game_log(db: AsyncSession = Depends(get_db)):
+@router.post(
+    "/import", status_code=status.HTTP_201_CREATED, response_model=GameLogImportResult
+)
+async def import_game_log_csv(
+    file: UploadFile,
+    db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
+    current_user: Principal = Depends(get_current_user_in_db),
+) -> dict[str, Any]:
+    """
+    CSV 파일로 과거 게임 기록을 가져오는 API
+    Args:
+        file: date, game_name, during_time, participant_num, subject, content, picture
+            컬럼을 가진 UTF-8 CSV 파일
+        db: AsyncSession
+        redis_db: redis db
+        current_user: 현재 사용자
+
+    Returns:
+        가져온 기록 수, 가져오지 못한 행 수와 이유
+    """
+    return await import_game_log(db, redis_db, file.file, user_name=current_user.name)
+
+
+@router.get(
+    "/list",
+    status_code=status.HTTP_200_OK,
+    response_model=GameLogPage,
+    dependencies=[Depends(conditional_get(GAME_LOGS, include_tables=INCLUDE_TABLES))],
+)
+async def get_all_game_log(
+    page: Annotated[GameLogPageParams, Query()],
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    loaders: Loaders = Depends(get_loaders),
+):
     """
     모든 게임 기록 반환하는 API
     Args:
+        page: cursor, 페이지 크기, 작성 일시 범위, 정렬 방향, 응답 필드, 관련 데이터
+        response: ETag 등 응답 헤더
         db: AsyncSession
+        loaders: 관련 데이터를 모아 읽는 요청 단위 loader
 
     Returns:
-        전체 게임 기록
+        전체 게임 기록 중 한 페이지와 다음 페이지의 cursor
     """
-    return await get_game_log_in_db(db)
+    game_logs, next_cursor = await get_game_log_in_db(db, page=page)
+    return await game_log_page_response(response, game_logs, next_cursor, page, loaders)
 
 
-@router.get("/list/my", status_code=status.HTTP_200_OK)
+@router.get("/search", status_code=status.HTTP_200_OK, response_model=GameLogSearchPage)
+async def search_game_log(
+    search: Annotated[GameLogSearchParams, Query()],
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    loaders: Loaders = Depends(get_loaders),
+):
+    """
+    제목과 내용으로 게임 기록을 검색하는 API
+    - 검색어는 trigram 색인으로 찾으므로 3글자 이상인 단어가 하나 이상 있어야 함 (없으면 422)
+    - 2글자 이하의 단어는 긴 단어로 찾은 기록 중에서 거르는 데만 사용
+    Args:
+        search: 검색어, 페이지 크기, offset, 응답 필드, 관련 데이터
+        response: 응답 헤더
+        db: AsyncSession
+        loaders: 관련 데이터를 모아 읽는 요청 단위 loader
+
+    Returns:
+        검색어와 관련도가 높은 순으로 정렬된 기록 중 한 페이지와 다음 페이지의 offset
+    """
+    game_logs, next_offset = await search_game_log_in_db(db, search)
+    return await game_log_search_response(
+        response, game_logs, next_offset, search, loaders
+    )
+
+
+@router.get(
+    "/list/my",
+    status_code=status.HTTP_200_OK,
+    response_model=GameLogPage,
+    dependencies=[
+        Depends(conditional_get(GAME_LOGS, private=True, include_tables=INCLUDE_TABLES))
+    ],
+)
 async def get_game_log_by_user(
+    page: Annotated[GameLogPageParams, Query()],
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_in_db),
+    loaders: Loaders = Depends(get_loaders),
+    current_user: Principal = Depends(get_current_user_in_db),
 ):
     """
     현재 사용자의 게임 기록 반환하는 API
     Args:
+        page: cursor, 페이지 크기, 작성 일시 범위, 정렬 방향, 응답 필드, 관련 데이터
+        response: ETag 등 응답 헤더
         db: AsyncSession
+        loaders: 관련 데이터를 모아 읽는 요청 단위 loader
         current_user: 현재 사용자
 
     Returns:
-        현재 사용자가 생성한 기록
+        현재 사용자가 생성한 기록 중 한 페이지와 다음 페이지의 cursor
     """
-    return await get_game_log_in_db(db, user=current_user)
+    game_logs, next_cursor = await get_game_log_in_db(db, user=current_user, page=page)
+    return await game_log_page_response(response, game_logs, next_cursor, page, loaders)
 
 
-@router.get("/list/my/{game_name}", status_code=status.HTTP_200_OK)
+@router.get(
+    "/list/my/{game_name}",
+    status_code=status.HTTP_200_OK,
+    response_model=GameLogPage,
+    dependencies=[
+        Depends(
+            conditional_get(
+                GAMES, GAME_LOGS, private=True, include_tables=INCLUDE_TABLES
+            )
+        )
+    ],
+)
 async def get_game_log_by_user_and_game(
     game_name: str,
+    page: Annotated[GameLogPageParams, Query()],
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_in_db),
+    loaders: Loaders = Depends(get_loaders),
+    current_user: Principal = Depends(get_current_user_in_db),
 ):
     """
     현재 사용자의 특정 게임 기록을 반환하는 API
     Args:
         game_name: 찾고자 하는 게임 이름
+        page: cursor, 페이지 크기, 작성 일시 범위, 정렬 방향, 응답 필드, 관련 데이터
+        response: ETag 등 응답 헤더
         db: AsyncSession
+        loaders: 관련 데이터를 모아 읽는 요청 단위 loader
         current_user: 현재 사용자
 
     Returns:
-        현재 사용자의 특정 게임 기록들
+        현재 사용자의 특정 게임 기록 중 한 페이지와 다음 페이지의 cursor
     """
     game = await is_existing_game(db, game_name)
-    return await get_game_log_in_db(db, user=current_user, game=game)
+    game_logs, next_cursor = await get_game_log_in_db(
+        db, user=current_user, game=game, page=page
+    )
+    return await game_log_page_response(response, game_logs, next_cursor, page, loaders)
 
 
-@router.get("/list/{game_name}", status_code=status.HTTP_200_OK)
-async def get_game_log_by_game(game_name: str, db: AsyncSession = Depends(get_db)):
+@router.get(
+    "/list/{game_name}",
+    status_code=status.HTTP_200_OK,
+    response_model=GameLogPage,
+    dependencies=[
+        Depends(conditional_get(GAMES, GAME_LOGS, include_tables=INCLUDE_TABLES))
+    ],
+)
+async def get_game_log_by_game(
+    game_name: str,
+    page: Annotated[GameLogPageParams, Query()],
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    loaders: Loaders = Depends(get_loaders),
+):
     """
     특정 게임의 기록을 반환하는 API
     Args:
         game_name: 찾고자 하는 게임 이름
+        page: cursor, 페이지 크기, 작성 일시 범위, 정렬 방향, 응답 필드, 관련 데이터
+        response: ETag 등 응답 헤더
         db: AsyncSession
+        loaders: 관련 데이터를 모아 읽는 요청 단위 loader
 
     Returns:
-        찾고자 하는 게임의 기록
+        찾고자 하는 게임의 기록 중 한 페이지와 다음 페이지의 cursor
     """
     game = await is_existing_game(db, game_name)
-    return await get_game_log_in_db(db, game=game)
+    game_logs, next_cursor = await get_game_log_in_db(db, game=game, page=page)
+    return await game_log_page_response(response, game_logs, next_cursor, page, loaders)
+
 
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_all_game_log(
+    export: Annotated[GameLogExportParams, Query()],
+    stream_db: AsyncSession = Depends(get_stream_db),
+    admin_user: Principal = Depends(get_admin_user_in_db),
+) -> ClosingStreamingResponse:
+    """
+    모든 게임 기록을 내려받는 API
+    Args:
+        export: 파일 형식, 작성 일시 범위, 정렬 방향
+        stream_db: 스트리밍이 끝나면 닫히는 AsyncSession
+        admin_user: 현재 관리자
 
-@router.patch("/patch/my/{game_log_id}", status_code=status.HTTP_200_OK)
+    Returns:
+        NDJSON 또는 CSV 로 스트리밍되는 전체 게임 기록
+    """
+    return ClosingStreamingResponse(
+        export_game_log(stream_db, export.format, filters=export),
+        media_type=EXPORT_MEDIA_TYPES[export.format],
+        headers={
+            "Content-Disposition": f"attachment; filename=game_logs.{export.format}"
+        },
+    )
+
+
+@router.get("/export/my", status_code=status.HTTP_200_OK)
+async def export_game_log_by_user(
+    export: Annotated[GameLogExportParams, Query()],
+    stream_db: AsyncSession = Depends(get_stream_db),
+    current_user: Principal = Depends(get_current_user_in_db),
+) -> ClosingStreamingResponse:
+    """
+    현재 사용자의 게임 기록을 내려받는 API
+    Args:
+        export: 파일 형식, 작성 일시 범위, 정렬 방향
+        stream_db: 스트리밍이 끝나면 닫히는 AsyncSession
+        current_user: 현재 사용자
+
+    Returns:
+        NDJSON 또는 CSV 로 스트리밍되는 현재 사용자의 게임 기록
+    """
+    return ClosingStreamingResponse(
+        export_game_log(stream_db, export.format, user=current_user, filters=export),
+        media_type=EXPORT_MEDIA_TYPES[export.format],
+        headers={
+            "Content-Disposition": f"attachment; filename=game_logs.{export.format}"
+        },
+    )
+
+
+@router.get("/export/{game_name}", status_code=status.HTTP_200_OK)
+async def export_game_log_by_game(
+    game_name: str,
+    export: Annotated[GameLogExportParams, Query()],
+    db: AsyncSession = Depends(get_db),
+    stream_db: AsyncSession = Depends(get_stream_db),
+) -> ClosingStreamingResponse:
+    """
+    특정 게임의 기록을 내려받는 API
+    Args:
+        game_name: 찾고자 하는 게임 이름
+        export: 파일 형식, 작성 일시 범위, 정렬 방향
+        db: AsyncSession
+        stream_db: 스트리밍이 끝나면 닫히는 AsyncSession
+
+    Returns:
+        NDJSON 또는 CSV 로 스트리밍되는 특정 게임의 기록
+    """
+    game = await is_existing_game(db, game_name)
+    return ClosingStreamingResponse(
+        export_game_log(stream_db, export.format, game=game, filters=export),
+        media_type=EXPORT_MEDIA_TYPES[export.format],
+        headers={
+            "Content-Disposition": f"attachment; filename=game_logs.{export.format}"
+        },
+    )
+
+
+@router.patch(
+    "/patch/my/{game_log_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=GameLogResponse,
+)
 async def update_game_log(
     game_log_id: int,
     game_log_update: GameLogUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_in_db),
+    redis_db: Redis = Depends(get_redis),
+    current_user: Principal = Depends(get_current_user_in_db),
 ):
     """
     게임 기록을 수정하는 API
@@ -115,6 +390,7 @@ async def update_game_log(
         game_log_id: 수정하고자 하는 게임 id
         game_log_update: 변경하려는 정보
         db: AsyncSession
+        redis_db: redis db
         current_user: 현재 사용자
 
     Returns:
@@ -142,20 +418,79 @@ async def update_game_log(
     if not update_data:
         raise NotAcceptableException()
 
-    return await update_game_log_in_db(db, game_log, update_data)
+    return await update_game_log_in_db(db, redis_db, game_log, update_data)
+
+
+@router.post(
+    "/picture/my/{game_log_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=GameLogResponse,
+    openapi_extra=PICTURE_UPLOAD_OPENAPI,
+)
+async def upload_game_log_picture(
+    game_log_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
+    current_user: Principal = Depends(get_current_user_in_db),
+):
+    """
+    게임 기록에 사진을 올리는 API
+    Args:
+        game_log_id: 사진을 올릴 게임 기록 id
+        request: 올릴 사진을 file 필드에 담은 multipart/form-data 요청
+        db: AsyncSession
+        redis_db: redis db
+        current_user: 현재 사용자
+
+    Returns:
+        사진의 key 가 저장된 게임 기록
+    """
+    game_log = await is_existing_game_log(db, game_log_id)
+    if game_log.user_name != current_user.name:
+        raise ForbiddenException(detail="You are not the owner of this game log")
+
+    # 느린 업로드를 받고 사진을 변환하는 동안 db 연결을 잡고 있지 않도록 트랜잭션 종료
+    await db.rollback()
+    key = await store_picture(request)
+
+    # 사진을 받는 동안 삭제되었을 수 있으므로 다시 읽음
+    game_log = await is_existing_game_log(db, game_log_id)
+    return await update_game_log_in_db(db, redis_db, game_log, {"picture": key})
+
+
+@router.get("/picture/{key}", status_code=status.HTTP_200_OK)
+async def get_game_log_picture(
+    key: Annotated[str, Path(pattern="^[0-9a-f]{64}$")],
+    size: str = "original",
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """
+    게임 기록의 사진을 반환하는 API
+    Args:
+        key: 게임 기록에 저장된 사진의 key
+        size: 사진 크기 (original, thumbnail)
+        if_none_match: 이미 받은 사진의 ETag
+
+    Returns:
+        webp 사진 (Range 요청 지원), 바뀌지 않았으면 304
+    """
+    return picture_response(key, size, if_none_match)
 
 
 @router.delete("/delete/my/{game_log_id}", status_code=status.HTTP_200_OK)
 async def delete_game_log(
     game_log_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user_in_db),
+    redis_db: Redis = Depends(get_redis),
+    current_user: Principal = Depends(get_current_user_in_db),
 ) -> dict[str, str]:
     """
     게임 기록을 삭제하는 함수
     Args:
         game_log_id: 삭제하고자 하는 게임 기록
         db: AsyncSession
+        redis_db: redis db
         current_user: 현재 사용자
 
     Returns:
@@ -164,4 +499,4 @@ async def delete_game_log(
     game_log = await is_existing_game_log(db, game_log_id)
     if game_log.user_name != current_user.name:
         raise ForbiddenException(detail="You are not the owner of this game log")
-    return await delete_game_log_in_db(db, game_log)
+    return await delete_game_log_in_db(db, redis_db, game_log)
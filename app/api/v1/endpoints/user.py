@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends, status, Request
+from fastapi import APIRouter, Depends, status, Request, Query, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
-from typing import List, Any
+from typing import List, Any, Annotated
 
 from app.api.dependencies import get_db, get_redis
 from app.config import settings
@@ -12,15 +12,18 @@ from app.core.exceptions import (
     CredentialsException,
     UnprocessableEntityException,
 )
+from app.core.responses import render_json
 from app.crud.user import (
     create_user_in_db,
-    get_user_in_db,
+    get_user_rows_in_db,
     update_user_in_db,
     soft_delete_user_in_db,
     hard_delete_user_in_db,
 )
+from app.crud.user_game_stats import get_user_game_stats_in_db
 from app.schemas.user import (
     UserResponse,
+    UserGameStatsResponse,
     UserCreate,
     AccessToken,
     UserUpdate,
@@ -29,6 +32,7 @@ from app.schemas.user import (
     PasswordResetConfirm,
     RestoreUserRequest,
     RestoreUserConfirm,
+    Principal,
 )
 from app.core.security import (
     issue_access_token,
@@ -41,8 +45,15 @@ from app.core.security import (
     restore_user,
     get_admin_user_in_db,
 )
-from app.services.user import is_existing_user, is_not_existing_user
+from app.schemas.game import RecommendationParams, SimilarGame
+from app.services.user import (
+    is_existing_user,
+    is_not_existing_user,
+    USER_LIST_ADAPTER,
+)
+from app.services.recommendation import recommend_games
 from app.models.user import User
+from app.models.user_game_stats import UserGameStats
 
 router = APIRouter()
 
@@ -144,24 +155,29 @@ async def request_reset_password(
 
 @router.post("/reset-password/confirm", status_code=status.HTTP_200_OK)
 async def confirm_reset_password(
-    data: PasswordResetConfirm, db: AsyncSession = Depends(get_db)
+    data: PasswordResetConfirm,
+    db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
 ) -> dict[str, str]:
     """
     비밀번호 재설정을 승인하는 API
     Args:
         data: 변경 권한을 가진 토큰과 새로운 비밀번호가 담긴 데이터
         db: AsyncSession
+        redis_db: redis db
 
     Returns:
         변경 완료 메시지
     """
-    return await reset_password(token=data.token, new_password=data.new_password, db=db)
+    return await reset_password(
+        token=data.token, new_password=data.new_password, db=db, redis_db=redis_db
+    )
 
 
 @router.get("/list/me", status_code=status.HTTP_200_OK, response_model=UserResponse)
 async def get_current_user(
-    current_user: User = Depends(get_current_user_in_db),
-) -> User:
+    current_user: Principal = Depends(get_current_user_in_db),
+) -> Principal:
     """
     현재 로그인한 사용자 정보를 반환하는 API
     Args:
@@ -173,6 +189,31 @@ async def get_current_user(
     return current_user
 
 
+@router.get(
+    "/list/me/recommendations",
+    status_code=status.HTTP_200_OK,
+    response_model=List[SimilarGame],
+)
+async def get_recommendations(
+    recommendation: Annotated[RecommendationParams, Query()],
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user_in_db),
+) -> list[dict[str, Any]]:
+    """
+    현재 사용자가 플레이한 게임과 비슷한 게임을 추천하는 API
+    Args:
+        recommendation: 추천할 게임 수
+        db: AsyncSession
+        current_user: 현재 사용자
+
+    Returns:
+        추천 점수가 높은 순으로 정렬된 아직 플레이하지 않은 게임
+    """
+    return await recommend_games(
+        db, user_name=current_user.name, limit=recommendation.limit
+    )
+
+
 # TODO 관리자만 가능한지 테스트 추가해야 함
 @router.get(
     "/list/deactivate",
@@ -180,8 +221,9 @@ async def get_current_user(
     response_model=List[UserResponse],
 )
 async def get_all_deactivate_user(
-    db: AsyncSession = Depends(get_db), admin_user: User = Depends(get_admin_user_in_db)
-) -> Sequence[User]:
+    db: AsyncSession = Depends(get_db),
+    admin_user: Principal = Depends(get_admin_user_in_db),
+) -> Response:
     """
     모든 비활성화된 사용자 정보를 반환 하는 API
     Args:
@@ -191,7 +233,11 @@ async def get_all_deactivate_user(
     Returns:
         db에 있는 모든 비활성화된 사용자의 정보
     """
-    return await get_user_in_db(db, is_deleted=True)
+    return render_json(
+        USER_LIST_ADAPTER,
+        await get_user_rows_in_db(db, is_deleted=True),
+        validate=False,
+    )
 
 
 @router.get(
@@ -211,8 +257,29 @@ async def get_user(user_name: str, db: AsyncSession = Depends(get_db)) -> User:
     return user
 
 
+@router.get(
+    "/list/{user_name}/stats",
+    status_code=status.HTTP_200_OK,
+    response_model=List[UserGameStatsResponse],
+)
+async def get_user_stats(
+    user_name: str, db: AsyncSession = Depends(get_db)
+) -> Sequence[UserGameStats]:
+    """
+    특정 사용자의 게임별 플레이 통계를 반환 하는 API
+    Args:
+        user_name: 사용자의 이름
+        db: AsyncSession
+
+    Returns:
+        게임별 플레이 횟수, 플레이 시간, 평균 인원, 처음/마지막 플레이 일시
+    """
+    user = await is_existing_user(db, name=user_name)
+    return await get_user_game_stats_in_db(db, user_name=user.name)
+
+
 @router.get("/list", status_code=status.HTTP_200_OK, response_model=List[UserResponse])
-async def get_all_user(db: AsyncSession = Depends(get_db)) -> Sequence[User]:
+async def get_all_user(db: AsyncSession = Depends(get_db)) -> Response:
     """
     사용자 전체 정보를 반환 하는 API
     Args:
@@ -221,14 +288,15 @@ async def get_all_user(db: AsyncSession = Depends(get_db)) -> Sequence[User]:
     Returns:
         db에 있는 모든 사용자의 정보
     """
-    return await get_user_in_db(db)
+    return render_json(USER_LIST_ADAPTER, await get_user_rows_in_db(db), validate=False)
 
 
 @router.patch("/patch", status_code=status.HTTP_200_OK, response_model=UserResponse)
 async def update_user(
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_user_in_db),
+    current_user: Principal = Depends(get_current_user_in_db),
     db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
 ) -> User:
     """
     사용자 정보를 수정하는 API
@@ -236,6 +304,7 @@ async def update_user(
         user_update: 갱신할 사용자의 정보
         current_user: 현재 사용자
         db: AsyncSession
+        redis_db: redis db
 
     Returns:
         갱신된 사용자의 정보
@@ -249,14 +318,15 @@ async def update_user(
     else:  # 변경할 이메일이 없을 때
         raise UnprocessableEntityException()
 
-    return await update_user_in_db(db, user=current_user, update_data=update_data)
+    user = await is_existing_user(db, name=current_user.name)
+    return await update_user_in_db(db, redis_db, user=user, update_data=update_data)
 
 
 @router.patch("/deactivate", status_code=status.HTTP_200_OK)
 async def soft_delete_user(
     request: Request,
     redis_db: Redis = Depends(get_redis),
-    current_user: User = Depends(get_current_user_in_db),
+    current_user: Principal = Depends(get_current_user_in_db),
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
     """
@@ -267,7 +337,8 @@ async def soft_delete_user(
         current_user: 현재 사용자
         db: AsyncSession
     """
-    await soft_delete_user_in_db(db, current_user)
+    user = await is_existing_user(db, name=current_user.name)
+    await soft_delete_user_in_db(db, redis_db, user)
     authorization = request.headers.get("Authorization")
     if not authorization or not authorization.startswith("Bearer "):
         raise CredentialsException(detail="Invalid authorization header")
@@ -295,34 +366,40 @@ async def request_restore_user(
 
 @router.post("/restore/confirm", status_code=status.HTTP_200_OK)
 async def confirm_restore_user(
-    data: RestoreUserConfirm, db: AsyncSession = Depends(get_db)
+    data: RestoreUserConfirm,
+    db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
 ) -> dict[str, str]:
     """
     soft delete 되었던 사용자의 복구를 승인하는 API
     Args:
         data: 복구할 사용자의 정보가 담긴 데이터
         db: AsyncSession
+        redis_db: redis db
 
     Returns:
         복구가 완료되었다는 메일 발송 메시지
     """
-    return await restore_user(token=data.token, db=db)
+    return await restore_user(token=data.token, db=db, redis_db=redis_db)
 
 
 # TODO 관리자만 가능한지 테스트 해야 함
 @router.delete("/delete", status_code=status.HTTP_200_OK)
 async def hard_delete_user(
-    db: AsyncSession = Depends(get_db), admin_user: User = Depends(get_admin_user_in_db)
+    db: AsyncSession = Depends(get_db),
+    redis_db: Redis = Depends(get_redis),
+    admin_user: Principal = Depends(get_admin_user_in_db),
 ) -> dict[str, str]:
     """
     hard delete 하는 API
     Args:
         db: AsyncSession
+        redis_db: redis db
         admin_user: 관리자 계정
 
     Returns:
         영구 삭제된 회원 정보의 수를 포함한 메시지
     """
     return await hard_delete_user_in_db(
-        db=db, delete_threshold_day=settings.HARD_DELETE_USER_DAYS
+        db=db, redis_db=redis_db, delete_threshold_day=settings.HARD_DELETE_USER_DAYS
     )
@@ -23,11 +23,34 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
+    DB_POOL_SIZE: int = 5  # worker 마다 유지할 연결 수
+    DB_MAX_OVERFLOW: int = 10  # DB_POOL_SIZE 를 넘어 잠시 더 열 수 있는 연결 수
+    DB_POOL_TIMEOUT: float = 30.0  # 연결이 모두 사용 중일 때 기다릴 최대 시간(초)
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(초)보다 오래된 연결은 다시 맺음
+    DB_POOL_PRE_PING: bool = True  # 연결을 꺼낼 때마다 끊긴 연결인지 확인
+    DB_POOL_WARMUP: int = 5  # 앱 시작 시 미리 맺어 둘 연결 수 (DB_POOL_SIZE 이하)
+    DB_LEAK_THRESHOLD: float = (
+        30.0  # 이 시간(초)보다 오래 반환되지 않은 연결을 로그로 남김
+    )
+    DB_LEAK_CHECK_INTERVAL: float = 10.0  # 반환되지 않은 연결을 확인하는 간격(초)
+
+    # sql log
+    SQL_LOG_ENABLED: bool = False  # False 면 SQL 로그 event 를 등록하지 않음
+    SQL_LOG_SAMPLE_RATE: float = 0.01  # 남길 쿼리의 비율 (느린 쿼리는 항상 남김)
+    SQL_LOG_SLOW_THRESHOLD: float = 0.5  # 이 시간(초) 이상 걸린 쿼리는 경고로 남김
+    SQL_LOG_REDACT_PARAMETERS: bool = True  # 쿼리 인자의 값 대신 타입만 남김
 
     # redis
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_DATABASE: int
+    REDIS_MAX_CONNECTIONS: int = 50  # worker 마다 열어 둘 최대 연결 수
+    REDIS_POOL_TIMEOUT: float = 5.0  # 연결이 모두 사용 중일 때 기다릴 최대 시간(초)
+    REDIS_SOCKET_TIMEOUT: float = 5.0  # 명령 응답을 기다릴 최대 시간(초)
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5.0  # 연결을 맺을 때 기다릴 최대 시간(초)
+    REDIS_HEALTH_CHECK_INTERVAL: int = (
+        30  # 이 시간(초) 동안 쓰지 않은 연결은 PING 으로 확인
+    )
 
     # fastapi
     HARD_DELETE_USER_DAYS: int = 30
@@ -35,6 +58,78 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 10080  # 7일
 
+    # partitioning (PostgreSQL 전용)
+    GAME_LOG_PARTITION_MONTHS_AHEAD: int = 3  # 미리 만들어 둘 미래 파티션 수
+
+    # pagination
+    GAME_LOG_PAGE_SIZE: int = 20  # 기본 페이지 크기
+    GAME_LOG_MAX_PAGE_SIZE: int = 100  # 한 번에 요청할 수 있는 최대 페이지 크기
+
+    # search
+    GAME_LOG_SEARCH_MAX_OFFSET: int = 1000  # 검색 결과에서 건너뛸 수 있는 최대 수
+
+    # bulk
+    GAME_LOG_BULK_MAX_SIZE: int = 100  # 한 번에 생성할 수 있는 최대 게임 기록 수
+
+    # import
+    GAME_LOG_IMPORT_CHUNK_SIZE: int = 5000  # 한 번에 검증하고 적재할 CSV 행 수
+    GAME_LOG_IMPORT_MAX_ERRORS: int = 100  # 응답에 담을 최대 오류 수
+
+    # export
+    GAME_LOG_EXPORT_CHUNK_SIZE: int = 1000  # 서버 측 cursor 에서 한 번에 읽을 행 수
+
+    # leaderboard
+    LEADERBOARD_SIZE: int = 10  # 기본 순위 수
+    LEADERBOARD_MAX_SIZE: int = 100  # 한 번에 요청할 수 있는 최대 순위 수
+
+    # trending
+    TRENDING_WINDOWS: dict[str, int] = {"24h": 24, "7d": 7 * 24, "30d": 30 * 24}
+    TRENDING_HOURLY_MAX_HOURS: int = 48  # 이 시간 이하의 기간은 hour bucket 으로 계산
+    # 기간별로 가중치가 절반이 되는 시간, 0 이면 감쇠 없이 합산
+    TRENDING_HALF_LIFE_HOURS: dict[str, float] = {"24h": 12, "7d": 72, "30d": 240}
+
+    # conditional get
+    LIST_CACHE_MAX_AGE: int = 0  # 목록 응답을 재검증 없이 쓸 수 있는 시간(초)
+
+    # recommendation
+    RECOMMENDATION_TOP_K: int = 20  # 게임마다 저장할 비슷한 게임 수
+    RECOMMENDATION_MIN_COMMON_USERS: int = 1  # 비슷한 게임으로 볼 최소 공통 사용자 수
+    RECOMMENDATION_SIZE: int = 10  # 기본 추천 수
+
+    # pub/sub
+    PUBSUB_RESUBSCRIBE_DELAY: float = (
+        1.0  # 캐시 변경 알림 연결이 끊겼을 때 다시 구독할 간격(초)
+    )
+    PUBSUB_POLL_INTERVAL: float = (
+        1.0  # 알림을 기다리는 최대 시간(초), REDIS_SOCKET_TIMEOUT 보다 짧아야 함
+    )
+
+    # principal cache
+    PRINCIPAL_CACHE_SIZE: int = 10000  # worker 마다 캐시할 토큰 수
+    PRINCIPAL_CACHE_TTL: int = (
+        60  # pub/sub 알림을 놓쳤을 때 토큰을 다시 확인하기까지의 시간(초)
+    )
+
+    # game catalog
+    GAME_CATALOG_TTL: int = (
+        60  # pub/sub 알림을 놓쳤을 때 게임 캐시를 다시 읽기까지의 시간(초)
+    )
+
+    # game index
+    GAME_INDEX_TTL: int = 300  # 다른 worker 의 게임 변경을 반영하기까지의 최대 시간(초)
+    NEAREST_GAME_SIZE: int = 10  # 기본 반환 수
+    NEAREST_GAME_MAX_SIZE: int = 50
+
+    # picture
+    PICTURE_STORAGE_DIR: str = "storage/pictures"  # 사진을 저장할 디렉토리
+    PICTURE_UPLOAD_CHUNK_SIZE: int = 64 * 1024  # 업로드를 한 번에 읽고 쓸 크기
+    PICTURE_MAX_SIZE: int = 10 * 1024 * 1024  # 업로드할 수 있는 최대 크기
+    PICTURE_SIZES: dict[str, int] = {"original": 2048, "thumbnail": 320}  # 긴 변 길이
+    PICTURE_WORKERS: int = 2  # 사진 변환에 사용할 프로세스 수
+    PICTURE_CACHE_MAX_AGE: int = 365 * 24 * 60 * 60  # 사진의 브라우저 캐시 시간(초)
+    # nginx 의 internal location 경로, 설정하면 파일 전송을 nginx(sendfile) 에 맡김
+    PICTURE_ACCEL_REDIRECT_PREFIX: str | None = None
+
     # mail
     ADMIN_MAIL: str
     ADMIN_PWD: str
@@ -0,0 +1,26 @@
+import logging
+from typing import Any, Awaitable
+
+from redis.exceptions import RedisError
+
+"""
+- db 커밋 뒤에 실행하는 redis 갱신 (목록 버전, 순위표, 인기 게임, 캐시 변경 알림)
+- 이미 커밋된 요청이 redis 오류로 500 을 반환하면 클라이언트가 다시 보내 중복 기록이 생기므로
+  redis 오류는 로그만 남기고 넘어감
+- 어긋난 순위표는 tools/rebuild_leaderboards.py 로, 버전과 캐시는 다음 변경 때 다시 맞춰짐
+"""
+logger = logging.getLogger(__name__)
+
+
+async def run_after_commit(*steps: Awaitable[Any]) -> None:
+    """
+    커밋 뒤의 redis 갱신을 차례로 실행하는 함수
+    하나가 실패해도 나머지는 실행함
+    Args:
+        steps: 실행할 redis 갱신
+    """
+    for step in steps:
+        try:
+            await step
+        except RedisError:
+            logger.exception("Redis update after commit failed")
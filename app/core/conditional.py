@@ -0,0 +1,115 @@
+import hashlib
+from typing import Callable, Mapping
+
+from fastapi import Depends, Request, Response
+from redis.asyncio import Redis
+
+from app.api.dependencies import get_redis
+from app.config import settings
+from app.core.exceptions import NotModifiedException
+from app.core.security import get_current_user_in_db
+from app.crud.version import get_versions_in_redis
+from app.schemas.user import Principal
+
+"""
+- 자주 polling 되는 목록 API 의 조건부 GET 처리
+- ETag 는 관련 테이블의 버전 카운터와 요청 경로, query 로 만들어 db 를 읽지 않고 계산
+- If-None-Match 가 일치하면 endpoint 를 실행하기 전에 304 로 응답
+- include query 로 관련 데이터를 함께 받으면 그 테이블의 버전도 ETag 에 포함
+"""
+
+
+def is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match 에 현재 ETag 가 포함되어 있는지 확인하는 함수 (weak 비교)
+    Args:
+        if_none_match: 요청의 If-None-Match 헤더
+        etag: 현재 응답의 ETag
+
+    Returns:
+        포함 여부
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+async def _check_not_modified(
+    request: Request,
+    response: Response,
+    redis_db: Redis,
+    tables: tuple[str, ...],
+    user_name: str | None = None,
+) -> None:
+    versions = await get_versions_in_redis(redis_db, tables)
+    source = f"{request.url.path}?{request.url.query}|{user_name}|{versions}"
+    etag = f'W/"{hashlib.sha1(source.encode()).hexdigest()[:20]}"'
+
+    scope = "private" if user_name else "public"
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"{scope}, max-age={settings.LIST_CACHE_MAX_AGE}, "
+        "must-revalidate",
+    }
+    if user_name:
+        headers["Vary"] = "Authorization"
+
+    if is_not_modified(request.headers.get("If-None-Match"), etag):
+        raise NotModifiedException(headers=headers)
+    response.headers.update(headers)
+
+
+def _included_tables(
+    request: Request, tables: tuple[str, ...], include_tables: Mapping[str, str]
+) -> tuple[str, ...]:
+    """기본 테이블에 include query 로 요청한 관련 데이터의 테이블을 더한 테이블 이름"""
+    names = {
+        name.strip() for name in request.query_params.get("include", "").split(",")
+    }
+    extra = [include_tables[name] for name in include_tables if name in names]
+    return tuple(dict.fromkeys((*tables, *extra)))
+
+
+def conditional_get(
+    *tables: str,
+    private: bool = False,
+    include_tables: Mapping[str, str] | None = None,
+) -> Callable:
+    """
+    테이블 버전으로 ETag 를 붙이고 바뀌지 않았으면 304 로 응답하는 의존성을 만드는 함수
+    Args:
+        tables: 응답 내용이 의존하는 테이블 이름
+        private: 현재 사용자의 데이터를 반환하는 API 인지 여부 (사용자별 ETag)
+        include_tables: include query 의 관련 데이터 이름을 key 로 하는 테이블 이름
+
+    Returns:
+        route 의 dependencies 에 넣을 의존성
+    """
+    include_tables = include_tables or {}
+
+    async def check_public(
+        request: Request, response: Response, redis_db: Redis = Depends(get_redis)
+    ) -> None:
+        await _check_not_modified(
+            request,
+            response,
+            redis_db,
+            _included_tables(request, tables, include_tables),
+        )
+
+    async def check_private(
+        request: Request,
+        response: Response,
+        redis_db: Redis = Depends(get_redis),
+        current_user: Principal = Depends(get_current_user_in_db),
+    ) -> None:
+        await _check_not_modified(
+            request,
+            response,
+            redis_db,
+            _included_tables(request, tables, include_tables),
+            user_name=current_user.name,
+        )
+
+    return check_private if private else check_public
@@ -1,6 +1,13 @@
 from fastapi import HTTPException, status
 
 
+class NotModifiedException(HTTPException):
+    """HTTP_304_NOT_MODIFIED"""
+
+    def __init__(self, headers=None):
+        super().__init__(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
 class BadRequestException(HTTPException):
     """HTTP_400_BAD_REQUEST"""
 
@@ -53,6 +60,15 @@ class ConflictException(HTTPException):
         super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
 
 
+class ContentTooLargeException(HTTPException):
+    """HTTP_413_REQUEST_ENTITY_TOO_LARGE"""
+
+    def __init__(self, detail="Content too large"):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail
+        )
+
+
 class UnprocessableEntityException(HTTPException):
     """HTTP_422_UNPROCESSABLE_ENTITY"""
 
@@ -0,0 +1,82 @@
+import time
+from typing import Iterable
+
+from redis.asyncio import Redis
+
+from app.config import settings
+from app.core.game_index import mark_game_index_dirty
+from app.schemas.game import GameRow
+
+"""
+- 자주 바뀌지 않는 게임 목록을 worker 마다 소문자 이름을 key 로 캐시
+- 게임이 바뀌면 이 worker 의 캐시를 바로 비우고, redis pub/sub 으로 다른 worker 에 알림
+- 알림을 놓치더라도 GAME_CATALOG_TTL 이 지나면 다시 읽음
+"""
+GAME_CATALOG_CHANNEL = "game_catalog:changed"
+
+_catalog: dict[str, GameRow] | None = None
+_loaded_at = 0.0
+# 캐시를 비울 때마다 증가 (db 를 읽는 동안 바뀐 게임 목록을 캐시하지 않기 위해 사용)
+_generation = 0
+
+
+def invalidate_game_catalog() -> None:
+    """이 worker 의 게임 캐시와 비슷한 게임 index 를 비우는 함수"""
+    global _catalog, _generation
+    _catalog = None
+    _generation += 1
+    mark_game_index_dirty()
+
+
+def game_catalog_generation() -> int:
+    """db 에서 게임 목록을 읽기 전의 캐시 세대를 반환하는 함수"""
+    return _generation
+
+
+def get_game_catalog() -> dict[str, GameRow] | None:
+    """
+    사용할 수 있는 게임 캐시를 반환하는 함수
+    Returns:
+        소문자 이름을 key 로 하는 게임, 다시 읽어야 하면 None
+    """
+    if _catalog is None or time.monotonic() - _loaded_at > settings.GAME_CATALOG_TTL:
+        return None
+    return _catalog
+
+
+def set_game_catalog(games: Iterable[GameRow], generation: int) -> dict[str, GameRow]:
+    """
+    db 에서 읽은 게임 목록으로 캐시를 채우는 함수
+    읽는 동안 캐시가 비워졌다면 읽은 목록을 반환만 하고 캐시하지 않음
+    Args:
+        games: 전체 게임
+        generation: 게임 목록을 읽기 전의 game_catalog_generation()
+
+    Returns:
+        소문자 이름을 key 로 하는 게임
+    """
+    global _catalog, _loaded_at
+    catalog = {game.name.lower(): game for game in games}
+    if generation == _generation:
+        _catalog, _loaded_at = catalog, time.monotonic()
+    return catalog
+
+
+async def publish_game_catalog_change_in_redis(redis_db: Redis, game_name: str) -> None:
+    """
+    게임이 바뀌었음을 이 worker 에 반영하고 다른 worker 에 알리는 함수 (db 커밋 뒤에 호출)
+    Args:
+        redis_db: redis db
+        game_name: 바뀐 게임 이름
+    """
+    invalidate_game_catalog()
+    await redis_db.publish(GAME_CATALOG_CHANNEL, game_name)
+
+
+def handle_game_catalog_message(game_name: str | None) -> None:
+    """
+    다른 worker 의 게임 변경 알림을 받아 캐시를 비우는 함수 (app.core.pubsub 에서 호출)
+    Args:
+        game_name: 바뀐 게임 이름, 다시 구독했을 때는 None
+    """
+    invalidate_game_catalog()
@@ -0,0 +1,133 @@
+import time
+from typing import Any, Sequence
+
+import numpy as np
+
+from app.config import settings
+
+"""
+- 게임 목록의 속성(weight, 최소/최대 인원, 평균 플레이 시간)을 worker 마다 numpy 배열로 보관
+- 비슷한 게임은 배열 전체에 대한 벡터 연산 한 번으로 찾음
+- 게임이 바뀌면 게임 캐시와 함께 비워 다음 조회 때 다시 만들고 (app.core.game_catalog),
+  알림을 놓친 경우에도 GAME_INDEX_TTL 이 지나면 반영됨
+"""
+
+
+class GameIndex:
+    def __init__(self, rows: Sequence[Any]):
+        """
+        게임 속성으로 index 를 만드는 함수
+        Args:
+            rows: name, weight, min_possible_num, max_possible_num, avg_during_time 을 가진 row
+        """
+        self.built_at = time.monotonic()
+        self.names = [row.name for row in rows]
+        self.positions = {name: position for position, name in enumerate(self.names)}
+        self.min_nums = np.array([row.min_possible_num for row in rows], dtype=np.int32)
+        self.max_nums = np.array([row.max_possible_num for row in rows], dtype=np.int32)
+
+        features = np.array(
+            [
+                [
+                    row.weight,
+                    row.min_possible_num,
+                    row.max_possible_num,
+                    np.nan if row.avg_during_time is None else row.avg_during_time,
+                ]
+                for row in rows
+            ],
+            dtype=np.float64,
+        ).reshape(len(rows), 4)
+
+        # 기록이 없는 게임의 플레이 시간은 평균으로 채우고, 속성마다 단위가 다르므로 표준화
+        # (모든 게임에 기록이 없는 속성은 0 으로 채움)
+        if len(rows):
+            has_values = ~np.isnan(features).all(axis=0)
+            means = np.zeros(features.shape[1])
+            means[has_values] = np.nanmean(features[:, has_values], axis=0)
+            features = np.where(np.isnan(features), means, features)
+            stds = features.std(axis=0)
+            features = (features - features.mean(axis=0)) / np.where(stds, stds, 1)
+        self.features = features.astype(np.float32)
+
+    def nearest(
+        self, name: str, participant_num: int | None, limit: int
+    ) -> list[tuple[str, float]]:
+        """
+        주어진 게임과 속성이 가장 가까운 게임을 반환하는 함수
+        Args:
+            name: 기준 게임 이름
+            participant_num: 이 인원으로 플레이할 수 있는 게임만 찾을 때의 인원
+            limit: 반환할 게임 수
+
+        Returns:
+            거리가 가까운 순으로 정렬된 (게임 이름, 거리)
+        """
+        position = self.positions.get(name)
+        if position is None:
+            return []
+
+        distances = np.sqrt(
+            ((self.features - self.features[position]) ** 2).sum(axis=1)
+        )
+        candidates = np.ones(len(self.names), dtype=bool)
+        candidates[position] = False
+        if participant_num is not None:
+            candidates &= (self.min_nums <= participant_num) & (
+                participant_num <= self.max_nums
+            )
+
+        indexes = np.flatnonzero(candidates)
+        if len(indexes) > limit:
+            indexes = indexes[np.argpartition(distances[indexes], limit)[:limit]]
+        indexes = indexes[np.argsort(distances[indexes], kind="stable")]
+        return [(self.names[index], float(distances[index])) for index in indexes]
+
+
+_game_index: GameIndex | None = None
+# index 를 비울 때마다 증가 (db 를 읽는 동안 바뀐 게임 목록으로 index 를 만들지 않기 위해 사용)
+_generation = 0
+
+
+def mark_game_index_dirty() -> None:
+    """게임 목록이 바뀌어 다음 조회 때 index 를 다시 만들어야 함을 표시하는 함수"""
+    global _game_index, _generation
+    _game_index = None
+    _generation += 1
+
+
+def game_index_generation() -> int:
+    """db 에서 게임 속성을 읽기 전의 index 세대를 반환하는 함수"""
+    return _generation
+
+
+def get_game_index() -> GameIndex | None:
+    """
+    사용할 수 있는 index 를 반환하는 함수
+    Returns:
+        최신 index, 다시 만들어야 하면 None
+    """
+    if (
+        _game_index is None
+        or time.monotonic() - _game_index.built_at > settings.GAME_INDEX_TTL
+    ):
+        return None
+    return _game_index
+
+
+def set_game_index(rows: Sequence[Any], generation: int) -> GameIndex:
+    """
+    게임 속성으로 index 를 다시 만들어 저장하는 함수
+    읽는 동안 index 가 비워졌다면 만든 index 를 반환만 하고 저장하지 않음
+    Args:
+        rows: name, weight, min_possible_num, max_possible_num, avg_during_time 을 가진 row
+        generation: 게임 속성을 읽기 전의 game_index_generation()
+
+    Returns:
+        새 index
+    """
+    global _game_index
+    game_index = GameIndex(rows)
+    if generation == _generation:
+        _game_index = game_index
+    return game_index
@@ -0,0 +1,43 @@
+import os
+
+from PIL import Image, ImageOps
+
+"""
+- ProcessPoolExecutor 의 worker 에서 실행되는 사진 변환 함수
+- worker 가 가볍게 import 할 수 있도록 Pillow 외의 app 모듈은 사용하지 않음
+"""
+PICTURE_FORMAT = "webp"
+
+
+def make_picture_variants(source: str, target_dir: str, sizes: dict[str, int]) -> None:
+    """
+    원본 사진을 크기별로 줄여 webp 로 저장하는 함수
+    EXIF 회전을 반영하고 메타데이터는 저장하지 않음
+    Args:
+        source: 업로드된 원본 파일 경로
+        target_dir: 변환한 사진을 저장할 디렉토리
+        sizes: 크기 이름을 key 로 하는 긴 변의 최대 길이
+
+    Raises:
+        ValueError: 사진이 아니거나 읽을 수 없을 때
+    """
+    try:
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            image.load()
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError(str(e)) from e
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    os.makedirs(target_dir, exist_ok=True)
+    for name, max_size in sizes.items():
+        variant = image.copy()
+        variant.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
+        # 같은 사진을 동시에 올려도 완성된 파일만 보이도록 임시 파일에 쓰고 교체
+        path = os.path.join(target_dir, f"{name}.{PICTURE_FORMAT}")
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        variant.save(temp_path, format=PICTURE_FORMAT, quality=85)
+        os.replace(temp_path, path)
@@ -0,0 +1,94 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, Mapping, TypeVar
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_db
+from app.crud.game import get_games_by_names_in_db
+from app.crud.user import get_users_by_names_in_db
+
+"""
+- 목록에 딸린 게임, 사용자처럼 key 로 읽는 관련 데이터를 요청 단위로 모아 읽는 loader (DataLoader 방식)
+- 같은 event loop 차례에 요청된 key 는 하나의 IN 쿼리로 읽고, 읽은 값은 요청이 끝날 때까지 재사용
+- get_loaders 의존성은 요청마다 한 번만 만들어지므로 endpoint 와 다른 의존성이 같은 loader 를 공유
+"""
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    def __init__(self, batch_load: Callable[[list[K]], Awaitable[Mapping[K, V]]]):
+        """
+        key 로 읽는 요청을 모아 batch_load 한 번으로 읽는 loader 를 만드는 함수
+        Args:
+            batch_load: key 목록을 받아 key 별 값을 반환하는 함수 (없는 key 는 생략)
+        """
+        self._batch_load = batch_load
+        self._futures: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        self._dispatch_task: asyncio.Task | None = None
+
+    def load(self, key: K) -> Awaitable[V | None]:
+        """
+        key 의 값을 읽도록 예약하는 함수
+        Args:
+            key: 읽을 key
+
+        Returns:
+            값(없으면 None)을 반환하는 awaitable
+        """
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                # 지금 차례에 들어오는 key 를 모두 모은 뒤 한 번에 읽음
+                self._dispatch_task = loop.create_task(self._dispatch())
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> dict[K, V | None]:
+        """
+        여러 key 의 값을 한 번의 batch 로 읽는 함수
+        Args:
+            keys: 읽을 key (중복 허용)
+
+        Returns:
+            key 별 값 (없으면 None)
+        """
+        keys = list(dict.fromkeys(keys))
+        values = await asyncio.gather(*(self.load(key) for key in keys))
+        return dict(zip(keys, values))
+
+    async def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        try:
+            values = await self._batch_load(keys)
+        except Exception as e:
+            for key in keys:
+                # 실패한 key 는 다음 load 때 다시 읽음
+                self._futures.pop(key).set_exception(e)
+            return
+        for key in keys:
+            self._futures[key].set_result(values.get(key))
+
+
+class Loaders:
+    def __init__(self, db: AsyncSession):
+        """
+        요청 하나에서 쓰는 관련 데이터 loader 모음
+        Args:
+            db: 요청의 AsyncSession
+        """
+        self.games: BatchLoader = BatchLoader(
+            lambda names: get_games_by_names_in_db(db, names)
+        )
+        self.users: BatchLoader = BatchLoader(
+            lambda names: get_users_by_names_in_db(db, names)
+        )
+
+
+def get_loaders(db: AsyncSession = Depends(get_db)) -> Loaders:
+    """요청 단위 loader 를 반환하는 의존성"""
+    return Loaders(db)
@@ -0,0 +1,36 @@
+import base64
+import json
+from datetime import datetime
+
+from app.core.exceptions import BadRequestException
+
+
+def encode_cursor(date: datetime, game_log_id: int) -> str:
+    """
+    마지막으로 반환한 기록의 (date, id)를 불투명한 cursor 문자열로 만드는 함수
+    Args:
+        date: 마지막 기록의 작성 일시
+        game_log_id: 마지막 기록의 id
+
+    Returns:
+        url-safe base64 로 인코딩된 cursor
+    """
+    raw = json.dumps([date.isoformat(), game_log_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    cursor 문자열을 (date, id)로 복원하는 함수
+    Args:
+        cursor: encode_cursor 로 만든 cursor
+
+    Returns:
+        마지막 기록의 작성 일시, 마지막 기록의 id
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date, game_log_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(date), int(game_log_id)
+    except (ValueError, TypeError):
+        raise BadRequestException(detail="Invalid cursor")
@@ -0,0 +1,112 @@
+import time
+from collections import OrderedDict
+
+from redis.asyncio import Redis
+
+from app.config import settings
+from app.schemas.user import Principal
+
+"""
+- 확인을 마친 토큰의 사용자를 worker 마다 LRU 로 캐시하여, 같은 토큰의 요청은 redis, db 를 거치지 않고 인증
+- 로그아웃, 사용자 정보 수정, 탈퇴 시 이 worker 에서 그 사용자의 토큰을 바로 비우고, redis pub/sub 으로 다른 worker 에 알림
+- 알림을 놓치더라도 PRINCIPAL_CACHE_TTL 과 토큰 만료 시각 중 이른 때가 지나면 다시 확인
+"""
+PRINCIPAL_CHANNEL = "principal:changed"
+
+# 토큰: (사용자, 만료 시각(monotonic)), 오래 쓰지 않은 토큰이 앞쪽
+_principals: OrderedDict[str, tuple[Principal, float]] = OrderedDict()
+_tokens_by_user: dict[str, set[str]] = {}
+# 캐시를 비울 때마다 증가 (토큰을 확인하는 동안 비워진 사용자를 캐시하지 않기 위해 사용)
+_generation = 0
+
+
+def _evict(token: str) -> None:
+    principal, _ = _principals.pop(token)
+    tokens = _tokens_by_user[principal.name]
+    tokens.discard(token)
+    if not tokens:
+        del _tokens_by_user[principal.name]
+
+
+def principal_cache_generation() -> int:
+    """토큰을 확인하기 전의 캐시 세대를 반환하는 함수"""
+    return _generation
+
+
+def get_cached_principal(token: str) -> Principal | None:
+    """
+    캐시된 토큰의 사용자를 반환하는 함수
+    Args:
+        token: access token
+
+    Returns:
+        토큰의 사용자, 다시 확인해야 하면 None
+    """
+    entry = _principals.get(token)
+    if entry is None:
+        return None
+    if time.monotonic() >= entry[1]:
+        _evict(token)
+        return None
+    _principals.move_to_end(token)
+    return entry[0]
+
+
+def cache_principal(
+    token: str, principal: Principal, token_exp: float, generation: int
+) -> None:
+    """
+    확인을 마친 토큰의 사용자를 캐시하는 함수
+    확인하는 동안 캐시가 비워졌다면 캐시하지 않음
+    Args:
+        token: access token
+        principal: 토큰의 사용자
+        token_exp: 토큰 만료 시각 (timestamp)
+        generation: 토큰을 확인하기 전의 principal_cache_generation()
+    """
+    ttl = min(settings.PRINCIPAL_CACHE_TTL, token_exp - time.time())
+    if generation != _generation or ttl <= 0:
+        return
+
+    if token in _principals:
+        _evict(token)
+    _principals[token] = (principal, time.monotonic() + ttl)
+    _tokens_by_user.setdefault(principal.name, set()).add(token)
+    while len(_principals) > settings.PRINCIPAL_CACHE_SIZE:
+        _evict(next(iter(_principals)))
+
+
+def invalidate_principals(user_name: str | None = None) -> None:
+    """
+    이 worker 에 캐시된 토큰을 비우는 함수
+    Args:
+        user_name: 토큰을 비울 사용자, None 이면 전부 비움
+    """
+    global _generation
+    _generation += 1
+    if user_name is None:
+        _principals.clear()
+        _tokens_by_user.clear()
+        return
+    for token in _tokens_by_user.pop(user_name, ()):
+        del _principals[token]
+
+
+async def publish_principal_change_in_redis(redis_db: Redis, user_name: str) -> None:
+    """
+    사용자의 토큰을 이 worker 에서 비우고 다른 worker 에 알리는 함수 (db 커밋 뒤에 호출)
+    Args:
+        redis_db: redis db
+        user_name: 바뀐 사용자 이름
+    """
+    invalidate_principals(user_name)
+    await redis_db.publish(PRINCIPAL_CHANNEL, user_name)
+
+
+def handle_principal_message(user_name: str | None) -> None:
+    """
+    다른 worker 의 사용자 변경 알림을 받아 캐시를 비우는 함수 (app.core.pubsub 에서 호출)
+    Args:
+        user_name: 바뀐 사용자 이름, 다시 구독했을 때는 None
+    """
+    invalidate_principals(user_name)
@@ -0,0 +1,34 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from app.config import settings
+
+"""
+- 사진 변환처럼 CPU 를 오래 쓰는 작업을 이벤트 루프 밖의 프로세스에서 실행
+- 처음 사용할 때 만들고, 앱이 종료될 때(lifespan) 정리
+- 스레드가 있는 프로세스를 fork 하지 않도록 spawn 으로 worker 를 생성
+"""
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    공용 ProcessPoolExecutor 를 반환하는 함수
+    Returns:
+        ProcessPoolExecutor
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.PICTURE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """실행 중인 작업을 마친 뒤 공용 ProcessPoolExecutor 를 종료하는 함수"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True)
+        _process_pool = None
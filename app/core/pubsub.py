@@ -0,0 +1,53 @@
+import asyncio
+import logging
+from typing import Callable, Mapping
+
+from redis.asyncio import Redis
+
+from app.config import settings
+from app.core.game_catalog import GAME_CATALOG_CHANNEL, handle_game_catalog_message
+from app.core.principal_cache import PRINCIPAL_CHANNEL, handle_principal_message
+
+"""
+- worker 마다 가진 캐시를 다른 worker 의 변경 알림으로 비우기 위한 redis pub/sub 구독
+- 하나의 연결로 모든 채널을 구독하고, 채널마다 등록된 handler 에 알림 내용을 전달
+- (재)구독하기 전의 알림은 받을 수 없으므로 구독할 때마다 handler 에 None 을 전달하여 전부 비움
+"""
+INVALIDATION_HANDLERS: dict[str, Callable[[str | None], None]] = {
+    GAME_CATALOG_CHANNEL: handle_game_catalog_message,
+    PRINCIPAL_CHANNEL: handle_principal_message,
+}
+
+logger = logging.getLogger(__name__)
+
+
+async def listen_invalidations(
+    redis_db: Redis,
+    handlers: Mapping[str, Callable[[str | None], None]] = INVALIDATION_HANDLERS,
+) -> None:
+    """
+    캐시 변경 알림을 받아 채널별 handler 를 호출하는 함수
+    앱이 실행되는 동안 task 로 실행하며, 연결이 끊기면 다시 구독
+    Args:
+        redis_db: redis db
+        handlers: 채널 이름을 key 로 하는 handler
+    """
+    while True:
+        try:
+            async with redis_db.pubsub() as pubsub:
+                await pubsub.subscribe(*handlers)
+                for handler in handlers.values():
+                    handler(None)
+                while True:
+                    # 응답을 무한정 기다리면 REDIS_SOCKET_TIMEOUT 에 걸리므로 짧게 나누어 기다림
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=settings.PUBSUB_POLL_INTERVAL,
+                    )
+                    if message and message["type"] == "message":
+                        handlers[message["channel"]](message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("cache invalidation subscription failed, retrying")
+            await asyncio.sleep(settings.PUBSUB_RESUBSCRIBE_DELAY)
@@ -0,0 +1,54 @@
+import uuid
+from contextvars import ContextVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+"""
+- 요청마다 id 를 정해 로그(SQL 로그 등)에서 같은 요청의 기록을 묶을 수 있게 함
+- 요청에 X-Request-ID 헤더가 있으면 그 값을, 없으면 새로 만든 값을 사용하고 응답 헤더로 돌려줌
+"""
+REQUEST_ID_HEADER = "x-request-id"
+MAX_REQUEST_ID_LENGTH = 64
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+class RequestIdMiddleware:
+    def __init__(self, app: ASGIApp):
+        """
+        요청 id 를 정하는 ASGI middleware
+        Args:
+            app: 감쌀 ASGI 앱
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = (
+            next(
+                (
+                    value.decode("latin-1")
+                    for name, value in scope["headers"]
+                    if name == REQUEST_ID_HEADER.encode()
+                ),
+                "",
+            )[:MAX_REQUEST_ID_LENGTH]
+            or uuid.uuid4().hex
+        )
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (REQUEST_ID_HEADER.encode(), request_id.encode("latin-1")),
+                ]
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
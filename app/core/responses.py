@@ -0,0 +1,53 @@
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from starlette.types import Receive, Scope, Send
+
+"""
+- 목록 응답을 jsonable_encoder 를 거치지 않고 TypeAdapter 로 바로 JSON bytes 로 만듦
+- TypeAdapter 는 만드는 비용이 크므로 응답 스키마마다 모듈 수준에서 한 번만 생성
+"""
+
+
+def render_json(
+    adapter: TypeAdapter,
+    content: Any,
+    response: Response | None = None,
+    validate: bool = True,
+    exclude_unset: bool = False,
+) -> Response:
+    """
+    응답 내용을 JSON 응답으로 만드는 함수
+    Args:
+        adapter: 응답 스키마의 TypeAdapter
+        content: 응답 내용 (ORM 객체처럼 속성으로 값을 읽는 객체 포함)
+        response: 의존성에서 설정한 헤더(ETag 등)를 가진 응답
+        validate: False 면 content 가 이미 스키마의 타입이라 보고 검증 없이 직렬화
+        exclude_unset: 값이 주어지지 않은 필드를 응답에서 제외할지 여부
+
+    Returns:
+        JSON 응답
+    """
+    if validate:
+        content = adapter.validate_python(content, from_attributes=True)
+    body = adapter.dump_json(content, exclude_unset=exclude_unset)
+    headers = response.headers if response else None
+    return Response(body, media_type="application/json", headers=headers)
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    전송이 끝나거나 중간에 연결이 끊겨도 본문 generator 를 닫는 StreamingResponse
+    generator 의 finally 에서 db 세션 같은 자원을 바로 정리할 수 있음
+    (연결이 끊기면 background task 가 실행되지 않을 수 있고, generator 는 GC 될 때까지 남음)
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            aclose = getattr(self.body_iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
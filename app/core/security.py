@@ -8,9 +8,20 @@ from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 
-from app.models.user import User
+from app.schemas.user import Principal
 from app.config import settings
+from app.core.after_commit import run_after_commit
 from app.core.exceptions import CredentialsException, ForbiddenException
+from app.core.principal_cache import (
+    get_cached_principal,
+    cache_principal,
+    principal_cache_generation,
+    publish_principal_change_in_redis,
+)
+from app.crud.leaderboard import (
+    get_leaderboard_tally_in_db,
+    add_players_to_leaderboard_in_redis,
+)
 from app.api.dependencies import get_db, get_redis
 
 # token 부분만 추출
@@ -143,7 +154,7 @@ async def reissue_access_token(refresh_token: str, redis_db: Redis) -> dict[str,
 
 async def delete_token(redis_db: Redis, token: str) -> dict[str, str]:
     """
-    액세스 토큰을 무효화하고, 리프레시 토큰을 삭제하는 함수
+    액세스 토큰을 무효화하고, 리프레시 토큰과 인증 캐시를 삭제하는 함수
     Args:
         redis_db: redis db
         token:
@@ -157,6 +168,8 @@ async def delete_token(redis_db: Redis, token: str) -> dict[str, str]:
     remaining_time = exp - datetime.now(timezone.utc).timestamp()
     if remaining_time > 0:
         await redis_db.setex(f"blacklist:{token}", int(remaining_time), "true")
+    # 커밋할 db 변경이 없으므로 다른 redis 명령처럼 바로 알리고, 실패하면 오류를 그대로 올림
+    await publish_principal_change_in_redis(redis_db, username)
 
     return {"message": "Successfully logged out"}
 
@@ -180,7 +193,7 @@ async def send_reset_password_email(name: str, email: str) -> dict[str, str]:
 
 
 async def reset_password(
-    token: str, new_password: str, db: AsyncSession
+    token: str, new_password: str, db: AsyncSession, redis_db: Redis
 ) -> dict[str, str]:
     """
     비밀번호를 재설정하는 함수
@@ -188,6 +201,7 @@ async def reset_password(
         token: reset token
         new_password: 새로운 비밀번호
         db: AsyncSession
+        redis_db: redis db
 
     Returns:
         비밀번호가 재설정되었다는 메시지
@@ -202,7 +216,9 @@ async def reset_password(
     if not user:
         raise CredentialsException()
     update_data = {"password": pwd_context.hash(new_password)}
-    await update_user_in_db(db=db, user=user, update_data=update_data)
+    await update_user_in_db(
+        db=db, redis_db=redis_db, user=user, update_data=update_data
+    )
 
     return {"message": "Password has been reset"}
 
@@ -225,12 +241,13 @@ async def send_restore_email(name: str, email: str) -> dict[str, str]:
     return {"message": "Restore email sent"}
 
 
-async def restore_user(token: str, db: AsyncSession) -> dict[str, str]:
+async def restore_user(token: str, db: AsyncSession, redis_db: Redis) -> dict[str, str]:
     """
     휴면 사용자를 복구하는 함수
     Args:
         token: restore token
         db: AsyncSession
+        redis_db: redis db
 
     Returns:
         사용자가 복구되었다는 메시지
@@ -241,11 +258,16 @@ async def restore_user(token: str, db: AsyncSession) -> dict[str, str]:
     )  # 순환 참조를 막기 위한 지연 참조
 
     username, _ = await decode_token(token)
-    user = await get_user_in_db(db=db, name=username)
+    user = await get_user_in_db(db=db, name=username, is_deleted=True)
     if not user:
         raise CredentialsException()
     update_data = {"is_deleted": False, "deleted_at": None}
-    await update_user_in_db(db=db, user=user, update_data=update_data)
+    await update_user_in_db(
+        db=db, redis_db=redis_db, user=user, update_data=update_data
+    )
+    # 휴면 동안 빠졌던 사용자 순위에 다시 넣음
+    tally = await get_leaderboard_tally_in_db(db, [username])
+    await run_after_commit(add_players_to_leaderboard_in_redis(redis_db, tally))
 
     return {"message": f"{username} has been restored"}
 
@@ -255,9 +277,10 @@ async def get_current_user_in_db(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
     redis_db: Redis = Depends(get_redis),
-) -> User:
+) -> Principal:
     """
     토큰값을 사용하여 현재 사용자 정보를 반환하는 함수
+    이미 확인한 토큰은 worker 의 인증 캐시에서 찾고, 처음 보는 토큰만 redis, db 에서 확인
     Args:
         token: 헤더에 저장된 토큰값
         db: AsyncSession
@@ -266,25 +289,31 @@ async def get_current_user_in_db(
     Returns:
         현재 사용자의 정보
     """
-    from app.crud.user import get_user_in_db  # 순환 참조를 막기 위한 지연 참조
+    from app.crud.user import get_principal_in_db  # 순환 참조를 막기 위한 지연 참조
+
+    principal = get_cached_principal(token)
+    if principal is not None:
+        return principal
+    generation = principal_cache_generation()
 
     # 이미 무효화 된 토큰인지 확인
     if await redis_db.get(f"blacklist:{token}"):
         raise CredentialsException("Token has been revoked")
 
     # 토큰을 복호화하여 토큰에 담겨 있는 사용자명을 얻기 위함
-    username, _ = await decode_token(
+    username, exp = await decode_token(
         token=token, detail="Invalid authentication credentials: username not found"
     )
-    user = await get_user_in_db(db, name=username)
-    if user is None:
+    principal = await get_principal_in_db(db, name=username)
+    if principal is None:
         raise CredentialsException()
-    return user
+    cache_principal(token, principal, token_exp=exp, generation=generation)
+    return principal
 
 
 async def get_admin_user_in_db(
-    current_user: User = Depends(get_current_user_in_db),
-) -> User:
+    current_user: Principal = Depends(get_current_user_in_db),
+) -> Principal:
     """
     관리자 계정을 불러오는 함수
     Args:
@@ -1,18 +1,28 @@
-from typing import Any
+from typing import Any, Iterable
 
-from sqlalchemy import Sequence
+from redis.asyncio import Redis
+from sqlalchemy import Sequence, Row, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.core.after_commit import run_after_commit
+from app.core.game_catalog import publish_game_catalog_change_in_redis
 from app.models.game import Game
-from app.schemas.game import GameCreate
+from app.models.user_game_stats import UserGameStats
+from app.schemas.game import GameCreate, GameRow
+from app.crud.leaderboard import delete_game_from_leaderboard_in_redis
+from app.crud.trending import delete_game_from_trending_in_redis
+from app.crud.version import GAMES, GAME_LOGS, bump_version_in_redis
 
 
-async def create_game_in_db(db: AsyncSession, game_info: GameCreate) -> None:
+async def create_game_in_db(
+    db: AsyncSession, redis_db: Redis, game_info: GameCreate
+) -> None:
     """
     db에 게임 정보를 생성하는 함수
     Args:
         db: AsyncSession
+        redis_db: 게임 캐시, 목록 버전을 갱신할 redis db
         game_info: 생성할 게임의 정보가 담긴 데이터
 
     Returns:
@@ -26,6 +36,10 @@ async def create_game_in_db(db: AsyncSession, game_info: GameCreate) -> None:
     )
     db.add(db_game)
     await db.commit()
+    await run_after_commit(
+        publish_game_catalog_change_in_redis(redis_db, game_info.name),
+        bump_version_in_redis(redis_db, GAMES),
+    )
 
 
 async def get_game_in_db(db: AsyncSession, name: str = None) -> Game | Sequence[Game]:
@@ -46,13 +60,100 @@ async def get_game_in_db(db: AsyncSession, name: str = None) -> Game | Sequence[
     return results.scalars().all()
 
 
+async def get_game_rows_in_db(db: AsyncSession) -> list[GameRow]:
+    """
+    전체 게임 목록을 ORM 객체 없이 필요한 컬럼만 읽어 반환하는 함수
+    읽기 전용 목록이라 identity map 에 게임을 올리지 않음
+    Args:
+        db: AsyncSession
+
+    Returns:
+        이름 순으로 정렬된 게임 목록
+    """
+    results = await db.execute(
+        select(
+            Game.name, Game.weight, Game.max_possible_num, Game.min_possible_num
+        ).order_by(Game.name)
+    )
+    return [GameRow(*row) for row in results]
+
+
+async def get_games_by_names_in_db(
+    db: AsyncSession, names: Iterable[str]
+) -> dict[str, Game]:
+    """
+    여러 게임을 한 번의 쿼리로 찾는 함수
+    Args:
+        db: AsyncSession
+        names: 찾고자 하는 게임 이름들
+
+    Returns:
+        게임 이름을 key 로 하는 게임 정보
+    """
+    results = await db.execute(select(Game).where(Game.name.in_(set(names))))
+    return {game.name: game for game in results.scalars().all()}
+
+
+async def get_game_catalog_in_db(db: AsyncSession) -> dict[str, Row]:
+    """
+    게임 기록 검증에 필요한 값만 담은 전체 게임 목록을 반환하는 함수
+    Args:
+        db: AsyncSession
+
+    Returns:
+        게임 이름을 key 로 하는 (name, min_possible_num, max_possible_num) row
+    """
+    results = await db.execute(
+        select(Game.name, Game.min_possible_num, Game.max_possible_num)
+    )
+    return {row.name: row for row in results.all()}
+
+
+async def get_game_features_in_db(db: AsyncSession) -> Sequence[Row]:
+    """
+    비슷한 게임 검색에 쓰는 전체 게임의 속성을 반환하는 함수
+    평균 플레이 시간은 game_logs 대신 사용자별 게임 통계로 계산
+    Args:
+        db: AsyncSession
+
+    Returns:
+        (name, weight, min_possible_num, max_possible_num, avg_during_time) row
+        기록이 없는 게임의 avg_during_time 은 None
+    """
+    stats = (
+        select(
+            UserGameStats.game_name,
+            (
+                func.sum(UserGameStats.total_during_time)
+                * 1.0
+                / func.sum(UserGameStats.play_count)
+            ).label("avg_during_time"),
+        )
+        .group_by(UserGameStats.game_name)
+        .subquery()
+    )
+    results = await db.execute(
+        select(
+            Game.name,
+            Game.weight,
+            Game.min_possible_num,
+            Game.max_possible_num,
+            stats.c.avg_during_time,
+        )
+        .outerjoin(stats, stats.c.game_name == Game.name)
+        .order_by(Game.name)
+    )
+    return results.all()
+
+
 async def update_game_in_db(
-    db: AsyncSession, game: Game, update_data: dict[str, Any]
+    db: AsyncSession, redis_db: Redis, game: Game, update_data: dict[str, Any]
 ) -> Game:
     """
     db에 있는 게임의 정보를 수정하는 함수
     Args:
         db: AsyncSession
+        redis_db: 게임 캐시, 목록 버전을 갱신할 redis db
         game: 변경할 게임
         update_data: 변경할 내용이 담긴 딕셔너리
 
@@ -63,15 +164,22 @@ async def update_game_in_db(
         setattr(game, key, value)
 
     await db.commit()
+    await run_after_commit(
+        publish_game_catalog_change_in_redis(redis_db, game.name),
+        bump_version_in_redis(redis_db, GAMES),
+    )
     await db.refresh(game)  # 방금 커밋된 최신 데이터를 다시 game 객체에 반영(동기화)
     return game
 
 
-async def delete_game_in_db(db: AsyncSession, game: Game) -> dict[str, str]:
+async def delete_game_in_db(
+    db: AsyncSession, redis_db: Redis, game: Game
+) -> dict[str, str]:
     """
     db에 있는 게임을 삭제하는 함수
     Args:
         db: AsyncSession
+        redis_db: 순위표, 게임 캐시, 목록 버전을 갱신할 redis db
         game: 삭제하고자 하는 게임
 
     Returns:
@@ -79,5 +187,11 @@ async def delete_game_in_db(db: AsyncSession, game: Game) -> dict[str, str]:
     """
     await db.delete(game)
     await db.commit()
+    await run_after_commit(
+        publish_game_catalog_change_in_redis(redis_db, game.name),
+        bump_version_in_redis(redis_db, GAMES, GAME_LOGS),
+        delete_game_from_leaderboard_in_redis(redis_db, game.name),
+        delete_game_from_trending_in_redis(redis_db, game.name),
+    )
 
     return {"message": f"{game.name} deleted"}
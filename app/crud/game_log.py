@@ -1,21 +1,86 @@
-from typing import Any
+from typing import Any, AsyncIterator, Sequence
 from datetime import datetime
+from sqlalchemy import (
+    tuple_,
+    insert,
+    Select,
+    Row,
+    and_,
+    func,
+    literal_column,
+    table,
+    column,
+)
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import load_only
 
-from app.models.user import User
+from app.config import settings
+from app.schemas.user import Principal
 from app.models.game import Game
 from app.models.game_log import GameLog
-from app.schemas.game_log import GameLogCreate
+from app.db.search import (
+    SEARCH_DOCUMENT,
+    SEARCH_VECTOR,
+    TRIGRAM_MIN_LENGTH,
+    FTS_TABLE_NAME,
+)
+from app.schemas.game_log import (
+    GameLogCreate,
+    GameLogFilterParams,
+    GameLogPageParams,
+    GameLogSearchParams,
+)
+from app.core.after_commit import run_after_commit
+from app.core.pagination import encode_cursor, decode_cursor
+from app.crud.leaderboard import add_game_logs_to_leaderboard_in_redis
+from app.crud.trending import add_game_logs_to_trending_in_redis
+from app.crud.version import GAME_LOGS, bump_version_in_redis
+from app.crud.user_game_stats import (
+    add_game_logs_to_stats_in_db,
+    refresh_user_game_stats_in_db,
+)
+
+# 사용자별 게임 통계에 반영되는 게임 기록의 값
+STATS_FIELDS = {"game_name", "during_time", "participant_num"}
+
+# 순위표와 인기 게임에 반영되는 게임 기록의 값
+RANKING_FIELDS = ["user_name", "game_name", "during_time", "date"]
+
+# COPY 로 적재하는 게임 기록의 컬럼 (id 는 db 에서 생성)
+COPY_COLUMNS = [
+    "user_name",
+    "game_name",
+    "date",
+    "during_time",
+    "participant_num",
+    "subject",
+    "content",
+    "picture",
+]
+
+
+async def _add_game_logs_to_rankings_in_redis(
+    redis_db: Redis, game_logs: list[dict[str, Any]], sign: int = 1
+) -> None:
+    """게임 기록을 순위표와 인기 게임 bucket 에 더하거나 빼는 함수"""
+    await add_game_logs_to_leaderboard_in_redis(redis_db, game_logs, sign=sign)
+    await add_game_logs_to_trending_in_redis(redis_db, game_logs, sign=sign)
 
 
 async def create_game_log_in_db(
-    db: AsyncSession, game_log_info: GameLogCreate, user: User, game: Game
+    db: AsyncSession,
+    redis_db: Redis,
+    game_log_info: GameLogCreate,
+    user: Principal,
+    game: Game,
 ) -> None:
     """
     db에 게임 기록을 생성하는 함수
     Args:
         db: AsyncSession
+        redis_db: 순위표, 목록 버전을 갱신할 redis db
         game_log_info: 게임 기록에 관한 정보
         user: 게임을 기록하는 사용자
         game: 기록할 게임
@@ -23,7 +88,7 @@ async def create_game_log_in_db(
     Returns:
         None
     """
-    db_game_log = GameLog(
+    values = dict(
         user_name=user.name,
         game_name=game.name,
         date=datetime.now(),
@@ -33,12 +98,116 @@ async def create_game_log_in_db(
         content=game_log_info.content,
         picture=game_log_info.picture,
     )
-    db.add(db_game_log)
+    db.add(GameLog(**values))
+    await add_game_logs_to_stats_in_db(db, user_name=user.name, game_logs=[values])
     await db.commit()
+    await run_after_commit(
+        bump_version_in_redis(redis_db, GAME_LOGS),
+        _add_game_logs_to_rankings_in_redis(redis_db, [values]),
+    )
+
+
+async def create_game_logs_in_db(
+    db: AsyncSession,
+    redis_db: Redis,
+    game_logs: Sequence[tuple[GameLogCreate, Game]],
+    user: Principal,
+) -> None:
+    """
+    db에 여러 게임 기록을 한 번의 INSERT 로 생성하는 함수
+    Args:
+        db: AsyncSession
+        redis_db: 순위표, 목록 버전을 갱신할 redis db
+        game_logs: 검증을 마친 게임 기록에 관한 정보와 기록할 게임
+        user: 게임을 기록하는 사용자
+
+    Returns:
+        None
+    """
+    now = datetime.now()
+    values = [
+        dict(
+            user_name=user.name,
+            game_name=game.name,
+            date=now,
+            during_time=game_log_info.during_time,
+            participant_num=game_log_info.participant_num,
+            subject=game_log_info.subject,
+            content=game_log_info.content,
+            picture=game_log_info.picture,
+        )
+        for game_log_info, game in game_logs
+    ]
+    await db.execute(insert(GameLog).values(values))
+    await add_game_logs_to_stats_in_db(db, user_name=user.name, game_logs=values)
+    await db.commit()
+    await run_after_commit(
+        bump_version_in_redis(redis_db, GAME_LOGS),
+        _add_game_logs_to_rankings_in_redis(redis_db, values),
+    )
+
+
+async def copy_game_logs_in_db(db: AsyncSession, values: list[dict[str, Any]]) -> None:
+    """
+    대량의 게임 기록을 가장 빠른 방법으로 적재하는 함수
+    asyncpg 에서는 COPY, 그 외에서는 executemany 를 사용하며 commit 하지 않음
+    Args:
+        db: AsyncSession
+        values: 적재할 게임 기록의 값들
+    """
+    connection = await db.connection()
+    if connection.dialect.driver == "asyncpg":
+        # 호출한 쪽에서 이미 실행한 쿼리로 트랜잭션이 시작되어 있어 COPY 도 같은 트랜잭션에 포함됨
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            GameLog.__tablename__,
+            records=[
+                tuple(value[column] for column in COPY_COLUMNS) for value in values
+            ],
+            columns=COPY_COLUMNS,
+        )
+    else:
+        await connection.execute(GameLog.__table__.insert(), values)
+
+
+def filter_game_log_query(
+    query: Select,
+    user: Principal = None,
+    game: Game = None,
+    filters: GameLogFilterParams = None,
+) -> Select:
+    """
+    게임 기록 조회 쿼리에 목록 API 공통 조건을 추가하는 함수
+    Args:
+        query: 게임 기록을 조회하는 쿼리
+        user: 불러올 기록을 작성한 사용자
+        game: 불러올 기록에 포함된 게임
+        filters: 불러올 기록의 작성 일시 범위 [from, to)와 정렬 방향
+
+    Returns:
+        조건과 정렬이 추가된 쿼리
+    """
+    filters = filters or GameLogFilterParams()
+    if user:
+        query = query.where(GameLog.user_name == user.name)
+    if game:
+        query = query.where(GameLog.game_name == game.name)
+    if filters.date_from:
+        query = query.where(GameLog.date >= filters.date_from)
+    if filters.date_to:
+        query = query.where(GameLog.date < filters.date_to)
+
+    if filters.order == "desc":
+        return query.order_by(GameLog.date.desc(), GameLog.id.desc())
+    return query.order_by(GameLog.date.asc(), GameLog.id.asc())
 
 
 async def get_game_log_in_db(
-    db: AsyncSession, user: User = None, game: Game = None, game_log_id: int = None
+    db: AsyncSession,
+    user: Principal = None,
+    game: Game = None,
+    game_log_id: int = None,
+    page: GameLogPageParams = None,
 ):
     """
     db에 있는 게임 기록을 반환하는 함수
@@ -47,70 +216,227 @@ async def get_game_log_in_db(
         user: 불러올 기록을 작성한 사용자
         game: 불러올 기록에 포함된 게임
         game_log_id: 불러올 기록의 id
+        page: cursor, 페이지 크기, 작성 일시 범위, 정렬 방향, 읽을 필드
 
     Returns:
-        1) user, game 입력 안 했을 때: 전체 게임 기록
-        2) user, game 모두 입력 했을 때: 특정 사용자가 특정 게임을 작성한 기록
-        3) user만 입력 했을 때: 특정 사용자가 기록한 게임 기록
-        4) game만 입력 했을 때: 특정 게임이 작성된 기록
-        5) game_log_id 입력 시: 특정 기록
+        1) game_log_id 입력 시: 특정 기록
+        2) 그 외: (date, id) 순으로 정렬된 한 페이지의 기록, 다음 페이지의 cursor
+            - user, game, 작성 일시 범위로 기록을 거를 수 있음
+            - 다음 페이지가 없으면 cursor 는 None
     """
     if game_log_id:
         result = await db.execute(select(GameLog).where(GameLog.id == game_log_id))
         return result.scalars().first()
 
-    if not user and not game:
-        results = await db.execute(select(GameLog))
-    elif user and game:
-        results = await db.execute(
-            select(GameLog).where(
-                (GameLog.user_name == user.name) & (GameLog.game_name == game.name)
-            )
-        )
-    elif user:
-        results = await db.execute(
-            select(GameLog).where(GameLog.user_name == user.name)
+    page = page or GameLogPageParams()
+    query = filter_game_log_query(select(GameLog), user=user, game=game, filters=page)
+
+    # keyset pagination: offset 대신 마지막 (date, id) 이후부터 읽어 깊이와 무관하게 인덱스를 탐색
+    key = tuple_(GameLog.date, GameLog.id)
+    if page.cursor:
+        cursor_date, cursor_id = decode_cursor(page.cursor)
+        cursor_key = tuple_(cursor_date, cursor_id)
+        # date 만의 조건을 함께 주어, 파티션 테이블에서 cursor 밖의 달은 읽지 않도록 함
+        if page.order == "desc":
+            query = query.where(key < cursor_key, GameLog.date <= cursor_date)
+        else:
+            query = query.where(key > cursor_key, GameLog.date >= cursor_date)
+
+    # 다음 페이지 유무를 알기 위해 하나 더 읽음
+    query = _load_fields(query, page.loaded_fields)
+    results = await db.execute(query.limit(page.limit + 1))
+    game_logs = results.scalars().all()
+
+    next_cursor = None
+    if len(game_logs) > page.limit:
+        game_logs = game_logs[: page.limit]
+        next_cursor = encode_cursor(game_logs[-1].date, game_logs[-1].id)
+
+    return game_logs, next_cursor
+
+
+def _load_fields(query: Select, fields: Sequence[str]) -> Select:
+    """
+    목록에 필요한 컬럼만 읽도록 하는 함수
+    고르지 않은 content 같은 큰 컬럼은 SELECT 에 포함되지 않음
+    Args:
+        query: GameLog 를 읽는 쿼리
+        fields: 응답에 포함할 필드
+
+    Returns:
+        fields 와 cursor 에 필요한 (date, id) 만 읽는 쿼리
+    """
+    columns = {"id", "date", *fields}
+    return query.options(
+        load_only(*(getattr(GameLog, field) for field in sorted(columns)))
+    )
+
+
+def _search_postgresql_query(q: str, words: list[str]) -> Select:
+    """pg_trgm 식 인덱스로 게임 기록을 검색하고 tsvector 와 유사도로 순위를 매기는 쿼리를 반환하는 함수"""
+    document = literal_column(f"({SEARCH_DOCUMENT})")
+    vector = literal_column(SEARCH_VECTOR)
+    ts_query = func.plainto_tsquery(literal_column("'simple'::regconfig"), q)
+
+    # 조사가 붙은 한국어도 찾도록 부분 문자열로 검색 (pg_trgm 인덱스)
+    # 짧은 검색어는 trigram 으로 찾을 수 없어 긴 검색어로 찾은 기록 중에서 거름
+    condition = and_(*(document.icontains(word, autoescape=True) for word in words))
+
+    rank = func.ts_rank(vector, ts_query) + func.word_similarity(q, document)
+    return (
+        select(GameLog)
+        .where(condition)
+        .order_by(rank.desc(), GameLog.date.desc(), GameLog.id.desc())
+    )
+
+
+def _search_sqlite_query(words: list[str]) -> Select:
+    """FTS5 trigram 테이블로 게임 기록을 검색하는 쿼리를 반환하는 함수"""
+    long_words = [word for word in words if len(word) >= TRIGRAM_MIN_LENGTH]
+    short_words = [word for word in words if len(word) < TRIGRAM_MIN_LENGTH]
+
+    fts = table(FTS_TABLE_NAME, column("rowid"))
+    match = " AND ".join('"' + word.replace('"', '""') + '"' for word in long_words)
+    query = (
+        select(GameLog)
+        .join(fts, fts.c.rowid == GameLog.id)
+        .where(literal_column(FTS_TABLE_NAME).match(match))
+        .order_by(func.bm25(literal_column(FTS_TABLE_NAME)))
+    )
+
+    # 짧은 검색어는 FTS 로 찾은 기록 중에서만 거름
+    for word in short_words:
+        query = query.where(
+            GameLog.subject.icontains(word, autoescape=True)
+            | GameLog.content.icontains(word, autoescape=True)
         )
+    return query.order_by(GameLog.date.desc(), GameLog.id.desc())
+
+
+async def search_game_log_in_db(
+    db: AsyncSession, search: GameLogSearchParams
+) -> tuple[Sequence[GameLog], int | None]:
+    """
+    subject, content 에 검색어가 포함된 게임 기록을 관련도 순으로 반환하는 함수
+    Args:
+        db: AsyncSession
+        search: 검색어, 페이지 크기, offset, 읽을 필드
+
+    Returns:
+        관련도 순으로 정렬된 한 페이지의 기록, 다음 페이지의 offset
+            - 다음 페이지가 없거나 최대 offset 을 넘으면 None
+    """
+    words = search.q.split()
+    if db.get_bind().dialect.name == "postgresql":
+        query = _search_postgresql_query(search.q, words)
     else:
-        results = await db.execute(
-            select(GameLog).where(GameLog.game_name == game.name)
-        )
+        query = _search_sqlite_query(words)
+
+    # 다음 페이지 유무를 알기 위해 하나 더 읽음
+    query = _load_fields(query, search.loaded_fields)
+    results = await db.execute(query.offset(search.offset).limit(search.limit + 1))
+    game_logs = results.scalars().all()
+
+    next_offset = None
+    if len(game_logs) > search.limit:
+        game_logs = game_logs[: search.limit]
+        if search.offset + search.limit <= settings.GAME_LOG_SEARCH_MAX_OFFSET:
+            next_offset = search.offset + search.limit
+
+    return game_logs, next_offset
 
-    return results.scalars().all()
+
+async def stream_game_log_in_db(
+    db: AsyncSession,
+    user: Principal = None,
+    game: Game = None,
+    filters: GameLogFilterParams = None,
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    서버 측 cursor 로 게임 기록을 나눠서 읽어오는 함수
+    Args:
+        db: AsyncSession
+        user: 불러올 기록을 작성한 사용자
+        game: 불러올 기록에 포함된 게임
+        filters: 불러올 기록의 작성 일시 범위와 정렬 방향
+
+    Returns:
+        GAME_LOG_EXPORT_CHUNK_SIZE 개씩 묶인 게임 기록 row
+    """
+    query = filter_game_log_query(
+        select(*GameLog.__table__.columns), user=user, game=game, filters=filters
+    )
+
+    # ORM 객체를 만들지 않고 row 만 읽어, 전체 행 수와 무관하게 메모리를 일정하게 유지
+    results = await db.stream(
+        query.execution_options(yield_per=settings.GAME_LOG_EXPORT_CHUNK_SIZE)
+    )
+    async for rows in results.partitions():
+        yield rows
 
 
 async def update_game_log_in_db(
-    db: AsyncSession, game_log: GameLog, update_data: dict[str, Any]
+    db: AsyncSession, redis_db: Redis, game_log: GameLog, update_data: dict[str, Any]
 ) -> GameLog:
     """
     db에 있는 게임 기록 정보를 수정하는 함수
     Args:
         db: AsyncSession
+        redis_db: 순위표, 목록 버전을 갱신할 redis db
         game_log: 변경할 게임 기록
         update_data: 변경할 내용이 담긴 딕셔너리
 
     Returns:
         주어진 정보로 수정한 게임 기록
     """
+    previous = {field: getattr(game_log, field) for field in RANKING_FIELDS}
+    previous_game_name = game_log.game_name
     for key, value in update_data.items():
         setattr(game_log, key, value)
 
+    # 통계에 영향을 주는 값이 바뀌었을 때만 이전, 이후 게임의 통계를 다시 계산
+    if STATS_FIELDS & update_data.keys():
+        for game_name in {previous_game_name, game_log.game_name}:
+            await refresh_user_game_stats_in_db(
+                db, user_name=game_log.user_name, game_name=game_name
+            )
+
     await db.commit()
     await db.refresh(game_log)
+
+    current = {field: getattr(game_log, field) for field in RANKING_FIELDS}
+    steps = [bump_version_in_redis(redis_db, GAME_LOGS)]
+    if previous != current:
+        steps += [
+            _add_game_logs_to_rankings_in_redis(redis_db, [previous], sign=-1),
+            _add_game_logs_to_rankings_in_redis(redis_db, [current]),
+        ]
+    await run_after_commit(*steps)
     return game_log
 
 
-async def delete_game_log_in_db(db: AsyncSession, game_log: GameLog) -> dict[str, str]:
+async def delete_game_log_in_db(
+    db: AsyncSession, redis_db: Redis, game_log: GameLog
+) -> dict[str, str]:
     """
     db에 있는 게임 기록을 삭제하는 함수
     Args:
         db: AsyncSession
+        redis_db: 순위표, 목록 버전을 갱신할 redis db
         game_log: 삭제하고자 하는 게임 기록
 
     Returns:
         삭제가 완료되었다는 메시지
     """
+    values = {field: getattr(game_log, field) for field in RANKING_FIELDS}
     await db.delete(game_log)
+    await refresh_user_game_stats_in_db(
+        db, user_name=game_log.user_name, game_name=game_log.game_name
+    )
     await db.commit()
+    await run_after_commit(
+        bump_version_in_redis(redis_db, GAME_LOGS),
+        _add_game_logs_to_rankings_in_redis(redis_db, [values], sign=-1),
+    )
 
     return {"message": f"{game_log.id} deleted"}
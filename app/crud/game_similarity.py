@@ -0,0 +1,47 @@
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.game_similarity import GameSimilarity
+
+
+async def replace_game_similarities_in_db(
+    db: AsyncSession, similarities: Sequence[dict[str, Any]]
+) -> None:
+    """
+    비슷한 게임 목록을 새로 계산한 결과로 바꾸는 함수
+    삭제와 생성을 하나의 트랜잭션으로 처리하여 조회 중에 빈 목록이 보이지 않음
+    Args:
+        db: AsyncSession
+        similarities: game_name, similar_game_name, score, common_user_num 을 가진 값들
+    """
+    await db.execute(delete(GameSimilarity))
+    if similarities:
+        await db.execute(insert(GameSimilarity), similarities)
+    await db.commit()
+
+
+async def get_similar_games_in_db(
+    db: AsyncSession, game_names: Iterable[str], limit: int = None
+) -> Sequence[GameSimilarity]:
+    """
+    주어진 게임들과 비슷한 게임을 반환하는 함수
+    Args:
+        db: AsyncSession
+        game_names: 기준 게임 이름들
+        limit: 반환할 최대 수
+
+    Returns:
+        유사도가 높은 순으로 정렬된 비슷한 게임
+    """
+    query = (
+        select(GameSimilarity)
+        .where(GameSimilarity.game_name.in_(list(game_names)))
+        .order_by(GameSimilarity.score.desc(), GameSimilarity.similar_game_name)
+    )
+    if limit:
+        query = query.limit(limit)
+    results = await db.execute(query)
+    return results.scalars().all()
@@ -0,0 +1,264 @@
+from typing import Any, Iterable, Literal
+
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.models.user_game_stats import UserGameStats
+
+"""
+- 게임별 플레이 수, 플레이 시간과 게임별 사용자 플레이 수, 플레이 시간을 redis sorted set 으로 관리
+- 게임 기록이 바뀔 때 ZINCRBY 로 갱신하고, 순위는 ZREVRANGE 로 읽어 game_logs 를 집계하지 않음
+- db 커밋 뒤에 갱신하므로 redis 장애 등으로 어긋나면 tools/rebuild_leaderboards.py 로 다시 생성
+- 휴면(soft delete) 사용자는 사용자 순위에서 빼고, 기록은 남아 있으므로 게임 순위에는 포함
+"""
+LEADERBOARD_KEY_PREFIX = "leaderboard"
+
+LeaderboardBy = Literal["plays", "minutes"]
+
+# (user_name, game_name) 별 [플레이 수, 플레이 시간]
+LeaderboardTally = dict[tuple[str, str], list[int]]
+
+
+def _games_key(by: LeaderboardBy) -> str:
+    return f"{LEADERBOARD_KEY_PREFIX}:games:{by}"
+
+
+def _players_key(game_name: str, by: LeaderboardBy) -> str:
+    return f"{LEADERBOARD_KEY_PREFIX}:game:{game_name}:players:{by}"
+
+
+def tally_game_logs(
+    game_logs: Iterable[dict[str, Any]], tally: LeaderboardTally | None = None
+) -> LeaderboardTally:
+    """
+    게임 기록을 (사용자, 게임) 별 플레이 수와 플레이 시간으로 합치는 함수
+    Args:
+        game_logs: user_name, game_name, during_time 을 가진 게임 기록의 값
+        tally: 이어서 합칠 기존 결과
+
+    Returns:
+        (user_name, game_name) 별 [플레이 수, 플레이 시간]
+    """
+    tally = {} if tally is None else tally
+    for game_log in game_logs:
+        entry = tally.setdefault((game_log["user_name"], game_log["game_name"]), [0, 0])
+        entry[0] += 1
+        entry[1] += game_log["during_time"]
+    return tally
+
+
+async def apply_tally_to_leaderboard_in_redis(
+    redis_db: Redis, tally: LeaderboardTally, sign: int = 1
+) -> None:
+    """
+    합친 게임 기록을 순위표에 더하거나 빼는 함수
+    Args:
+        redis_db: redis db
+        tally: tally_game_logs 의 결과
+        sign: 1 이면 더하고, -1 이면 뺌
+    """
+    if not tally:
+        return
+
+    game_totals: dict[str, list[int]] = {}
+    async with redis_db.pipeline(transaction=False) as pipe:
+        for (user_name, game_name), (plays, minutes) in tally.items():
+            pipe.zincrby(_players_key(game_name, "plays"), sign * plays, user_name)
+            pipe.zincrby(_players_key(game_name, "minutes"), sign * minutes, user_name)
+            total = game_totals.setdefault(game_name, [0, 0])
+            total[0] += plays
+            total[1] += minutes
+        for game_name, (plays, minutes) in game_totals.items():
+            pipe.zincrby(_games_key("plays"), sign * plays, game_name)
+            pipe.zincrby(_games_key("minutes"), sign * minutes, game_name)
+
+        # 기록이 모두 지워진 사용자, 게임은 순위에서 제외
+        if sign < 0:
+            keys = [_games_key("plays"), _games_key("minutes")]
+            for game_name in game_totals:
+                keys += [_players_key(game_name, "plays")]
+                keys += [_players_key(game_name, "minutes")]
+            for key in keys:
+                pipe.zremrangebyscore(key, "-inf", 0)
+        await pipe.execute()
+
+
+async def add_game_logs_to_leaderboard_in_redis(
+    redis_db: Redis, game_logs: Iterable[dict[str, Any]], sign: int = 1
+) -> None:
+    """
+    게임 기록을 순위표에 더하거나 빼는 함수
+    Args:
+        redis_db: redis db
+        game_logs: user_name, game_name, during_time 을 가진 게임 기록의 값
+        sign: 1 이면 더하고, -1 이면 뺌
+    """
+    await apply_tally_to_leaderboard_in_redis(
+        redis_db, tally_game_logs(game_logs), sign=sign
+    )
+
+
+async def delete_game_from_leaderboard_in_redis(
+    redis_db: Redis, game_name: str
+) -> None:
+    """
+    삭제된 게임을 순위표에서 제거하는 함수
+    Args:
+        redis_db: redis db
+        game_name: 삭제된 게임 이름
+    """
+    async with redis_db.pipeline(transaction=False) as pipe:
+        for by in ("plays", "minutes"):
+            pipe.zrem(_games_key(by), game_name)
+            pipe.delete(_players_key(game_name, by))
+        await pipe.execute()
+
+
+async def get_leaderboard_tally_in_db(
+    db: AsyncSession, user_names: Iterable[str]
+) -> LeaderboardTally:
+    """
+    사용자들의 게임별 통계를 순위표에 반영할 형태로 반환하는 함수
+    Args:
+        db: AsyncSession
+        user_names: 사용자 이름들
+
+    Returns:
+        (user_name, game_name) 별 [플레이 수, 플레이 시간]
+    """
+    results = await db.execute(
+        select(
+            UserGameStats.user_name,
+            UserGameStats.game_name,
+            UserGameStats.play_count,
+            UserGameStats.total_during_time,
+        ).where(UserGameStats.user_name.in_(set(user_names)))
+    )
+    return {
+        (user_name, game_name): [play_count, total_during_time]
+        for user_name, game_name, play_count, total_during_time in results
+    }
+
+
+async def remove_players_from_leaderboard_in_redis(
+    redis_db: Redis, tally: LeaderboardTally
+) -> None:
+    """
+    휴면 사용자를 사용자 순위에서 제거하는 함수 (게임 순위는 그대로)
+    Args:
+        redis_db: redis db
+        tally: 제거할 사용자의 get_leaderboard_tally_in_db 결과
+    """
+    if not tally:
+        return
+
+    async with redis_db.pipeline(transaction=False) as pipe:
+        for user_name, game_name in tally:
+            for by in ("plays", "minutes"):
+                pipe.zrem(_players_key(game_name, by), user_name)
+        await pipe.execute()
+
+
+async def add_players_to_leaderboard_in_redis(
+    redis_db: Redis, tally: LeaderboardTally
+) -> None:
+    """
+    복구된 사용자를 사용자 순위에 다시 넣는 함수 (게임 순위는 그대로)
+    Args:
+        redis_db: redis db
+        tally: 넣을 사용자의 get_leaderboard_tally_in_db 결과
+    """
+    if not tally:
+        return
+
+    async with redis_db.pipeline(transaction=False) as pipe:
+        for (user_name, game_name), (plays, minutes) in tally.items():
+            pipe.zadd(_players_key(game_name, "plays"), {user_name: plays})
+            pipe.zadd(_players_key(game_name, "minutes"), {user_name: minutes})
+        await pipe.execute()
+
+
+async def _get_leaderboard(redis_db: Redis, key: str, limit: int) -> list[dict]:
+    results = await redis_db.zrevrange(key, 0, limit - 1, withscores=True)
+    return [{"name": name, "score": int(score)} for name, score in results]
+
+
+async def get_game_leaderboard_in_redis(
+    redis_db: Redis, by: LeaderboardBy, limit: int
+) -> list[dict]:
+    """
+    가장 많이 플레이한 게임 순위를 반환하는 함수
+    Args:
+        redis_db: redis db
+        by: 플레이 수(plays) 또는 플레이 시간(minutes)
+        limit: 반환할 순위 수
+
+    Returns:
+        게임 이름과 점수
+    """
+    return await _get_leaderboard(redis_db, _games_key(by), limit)
+
+
+async def get_player_leaderboard_in_redis(
+    redis_db: Redis, game_name: str, by: LeaderboardBy, limit: int
+) -> list[dict]:
+    """
+    특정 게임을 가장 많이 플레이한 사용자 순위를 반환하는 함수
+    Args:
+        redis_db: redis db
+        game_name: 게임 이름
+        by: 플레이 수(plays) 또는 플레이 시간(minutes)
+        limit: 반환할 순위 수
+
+    Returns:
+        사용자 이름과 점수
+    """
+    return await _get_leaderboard(redis_db, _players_key(game_name, by), limit)
+
+
+async def rebuild_leaderboard_in_redis(db: AsyncSession, redis_db: Redis) -> int:
+    """
+    사용자별 게임 통계로 순위표를 다시 만드는 함수
+    기존 순위표를 지우고 새로 쓰는 과정을 하나의 트랜잭션(MULTI)으로 처리
+    Args:
+        db: AsyncSession
+        redis_db: redis db
+
+    Returns:
+        반영한 (사용자, 게임) 수
+    """
+    results = await db.execute(
+        select(
+            UserGameStats.user_name,
+            UserGameStats.game_name,
+            UserGameStats.play_count,
+            UserGameStats.total_during_time,
+            User.is_deleted,
+        ).join(User, User.name == UserGameStats.user_name)
+    )
+    tally, deleted = {}, set()
+    for user_name, game_name, play_count, total_during_time, is_deleted in results:
+        tally[(user_name, game_name)] = [play_count, total_during_time]
+        if is_deleted:
+            deleted.add(user_name)
+
+    keys = [key async for key in redis_db.scan_iter(f"{LEADERBOARD_KEY_PREFIX}:*")]
+    async with redis_db.pipeline(transaction=True) as pipe:
+        if keys:
+            pipe.delete(*keys)
+        game_totals: dict[str, list[int]] = {}
+        for (user_name, game_name), (plays, minutes) in tally.items():
+            if user_name not in deleted:
+                pipe.zadd(_players_key(game_name, "plays"), {user_name: plays})
+                pipe.zadd(_players_key(game_name, "minutes"), {user_name: minutes})
+            total = game_totals.setdefault(game_name, [0, 0])
+            total[0] += plays
+            total[1] += minutes
+        for game_name, (plays, minutes) in game_totals.items():
+            pipe.zadd(_games_key("plays"), {game_name: plays})
+            pipe.zadd(_games_key("minutes"), {game_name: minutes})
+        await pipe.execute()
+
+    return len(tally)
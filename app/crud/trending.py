@@ -0,0 +1,152 @@
+import math
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from redis.asyncio import Redis
+
+from app.config import settings
+
+"""
+- 게임별 플레이 수를 시간(hour), 일(day) 단위 redis sorted set 에 나눠 기록
+- 최근 N 시간/일 순위는 해당 기간의 bucket 몇십 개를 ZUNION 으로 합쳐 계산
+- 오래된 bucket 일수록 TRENDING_HALF_LIFE_HOURS 에 따라 가중치를 낮춤
+- 보관 기간이 지난 bucket 은 만료 시간으로 자동 삭제
+"""
+TRENDING_KEY_PREFIX = "trending"
+
+
+def _hour_key(value: datetime) -> str:
+    return f"{TRENDING_KEY_PREFIX}:hour:{value.strftime('%Y%m%d%H')}"
+
+
+def _day_key(value: datetime) -> str:
+    return f"{TRENDING_KEY_PREFIX}:day:{value.strftime('%Y%m%d')}"
+
+
+def _hour_start(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _day_start(value: datetime) -> datetime:
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _max_days() -> int:
+    """가장 긴 기간을 덮는 day bucket 수를 반환하는 함수"""
+    return math.ceil(max(settings.TRENDING_WINDOWS.values()) / 24)
+
+
+def _buckets(date: datetime) -> list[tuple[str, datetime]]:
+    """
+    작성 일시가 속한 hour, day bucket 과 만료 일시를 반환하는 함수
+    Args:
+        date: 게임 기록의 작성 일시
+
+    Returns:
+        (bucket key, 만료 일시)
+    """
+    return [
+        (
+            _hour_key(date),
+            _hour_start(date) + timedelta(hours=settings.TRENDING_HOURLY_MAX_HOURS + 1),
+        ),
+        (_day_key(date), _day_start(date) + timedelta(days=_max_days() + 1)),
+    ]
+
+
+def trending_since() -> datetime:
+    """bucket 에 반영되는 가장 오래된 작성 일시를 반환하는 함수"""
+    return _day_start(datetime.now()) - timedelta(days=_max_days())
+
+
+async def add_game_logs_to_trending_in_redis(
+    redis_db: Redis, game_logs: Iterable[dict[str, Any]], sign: int = 1
+) -> None:
+    """
+    게임 기록을 작성 일시의 hour, day bucket 에 더하거나 빼는 함수
+    보관 기간이 지난 기록은 무시함
+    Args:
+        redis_db: redis db
+        game_logs: game_name, date 를 가진 게임 기록의 값
+        sign: 1 이면 더하고, -1 이면 뺌
+    """
+    now = datetime.now()
+    counts: dict[tuple[str, datetime, str], int] = {}
+    for game_log in game_logs:
+        for key, expire_at in _buckets(game_log["date"]):
+            if expire_at > now:
+                bucket = (key, expire_at, game_log["game_name"])
+                counts[bucket] = counts.get(bucket, 0) + 1
+    if not counts:
+        return
+
+    async with redis_db.pipeline(transaction=False) as pipe:
+        for (key, expire_at, game_name), count in counts.items():
+            pipe.zincrby(key, sign * count, game_name)
+            pipe.expireat(key, expire_at)
+        if sign < 0:
+            for key in {key for key, _, _ in counts}:
+                pipe.zremrangebyscore(key, "-inf", 0)
+        await pipe.execute()
+
+
+async def delete_game_from_trending_in_redis(redis_db: Redis, game_name: str) -> None:
+    """
+    삭제된 게임을 모든 bucket 에서 제거하는 함수
+    Args:
+        redis_db: redis db
+        game_name: 삭제된 게임 이름
+    """
+    async with redis_db.pipeline(transaction=False) as pipe:
+        async for key in redis_db.scan_iter(f"{TRENDING_KEY_PREFIX}:*"):
+            pipe.zrem(key, game_name)
+        await pipe.execute()
+
+
+def _window_weights(window: str, now: datetime) -> dict[str, float]:
+    """
+    기간에 포함되는 bucket 과 가중치를 반환하는 함수
+    TRENDING_HOURLY_MAX_HOURS 이하의 기간은 hour bucket, 그보다 길면 day bucket 을 사용
+    Args:
+        window: TRENDING_WINDOWS 의 기간 이름
+        now: 기준 일시
+
+    Returns:
+        bucket key 별 가중치 (현재 bucket 이 1)
+    """
+    hours = settings.TRENDING_WINDOWS[window]
+    half_life = settings.TRENDING_HALF_LIFE_HOURS.get(window, 0)
+    if hours <= settings.TRENDING_HOURLY_MAX_HOURS:
+        step, count, key = timedelta(hours=1), hours, _hour_key
+    else:
+        step, count, key = timedelta(days=1), math.ceil(hours / 24), _day_key
+
+    weights = {}
+    for age in range(count):
+        decay = 0.5 ** (age * step / timedelta(hours=half_life)) if half_life else 1
+        weights[key(now - age * step)] = decay
+    return weights
+
+
+async def get_trending_game_in_redis(
+    redis_db: Redis, window: str, limit: int
+) -> list[dict]:
+    """
+    최근 기간 동안 많이 플레이된 게임 순위를 반환하는 함수
+    Args:
+        redis_db: redis db
+        window: TRENDING_WINDOWS 의 기간 이름
+        limit: 반환할 순위 수
+
+    Returns:
+        게임 이름과 (가중치를 반영한) 플레이 수
+    """
+    results = await redis_db.zunion(
+        _window_weights(window, datetime.now()), withscores=True
+    )
+    results.sort(key=lambda result: (-result[1], result[0]))
+    return [
+        {"name": name, "score": round(score, 3)}
+        for name, score in results[:limit]
+        if score > 0
+    ]
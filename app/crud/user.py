@@ -1,14 +1,23 @@
-from typing import Any
+from typing import Any, Iterable
 from datetime import datetime, timedelta
 
 from pydantic import EmailStr
+from redis.asyncio import Redis
 from sqlalchemy import Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.models.user import User
-from app.schemas.user import UserCreate
+from app.schemas.user import UserCreate, UserRow, Principal
+from app.core.after_commit import run_after_commit
+from app.core.principal_cache import publish_principal_change_in_redis
 from app.core.security import pwd_context
+from app.crud.leaderboard import (
+    get_leaderboard_tally_in_db,
+    apply_tally_to_leaderboard_in_redis,
+    remove_players_from_leaderboard_in_redis,
+)
+from app.crud.version import GAME_LOGS, USERS, bump_version_in_redis
 
 
 async def create_user_in_db(db: AsyncSession, user_info: UserCreate) -> None:
@@ -69,13 +78,72 @@ async def get_user_in_db(
     return result.scalars().first()
 
 
+async def get_user_rows_in_db(
+    db: AsyncSession, is_deleted: bool = False
+) -> list[UserRow]:
+    """
+    전체 사용자 목록을 ORM 객체 없이 필요한 컬럼만 읽어 반환하는 함수
+    읽기 전용 목록이라 identity map 에 사용자를 올리지 않음
+    Args:
+        db: AsyncSession
+        is_deleted: 삭제된 사용자를 가져올 것인지 유무
+
+    Returns:
+        이름 순으로 정렬된 사용자 목록
+    """
+    results = await db.execute(
+        select(User.name, User.email)
+        .where(User.is_deleted == is_deleted)
+        .order_by(User.name)
+    )
+    return [UserRow(*row) for row in results]
+
+
+async def get_users_by_names_in_db(
+    db: AsyncSession, names: Iterable[str]
+) -> dict[str, UserRow]:
+    """
+    여러 사용자의 공개 정보를 한 번의 쿼리로 찾는 함수
+    Args:
+        db: AsyncSession
+        names: 찾고자 하는 사용자 이름들
+
+    Returns:
+        사용자 이름을 key 로 하는 사용자 정보
+    """
+    results = await db.execute(
+        select(User.name, User.email).where(User.name.in_(set(names)))
+    )
+    return {row.name: UserRow(*row) for row in results}
+
+
+async def get_principal_in_db(db: AsyncSession, name: str) -> Principal | None:
+    """
+    인증에 필요한 사용자 정보만 찾는 함수
+    Args:
+        db: AsyncSession
+        name: 토큰에 담긴 사용자 이름
+
+    Returns:
+        탈퇴하지 않은 사용자의 정보, 없으면 None
+    """
+    result = await db.execute(
+        select(User.name, User.email, User.is_admin).where(
+            User.name == name, User.is_deleted == False
+        )
+    )
+    row = result.first()
+    return Principal(*row) if row else None
+
+
 async def update_user_in_db(
-    db: AsyncSession, user: User, update_data: dict[str, Any]
+    db: AsyncSession, redis_db: Redis, user: User, update_data: dict[str, Any]
 ) -> User:
     """
     db에 있는 사용자의 정보를 수정하는 함수
     Args:
         db: AsyncSession
+        redis_db: 인증 캐시, 사용자 버전을 갱신할 redis db
         user: 변경할 사용자
         update_data: 변경할 내용이 담긴 딕셔너리
 
@@ -86,30 +154,42 @@ async def update_user_in_db(
         setattr(user, key, value)
 
     await db.commit()
+    await run_after_commit(
+        publish_principal_change_in_redis(redis_db, user.name),
+        bump_version_in_redis(redis_db, USERS),
+    )
     await db.refresh(user)  # 방금 커밋된 최신 데이터를 다시 user 객체에 반영(동기화)
     return user
 
 
-async def soft_delete_user_in_db(db: AsyncSession, user: User) -> None:
+async def soft_delete_user_in_db(db: AsyncSession, redis_db: Redis, user: User) -> None:
     """
     soft delete를 수행하는 함수
     Args:
         db: AsyncSession
+        redis_db: 인증 캐시, 사용자 버전, 순위표를 갱신할 redis db
         user: 삭제할 사용자
     """
+    tally = await get_leaderboard_tally_in_db(db, [user.name])
     user.is_deleted = True
     user.deleted_at = datetime.now()
     await db.commit()
+    await run_after_commit(
+        publish_principal_change_in_redis(redis_db, user.name),
+        bump_version_in_redis(redis_db, USERS),
+        remove_players_from_leaderboard_in_redis(redis_db, tally),
+    )
     await db.refresh(user)
 
 
 async def hard_delete_user_in_db(
-    db: AsyncSession, delete_threshold_day: int
+    db: AsyncSession, redis_db: Redis, delete_threshold_day: int
 ) -> dict[str, str]:
     """
     hard delete 하는 함수
     Args:
         db: AsyncSession
+        redis_db: 사용자, 게임 기록 목록 버전과 순위표를 갱신할 redis db
         delete_threshold_day: 영구 삭제하는 임계점
 
     Returns:
@@ -125,9 +205,17 @@ async def hard_delete_user_in_db(
     if not users_to_delete:
         return {"message": "No users to delete"}
 
+    # 삭제된 사용자의 기록도 함께 삭제되므로 순위표에서 뺄 통계를 미리 읽음
+    tally = await get_leaderboard_tally_in_db(
+        db, [user.name for user in users_to_delete]
+    )
     for user in users_to_delete:
         await db.delete(user)
 
     await db.commit()
+    await run_after_commit(
+        bump_version_in_redis(redis_db, USERS, GAME_LOGS),
+        apply_tally_to_leaderboard_in_redis(redis_db, tally, sign=-1),
+    )
 
     return {"message": f"Deleted {len(users_to_delete)} users."}
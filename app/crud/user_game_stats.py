@@ -0,0 +1,170 @@
+from typing import Any, Sequence
+
+from sqlalchemy import case, func, delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.game_log import GameLog
+from app.models.user_game_stats import UserGameStats
+
+
+def _insert(db: AsyncSession):
+    """현재 db 의 dialect 에 맞는 ON CONFLICT 를 지원하는 insert 를 반환하는 함수"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(UserGameStats)
+    return sqlite.insert(UserGameStats)
+
+
+async def add_game_logs_to_stats_in_db(
+    db: AsyncSession, user_name: str, game_logs: Sequence[dict[str, Any]]
+) -> None:
+    """
+    새로 생성된 게임 기록을 사용자별 게임 통계에 더하는 함수
+    호출한 쪽의 트랜잭션 안에서 실행되며 commit 하지 않음
+    Args:
+        db: AsyncSession
+        user_name: 기록을 작성한 사용자 이름
+        game_logs: 생성된 게임 기록의 값들
+            (game_name, date, during_time, participant_num 필요)
+    """
+    rows: dict[str, dict[str, Any]] = {}
+    for game_log in game_logs:
+        row = rows.setdefault(
+            game_log["game_name"],
+            {
+                "user_name": user_name,
+                "game_name": game_log["game_name"],
+                "play_count": 0,
+                "total_during_time": 0,
+                "max_during_time": 0,
+                "total_participant_num": 0,
+                "first_played_at": game_log["date"],
+                "last_played_at": game_log["date"],
+            },
+        )
+        row["play_count"] += 1
+        row["total_during_time"] += game_log["during_time"]
+        row["max_during_time"] = max(row["max_during_time"], game_log["during_time"])
+        row["total_participant_num"] += game_log["participant_num"]
+        row["first_played_at"] = min(row["first_played_at"], game_log["date"])
+        row["last_played_at"] = max(row["last_played_at"], game_log["date"])
+
+    if not rows:
+        return
+
+    # 읽고 쓰는 대신 한 번의 upsert 로 더해 동시 요청에도 값이 유실되지 않음
+    stmt = _insert(db).values(list(rows.values()))
+    excluded = stmt.excluded
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[UserGameStats.user_name, UserGameStats.game_name],
+            set_={
+                "play_count": UserGameStats.play_count + excluded.play_count,
+                "total_during_time": UserGameStats.total_during_time
+                + excluded.total_during_time,
+                "max_during_time": case(
+                    (
+                        excluded.max_during_time > UserGameStats.max_during_time,
+                        excluded.max_during_time,
+                    ),
+                    else_=UserGameStats.max_during_time,
+                ),
+                "total_participant_num": UserGameStats.total_participant_num
+                + excluded.total_participant_num,
+                "first_played_at": case(
+                    (
+                        excluded.first_played_at < UserGameStats.first_played_at,
+                        excluded.first_played_at,
+                    ),
+                    else_=UserGameStats.first_played_at,
+                ),
+                "last_played_at": case(
+                    (
+                        excluded.last_played_at > UserGameStats.last_played_at,
+                        excluded.last_played_at,
+                    ),
+                    else_=UserGameStats.last_played_at,
+                ),
+            },
+        )
+    )
+
+
+async def refresh_user_game_stats_in_db(
+    db: AsyncSession, user_name: str, game_name: str
+) -> None:
+    """
+    한 사용자와 게임 쌍의 통계를 게임 기록으로부터 다시 계산하는 함수
+    최댓값과 처음/마지막 일시는 빼기로 되돌릴 수 없어, 수정과 삭제 시에 사용
+    호출한 쪽의 트랜잭션 안에서 실행되며 commit 하지 않음
+    Args:
+        db: AsyncSession
+        user_name: 기록을 작성한 사용자 이름
+        game_name: 기록된 게임 이름
+    """
+    await db.flush()  # 아직 반영되지 않은 수정, 삭제 내용을 집계에 포함
+    result = await db.execute(
+        select(
+            func.count(GameLog.id),
+            func.sum(GameLog.during_time),
+            func.max(GameLog.during_time),
+            func.sum(GameLog.participant_num),
+            func.min(GameLog.date),
+            func.max(GameLog.date),
+        ).where(GameLog.user_name == user_name, GameLog.game_name == game_name)
+    )
+    play_count, total, maximum, participants, first, last = result.one()
+
+    if not play_count:
+        await db.execute(
+            delete(UserGameStats).where(
+                UserGameStats.user_name == user_name,
+                UserGameStats.game_name == game_name,
+            )
+        )
+        return
+
+    stmt = _insert(db).values(
+        user_name=user_name,
+        game_name=game_name,
+        play_count=play_count,
+        total_during_time=total,
+        max_during_time=maximum,
+        total_participant_num=participants,
+        first_played_at=first,
+        last_played_at=last,
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[UserGameStats.user_name, UserGameStats.game_name],
+            set_={
+                "play_count": stmt.excluded.play_count,
+                "total_during_time": stmt.excluded.total_during_time,
+                "max_during_time": stmt.excluded.max_during_time,
+                "total_participant_num": stmt.excluded.total_participant_num,
+                "first_played_at": stmt.excluded.first_played_at,
+                "last_played_at": stmt.excluded.last_played_at,
+            },
+        )
+    )
+
+
+async def get_user_game_stats_in_db(
+    db: AsyncSession, user_name: str
+) -> Sequence[UserGameStats]:
+    """
+    사용자의 게임별 통계를 반환하는 함수
+    Args:
+        db: AsyncSession
+        user_name: 통계를 찾을 사용자 이름
+
+    Returns:
+        플레이 횟수가 많은 순으로 정렬된 게임별 통계
+    """
+    results = await db.execute(
+        select(UserGameStats)
+        .where(UserGameStats.user_name == user_name)
+        .order_by(UserGameStats.play_count.desc(), UserGameStats.game_name)
+    )
+    return results.scalars().all()
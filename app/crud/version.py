@@ -0,0 +1,70 @@
+from typing import Iterable
+from uuid import uuid4
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+"""
+- 테이블이 바뀔 때마다 새로 만드는 redis 버전 값으로 목록 응답의 ETag 를 만듦
+- db 커밋 뒤에 바꾸므로, 조회 쪽은 버전을 먼저 읽고 db 를 읽어야
+  새 버전에 이전 데이터가 묶이는 일이 없음
+- 버전은 카운터가 아닌 임의의 값이라, 지워졌다가 다시 만들어져도 이전 ETag 가 나오지 않음
+"""
+VERSION_KEY_PREFIX = "version"
+
+GAMES = "games"
+GAME_LOGS = "game_logs"
+USERS = "users"
+
+
+def _version_key(table: str) -> str:
+    return f"{VERSION_KEY_PREFIX}:{table}"
+
+
+def _new_version() -> str:
+    return uuid4().hex
+
+
+async def bump_version_in_redis(redis_db: Redis, *tables: str) -> None:
+    """
+    테이블이 바뀌었음을 기록하는 함수
+    새 버전을 쓰지 못하면 버전을 지워, 다음 조회 때 새 버전이 만들어지도록 함
+    Args:
+        redis_db: redis db
+        tables: 바뀐 테이블 이름
+    """
+    keys = [_version_key(table) for table in tables]
+    try:
+        async with redis_db.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(key, _new_version())
+            await pipe.execute()
+    except RedisError:
+        # 이전 버전이 남으면 바뀐 목록 대신 304 가 계속 나가므로 지우고, 실패는 그대로 올림
+        await redis_db.delete(*keys)
+        raise
+
+
+async def get_versions_in_redis(redis_db: Redis, tables: Iterable[str]) -> list[str]:
+    """
+    테이블의 현재 버전을 반환하는 함수
+    버전이 없으면(처음이거나 지워졌으면) 새로 만듦
+    Args:
+        redis_db: redis db
+        tables: 테이블 이름
+
+    Returns:
+        테이블 순서대로의 버전
+    """
+    keys = [_version_key(table) for table in tables]
+    versions = await redis_db.mget(keys)
+    missing = [key for key, version in zip(keys, versions) if version is None]
+    if not missing:
+        return versions
+
+    # 동시에 여러 요청이 만들어도 먼저 쓴 값 하나만 남김
+    async with redis_db.pipeline(transaction=False) as pipe:
+        for key in missing:
+            pipe.set(key, _new_version(), nx=True)
+        await pipe.execute()
+    return await redis_db.mget(keys)
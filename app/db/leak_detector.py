@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+
+"""
+- pool 에서 꺼낸 연결마다 꺼낸 시각과 꺼낸 task 를 기록
+- DB_LEAK_THRESHOLD 보다 오래 반환되지 않은 연결은 주기적으로 확인하여 한 번만 경고를 남기고,
+  늦게라도 반환되면 얼마나 오래 잡혀 있었는지 남김
+- 세션을 닫지 않거나 트랜잭션 안에서 오래 기다리는 코드를 찾기 위해 사용
+"""
+logger = logging.getLogger(__name__)
+
+# 연결 record: (꺼낸 시각(monotonic), 꺼낸 task 이름)
+_checked_out: dict[object, tuple[float, str]] = {}
+_reported: set[object] = set()
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    try:
+        owner = asyncio.current_task().get_name()
+    except (RuntimeError, AttributeError):  # event loop 나 task 밖에서 꺼낸 경우
+        owner = "-"
+    _checked_out[connection_record] = (time.monotonic(), owner)
+
+
+def _on_checkin(dbapi_connection, connection_record) -> None:
+    checked_out = _checked_out.pop(connection_record, None)
+    if connection_record in _reported:
+        _reported.discard(connection_record)
+        held = time.monotonic() - checked_out[0] if checked_out else 0.0
+        logger.warning("db connection returned after %.1fs", held)
+
+
+def install_leak_detector(engine: AsyncEngine) -> None:
+    """
+    engine 의 pool 에서 연결을 꺼내고 돌려줄 때마다 기록하도록 등록하는 함수
+    Args:
+        engine: 감시할 engine
+    """
+    event.listen(engine.sync_engine.pool, "checkout", _on_checkout)
+    event.listen(engine.sync_engine.pool, "checkin", _on_checkin)
+
+
+def find_leaked_connections(
+    threshold: float = settings.DB_LEAK_THRESHOLD,
+) -> list[tuple[str, float]]:
+    """
+    threshold 보다 오래 반환되지 않은 연결을 찾아 처음 찾은 연결만 경고를 남기는 함수
+    Args:
+        threshold: 경고할 최소 시간(초)
+
+    Returns:
+        반환되지 않은 연결을 꺼낸 (task 이름, 지난 시간)
+    """
+    now = time.monotonic()
+    leaked = []
+    for record, (since, owner) in list(_checked_out.items()):
+        held = now - since
+        if held < threshold:
+            continue
+        leaked.append((owner, held))
+        if record not in _reported:
+            _reported.add(record)
+            logger.warning(
+                "db connection held for %.1fs without being returned (task: %s)",
+                held,
+                owner,
+            )
+    return leaked
+
+
+async def watch_leaked_connections(
+    interval: float = settings.DB_LEAK_CHECK_INTERVAL,
+) -> None:
+    """
+    반환되지 않은 연결을 주기적으로 확인하는 함수 (앱이 실행되는 동안 task 로 실행)
+    Args:
+        interval: 확인 간격(초)
+    """
+    while True:
+        await asyncio.sleep(interval)
+        find_leaked_connections()
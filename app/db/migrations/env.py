@@ -7,7 +7,7 @@ from alembic import context
 
 # 명시적으로 호출하기
 from app.db.database import Base
-from app.models import user, game, game_log
+from app.models import user, game, game_log, user_game_stats, game_similarity
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,59 @@
+"""add keyset pagination indexes in GameLog
+
+Revision ID: 3f1c9a7d2e64
+Revises: 915946009ad4
+Create Date: 2026-10-17 10:12:41.204311
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9a7d2e64"
+down_revision: Union[str, None] = "915946009ad4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = {
+    "ix_game_logs_date_id": ["date", "id"],
+    "ix_game_logs_user_name_date_id": ["user_name", "date", "id"],
+    "ix_game_logs_game_name_date_id": ["game_name", "date", "id"],
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # 운영 중인 테이블에 쓰기 잠금을 걸지 않도록 트랜잭션 밖에서 CONCURRENTLY 로 생성
+        with op.get_context().autocommit_block():
+            for name, columns in INDEXES.items():
+                op.create_index(
+                    name,
+                    "game_logs",
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, columns in INDEXES.items():
+            op.create_index(name, "game_logs", columns, unique=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name in reversed(INDEXES):
+                op.drop_index(
+                    name,
+                    table_name="game_logs",
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+    else:
+        for name in reversed(INDEXES):
+            op.drop_index(name, table_name="game_logs")
@@ -0,0 +1,66 @@
+"""partition game_logs by month
+
+PostgreSQL 에서는 항상 game_logs 를 월별 파티션 테이블로 변환 (다른 DB 는 변경 없음)
+기록을 새 테이블로 복사하고 인덱스를 다시 만드는 한 트랜잭션 동안 game_logs 에
+ACCESS EXCLUSIVE 잠금이 걸려 읽기와 쓰기가 모두 멈춤
+기록 수에 비례하는 중단 시간이 생기므로 서비스를 멈추고 적용
+
+Revision ID: 4b9d1e7c2f05
+Revises: e2a8f4c6d913
+Create Date: 2026-10-17 15:41:26.904517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.partition import (
+    convert_game_logs_to_partitioned,
+    convert_game_logs_to_unpartitioned,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4b9d1e7c2f05"
+down_revision: Union[str, None] = "e2a8f4c6d913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 이 리비전 시점의 game_logs 컬럼과 인덱스 (이후 모델 변경과 무관하게 고정)
+COLUMNS = (
+    "id",
+    "user_name",
+    "game_name",
+    "date",
+    "during_time",
+    "participant_num",
+    "subject",
+    "content",
+    "picture",
+)
+INDEXES = {
+    "ix_game_logs_id": "(id)",
+    "ix_game_logs_date_id": "(date, id)",
+    "ix_game_logs_user_name_date_id": "(user_name, date, id)",
+    "ix_game_logs_game_name_date_id": "(game_name, date, id)",
+    "ix_game_logs_user_name_game_name_date": "(user_name, game_name, date)",
+    "ix_game_logs_date_brin": "USING brin (date)",
+}
+# 변환할 때 미리 만들어 둘 미래 파티션 수 (이후는 tools/create_game_log_partitions.py 로 생성)
+MONTHS_AHEAD = 3
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    convert_game_logs_to_partitioned(
+        op.get_bind(), months_ahead=MONTHS_AHEAD, columns=COLUMNS, indexes=INDEXES
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    convert_game_logs_to_unpartitioned(op.get_bind(), columns=COLUMNS, indexes=INDEXES)
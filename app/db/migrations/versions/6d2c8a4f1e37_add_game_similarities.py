@@ -0,0 +1,47 @@
+"""add game_similarities
+
+Revision ID: 6d2c8a4f1e37
+Revises: 9e3f7b2a6c18
+Create Date: 2026-10-17 17:02:41.508216
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6d2c8a4f1e37"
+down_revision: Union[str, None] = "9e3f7b2a6c18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "game_similarities",
+        sa.Column("game_name", sa.String(), nullable=False),
+        sa.Column("similar_game_name", sa.String(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("common_user_num", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["game_name"], ["games.name"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["similar_game_name"], ["games.name"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("game_name", "similar_game_name"),
+    )
+    op.create_index(
+        "ix_game_similarities_game_name_score",
+        "game_similarities",
+        ["game_name", "score"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_game_similarities_game_name_score", table_name="game_similarities"
+    )
+    op.drop_table("game_similarities")
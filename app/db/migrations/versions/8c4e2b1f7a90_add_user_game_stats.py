@@ -0,0 +1,55 @@
+"""add user_game_stats
+
+Revision ID: 8c4e2b1f7a90
+Revises: 3f1c9a7d2e64
+Create Date: 2026-10-17 11:03:18.552904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4e2b1f7a90"
+down_revision: Union[str, None] = "3f1c9a7d2e64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_game_stats",
+        sa.Column("user_name", sa.String(), nullable=False),
+        sa.Column("game_name", sa.String(), nullable=False),
+        sa.Column("play_count", sa.Integer(), nullable=False),
+        sa.Column("total_during_time", sa.Integer(), nullable=False),
+        sa.Column("max_during_time", sa.Integer(), nullable=False),
+        sa.Column("total_participant_num", sa.Integer(), nullable=False),
+        sa.Column("first_played_at", sa.DateTime(), nullable=False),
+        sa.Column("last_played_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["game_name"], ["games.name"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_name"], ["users.name"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_name", "game_name"),
+    )
+
+    # 기존 게임 기록으로 통계를 채움
+    op.execute(
+        """
+        INSERT INTO user_game_stats (
+            user_name, game_name, play_count, total_during_time, max_during_time,
+            total_participant_num, first_played_at, last_played_at
+        )
+        SELECT user_name, game_name, COUNT(id), SUM(during_time), MAX(during_time),
+               SUM(participant_num), MIN(date), MAX(date)
+        FROM game_logs
+        WHERE user_name IS NOT NULL AND game_name IS NOT NULL
+        GROUP BY user_name, game_name
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_game_stats")
@@ -0,0 +1,91 @@
+"""add full text search in GameLog
+
+Revision ID: 9e3f7b2a6c18
+Revises: 4b9d1e7c2f05
+Create Date: 2026-10-17 16:12:48.337105
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e3f7b2a6c18"
+down_revision: Union[str, None] = "4b9d1e7c2f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 이 리비전 시점의 검색 DDL (이후 app.db.search 변경과 무관하게 고정)
+SEARCH_DOCUMENT = "subject || ' ' || coalesce(content, '')"
+
+POSTGRESQL_CREATE_EXTENSION = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+POSTGRESQL_INDEXES = {
+    "ix_game_logs_search_vector": f"to_tsvector('simple'::regconfig, {SEARCH_DOCUMENT})",
+    "ix_game_logs_search_trgm": f"({SEARCH_DOCUMENT}) gin_trgm_ops",
+}
+
+SQLITE_CREATE_SEARCH = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS game_logs_fts USING fts5("
+    "subject, content, content='game_logs', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS game_logs_fts_insert AFTER INSERT ON game_logs "
+    "BEGIN INSERT INTO game_logs_fts (rowid, subject, content) "
+    "VALUES (new.id, new.subject, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS game_logs_fts_delete AFTER DELETE ON game_logs "
+    "BEGIN INSERT INTO game_logs_fts (game_logs_fts, rowid, subject, content) "
+    "VALUES ('delete', old.id, old.subject, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS game_logs_fts_update "
+    "AFTER UPDATE OF subject, content ON game_logs "
+    "BEGIN INSERT INTO game_logs_fts (game_logs_fts, rowid, subject, content) "
+    "VALUES ('delete', old.id, old.subject, old.content); "
+    "INSERT INTO game_logs_fts (rowid, subject, content) "
+    "VALUES (new.id, new.subject, new.content); END",
+]
+SQLITE_REBUILD_SEARCH = "INSERT INTO game_logs_fts (game_logs_fts) VALUES ('rebuild')"
+SQLITE_DROP_SEARCH = [
+    "DROP TRIGGER IF EXISTS game_logs_fts_insert",
+    "DROP TRIGGER IF EXISTS game_logs_fts_delete",
+    "DROP TRIGGER IF EXISTS game_logs_fts_update",
+    "DROP TABLE IF EXISTS game_logs_fts",
+]
+
+
+def is_game_logs_partitioned() -> bool:
+    """game_logs 가 파티션 테이블인지 확인하는 함수"""
+    relkind = (
+        op.get_bind()
+        .execute(
+            sa.text("SELECT relkind FROM pg_class WHERE oid = to_regclass('game_logs')")
+        )
+        .scalar()
+    )
+    return relkind == "p"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(POSTGRESQL_CREATE_EXTENSION)
+        # 운영 중인 테이블에 쓰기 잠금을 걸지 않도록 트랜잭션 밖에서 CONCURRENTLY 로 생성
+        # (파티션 테이블은 CONCURRENTLY 를 지원하지 않음)
+        concurrently = not is_game_logs_partitioned()
+        with op.get_context().autocommit_block():
+            for name, expression in POSTGRESQL_INDEXES.items():
+                op.execute(
+                    f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}"
+                    f"IF NOT EXISTS {name} ON game_logs USING gin ({expression})"
+                )
+    else:
+        for statement in SQLITE_CREATE_SEARCH:
+            op.execute(statement)
+        op.execute(SQLITE_REBUILD_SEARCH)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        for name in POSTGRESQL_INDEXES:
+            op.execute(f"DROP INDEX IF EXISTS {name}")
+    else:
+        for statement in SQLITE_DROP_SEARCH:
+            op.execute(statement)
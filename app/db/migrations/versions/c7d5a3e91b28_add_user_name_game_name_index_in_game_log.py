@@ -0,0 +1,52 @@
+"""add (user_name, game_name, date) index in GameLog
+
+Revision ID: c7d5a3e91b28
+Revises: 8c4e2b1f7a90
+Create Date: 2026-10-17 13:27:09.118472
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d5a3e91b28"
+down_revision: Union[str, None] = "8c4e2b1f7a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_game_logs_user_name_game_name_date"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # 운영 중인 테이블에 쓰기 잠금을 걸지 않도록 트랜잭션 밖에서 CONCURRENTLY 로 생성
+        with op.get_context().autocommit_block():
+            op.create_index(
+                INDEX_NAME,
+                "game_logs",
+                ["user_name", "game_name", "date"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+    else:
+        op.create_index(
+            INDEX_NAME, "game_logs", ["user_name", "game_name", "date"], unique=False
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                INDEX_NAME,
+                table_name="game_logs",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    else:
+        op.drop_index(INDEX_NAME, table_name="game_logs")
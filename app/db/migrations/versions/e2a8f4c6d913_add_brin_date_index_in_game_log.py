@@ -0,0 +1,51 @@
+"""add BRIN date index in GameLog
+
+Revision ID: e2a8f4c6d913
+Revises: c7d5a3e91b28
+Create Date: 2026-10-17 14:05:52.730164
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a8f4c6d913"
+down_revision: Union[str, None] = "c7d5a3e91b28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_game_logs_date_brin"
+
+
+def upgrade() -> None:
+    # SQLite 는 BRIN 이 없으므로 기존 (date, id) btree 인덱스로 범위 검색
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "game_logs",
+            ["date"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="game_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,226 @@
+from collections.abc import Mapping, Sequence
+from datetime import date, timedelta
+
+from sqlalchemy import Connection, text
+
+"""
+- PostgreSQL 에서 game_logs 를 date 기준 월별 파티션으로 나눠 관리
+- 오래된 달은 파티션 단위로 vacuum, 삭제되고, date 범위 조회는 필요한 달만 읽음 (partition pruning)
+- 범위에 맞는 파티션이 없는 기록은 game_logs_default 에 저장
+  default 에 이미 들어간 달의 파티션은 만들 수 없으므로 미리 create_game_log_partitions 를 실행
+- 일반 테이블과 파티션 테이블 사이의 변환은 마이그레이션(4b9d1e7c2f05)에서만 실행
+  변환하는 트랜잭션 동안 game_logs 에 ACCESS EXCLUSIVE 잠금이 걸려 읽기와 쓰기가 모두 멈추므로
+  기록 수에 비례하는 중단 시간이 생김
+"""
+TABLE_NAME = "game_logs"
+DEFAULT_PARTITION_NAME = f"{TABLE_NAME}_default"
+UNPARTITIONED_TABLE_NAME = f"{TABLE_NAME}_unpartitioned"
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _next_month(value: date) -> date:
+    return (value.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def partition_name(month: date) -> str:
+    """
+    특정 달의 파티션 이름을 반환하는 함수
+    Args:
+        month: 파티션에 포함되는 날짜
+
+    Returns:
+        game_logs_y2025m04 형식의 파티션 이름
+    """
+    return f"{TABLE_NAME}_y{month.year}m{month.month:02d}"
+
+
+def is_game_logs_partitioned(connection: Connection) -> bool:
+    """
+    game_logs 가 파티션 테이블인지 확인하는 함수
+    Args:
+        connection: PostgreSQL Connection
+
+    Returns:
+        파티션 테이블 여부
+    """
+    relkind = connection.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": TABLE_NAME},
+    ).scalar()
+    return relkind == "p"
+
+
+def create_game_log_partitions(
+    connection: Connection, start: date, months_ahead: int
+) -> list[str]:
+    """
+    start 가 속한 달부터 이번 달 이후 months_ahead 달까지 월별 파티션을 만드는 함수
+    이미 있는 파티션은 건너뜀
+    Args:
+        connection: PostgreSQL Connection
+        start: 파티션을 만들기 시작할 날짜
+        months_ahead: 이번 달 이후로 미리 만들어 둘 달의 수
+
+    Returns:
+        만든(또는 이미 있던) 파티션 이름
+    """
+    end = _month_start(date.today())
+    for _ in range(months_ahead):
+        end = _next_month(end)
+
+    names = []
+    month = _month_start(start)
+    while month <= end:
+        next_month = _next_month(month)
+        names.append(partition_name(month))
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+                f"PARTITION OF {TABLE_NAME} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+            )
+        )
+        month = next_month
+
+    connection.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION_NAME} "
+            f"PARTITION OF {TABLE_NAME} DEFAULT"
+        )
+    )
+    return names
+
+
+def _swap_game_logs_table(
+    connection: Connection, partition_by: str, index_names: Sequence[str]
+) -> date | None:
+    """
+    기존 game_logs 를 옮겨두고 같은 구조의 새 game_logs 를 만드는 함수
+    Args:
+        connection: PostgreSQL Connection
+        partition_by: 새 테이블의 PARTITION BY 절 (일반 테이블이면 빈 문자열)
+        index_names: 새 테이블에 다시 만들 인덱스 이름
+
+    Returns:
+        기존 기록 중 가장 오래된 작성 일시
+    """
+    connection.execute(
+        text(f"ALTER TABLE {TABLE_NAME} RENAME TO {UNPARTITIONED_TABLE_NAME}")
+    )
+    # 새 테이블과 이름이 겹치는 인덱스와 기본 키 제거 (데이터 복사 후 새 테이블에 다시 생성)
+    for name in index_names:
+        connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    connection.execute(
+        text(
+            f"ALTER TABLE {UNPARTITIONED_TABLE_NAME} "
+            f"DROP CONSTRAINT IF EXISTS {TABLE_NAME}_pkey"
+        )
+    )
+
+    connection.execute(
+        text(
+            f"CREATE TABLE {TABLE_NAME} (LIKE {UNPARTITIONED_TABLE_NAME} "
+            f"INCLUDING DEFAULTS INCLUDING GENERATED) {partition_by}"
+        )
+    )
+    # 파티션 테이블의 기본 키는 파티션 키를 포함해야 함
+    primary_key = "id, date" if partition_by else "id"
+    connection.execute(
+        text(f"ALTER TABLE {TABLE_NAME} ADD PRIMARY KEY ({primary_key})")
+    )
+    connection.execute(
+        text(
+            f"ALTER TABLE {TABLE_NAME} ADD FOREIGN KEY (user_name) "
+            "REFERENCES users (name) ON DELETE CASCADE"
+        )
+    )
+    connection.execute(
+        text(
+            f"ALTER TABLE {TABLE_NAME} ADD FOREIGN KEY (game_name) "
+            "REFERENCES games (name) ON DELETE CASCADE"
+        )
+    )
+    # 기존 테이블을 지워도 id 시퀀스가 남도록 소유권 이전
+    connection.execute(
+        text(f"ALTER SEQUENCE {TABLE_NAME}_id_seq OWNED BY {TABLE_NAME}.id")
+    )
+
+    return connection.execute(
+        text(f"SELECT MIN(date) FROM {UNPARTITIONED_TABLE_NAME}")
+    ).scalar()
+
+
+def _copy_and_drop_unpartitioned(
+    connection: Connection, columns: Sequence[str], indexes: Mapping[str, str]
+) -> None:
+    """
+    옮겨둔 기존 game_logs 의 기록을 새 테이블로 복사하고, 인덱스를 다시 만드는 함수
+    Args:
+        connection: PostgreSQL Connection
+        columns: 복사할 컬럼 이름
+        indexes: 다시 만들 인덱스 (인덱스 이름: USING 절과 인덱스 식)
+    """
+    column_list = ", ".join(columns)
+    connection.execute(
+        text(
+            f"INSERT INTO {TABLE_NAME} ({column_list}) "
+            f"SELECT {column_list} FROM {UNPARTITIONED_TABLE_NAME}"
+        )
+    )
+    connection.execute(text(f"DROP TABLE {UNPARTITIONED_TABLE_NAME}"))
+    for name, definition in indexes.items():
+        connection.execute(text(f"CREATE INDEX {name} ON {TABLE_NAME} {definition}"))
+
+
+def convert_game_logs_to_partitioned(
+    connection: Connection,
+    months_ahead: int,
+    columns: Sequence[str],
+    indexes: Mapping[str, str],
+) -> None:
+    """
+    일반 테이블인 game_logs 를 월별 파티션 테이블로 바꾸는 함수
+    이미 파티션 테이블이면 아무것도 하지 않음
+    기록을 모두 복사하고 인덱스를 다시 만드는 동안 game_logs 가 잠김
+    Args:
+        connection: PostgreSQL Connection
+        months_ahead: 이번 달 이후로 미리 만들어 둘 달의 수
+        columns: 복사할 컬럼 이름
+        indexes: 다시 만들 인덱스 (인덱스 이름: USING 절과 인덱스 식)
+    """
+    if is_game_logs_partitioned(connection):
+        return
+
+    oldest = _swap_game_logs_table(
+        connection, partition_by="PARTITION BY RANGE (date)", index_names=list(indexes)
+    )
+    create_game_log_partitions(
+        connection,
+        start=oldest.date() if oldest else date.today(),
+        months_ahead=months_ahead,
+    )
+    _copy_and_drop_unpartitioned(connection, columns, indexes)
+
+
+def convert_game_logs_to_unpartitioned(
+    connection: Connection,
+    columns: Sequence[str],
+    indexes: Mapping[str, str],
+) -> None:
+    """
+    월별 파티션 테이블인 game_logs 를 일반 테이블로 되돌리는 함수
+    이미 일반 테이블이면 아무것도 하지 않음
+    기록을 모두 복사하고 인덱스를 다시 만드는 동안 game_logs 가 잠김
+    Args:
+        connection: PostgreSQL Connection
+        columns: 복사할 컬럼 이름
+        indexes: 다시 만들 인덱스 (인덱스 이름: USING 절과 인덱스 식)
+    """
+    if not is_game_logs_partitioned(connection):
+        return
+
+    _swap_game_logs_table(connection, partition_by="", index_names=list(indexes))
+    _copy_and_drop_unpartitioned(connection, columns, indexes)  # 파티션도 함께 삭제됨
@@ -0,0 +1,46 @@
+"""
+- 게임 기록의 subject, content 전문 검색에 쓰는 SQL
+- 한국어는 형태소 분석 없이도 부분 문자열로 찾을 수 있도록 trigram 으로 색인
+- PostgreSQL: tsvector 식 인덱스(단어 검색, 순위) + pg_trgm 식 인덱스(부분 문자열 검색)
+- SQLite: game_logs 와 trigger 로 동기화되는 FTS5 trigram 테이블
+"""
+
+# 검색 대상 문서 (인덱스의 식과 검색 쿼리의 식이 같아야 인덱스를 사용함)
+SEARCH_DOCUMENT = "subject || ' ' || coalesce(content, '')"
+SEARCH_VECTOR = f"to_tsvector('simple'::regconfig, {SEARCH_DOCUMENT})"
+
+# trigram 은 3글자 이상이어야 색인에서 찾을 수 있음
+TRIGRAM_MIN_LENGTH = 3
+
+FTS_TABLE_NAME = "game_logs_fts"
+
+POSTGRESQL_CREATE_EXTENSION = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+
+SQLITE_CREATE_SEARCH = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE_NAME} USING fts5("
+    "subject, content, content='game_logs', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_insert AFTER INSERT ON game_logs "
+    f"BEGIN INSERT INTO {FTS_TABLE_NAME} (rowid, subject, content) "
+    "VALUES (new.id, new.subject, new.content); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_delete AFTER DELETE ON game_logs "
+    f"BEGIN INSERT INTO {FTS_TABLE_NAME} ({FTS_TABLE_NAME}, rowid, subject, content) "
+    "VALUES ('delete', old.id, old.subject, old.content); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_update "
+    "AFTER UPDATE OF subject, content ON game_logs "
+    f"BEGIN INSERT INTO {FTS_TABLE_NAME} ({FTS_TABLE_NAME}, rowid, subject, content) "
+    "VALUES ('delete', old.id, old.subject, old.content); "
+    f"INSERT INTO {FTS_TABLE_NAME} (rowid, subject, content) "
+    "VALUES (new.id, new.subject, new.content); END",
+]
+
+# 기존 기록을 FTS 테이블에 다시 색인
+SQLITE_REBUILD_SEARCH = (
+    f"INSERT INTO {FTS_TABLE_NAME} ({FTS_TABLE_NAME}) VALUES ('rebuild')"
+)
+
+SQLITE_DROP_SEARCH = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE_NAME}_insert",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE_NAME}_delete",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE_NAME}_update",
+    f"DROP TABLE IF EXISTS {FTS_TABLE_NAME}",
+]
@@ -1,15 +1,28 @@
-from redis.asyncio import Redis
+import asyncio
+from contextlib import AsyncExitStack
+
+from redis.asyncio import Redis, BlockingConnectionPool
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.config import settings
+from app.db.leak_detector import install_leak_detector
 
 # SQLAlchemy 비동기 엔진 생성
 """
 - SQLAlchemy가 엔진을 사용해서 DB와 소통
-- echo는 SQL 실행 로그를 출력하는 옵션. 개발 중에 켜두면 디버깅에 도움
+- SQL 로그는 echo 대신 SQL_LOG_ENABLED 일 때 lifespan 에서 등록 (app.db.sql_log)
+- 연결은 worker 마다 pool 로 재사용하며, 앱 시작 시 미리 맺고 종료 시 lifespan 에서 닫음
 """
-async_engine = create_async_engine(settings.DATABASE_URL, echo=True)
+async_engine = create_async_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+install_leak_detector(async_engine)
 
 # 세션 팩토리 생성
 """
@@ -22,10 +35,49 @@ AsyncSessionLocal = sessionmaker(
     bind=async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
+
+async def warm_up_db_pool(count: int = settings.DB_POOL_WARMUP) -> int:
+    """
+    배포 직후 첫 요청들이 연결을 맺느라 느려지지 않도록 pool 에 연결을 미리 맺어 두는 함수
+    Args:
+        count: 맺어 둘 연결 수 (DB_POOL_SIZE 를 넘으면 DB_POOL_SIZE 만큼)
+
+    Returns:
+        pool 에 들어 있는 연결 수
+    """
+    count = min(count, settings.DB_POOL_SIZE)
+    # 동시에 꺼내야 서로 다른 연결이 맺어지며, 다 맺은 뒤 한 번에 pool 로 돌려줌
+    # 하나가 실패해도 나머지는 끝까지 기다려, 맺어진 연결을 모두 돌려준 뒤 오류를 올림
+    results = await asyncio.gather(
+        *(async_engine.connect().start() for _ in range(count)),
+        return_exceptions=True,
+    )
+    async with AsyncExitStack() as stack:
+        for result in results:
+            if not isinstance(result, BaseException):
+                stack.push_async_callback(result.close)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+    return async_engine.pool.checkedin()
+
+
 # redis 연결 객체
-RedisClient = Redis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=settings.REDIS_DATABASE,
-    decode_responses=True,  # 문자열(utf-8)로 자동 변환 / 기본값은 바이트 형태
+"""
+- worker 마다 하나의 connection pool 을 모든 요청이 공유 (연결은 처음 사용할 때 생성)
+- 요청이 끝나도 연결을 닫지 않고 pool 에 돌려주며, 앱이 종료될 때 lifespan 에서 한 번에 닫음
+- 연결이 모두 사용 중이면 오류 대신 REDIS_POOL_TIMEOUT 까지 반환되기를 기다림
+"""
+RedisClient = Redis.from_pool(
+    BlockingConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DATABASE,
+        decode_responses=True,  # 문자열(utf-8)로 자동 변환 / 기본값은 바이트 형태
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    )
 )
@@ -0,0 +1,121 @@
+import json
+import logging
+import random
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.core.request_id import request_id_var
+
+"""
+- engine 의 echo 대신 cursor 실행 event 로 쿼리 시간을 재어 JSON 한 줄씩 남기는 SQL 로그
+- 모든 쿼리 중 SQL_LOG_SAMPLE_RATE 만큼만 남기고, SQL_LOG_SLOW_THRESHOLD 이상 걸린 쿼리는 항상 경고로 남김
+- 요청 처리 중에는 로그 record 를 queue 에 넣기만 하고, 출력은 QueueListener 스레드에서 함
+- 쿼리 인자는 기본으로 값 대신 타입만 남기며, 요청 id 로 같은 요청의 쿼리를 묶을 수 있음
+"""
+MAX_STATEMENT_LENGTH = 2000
+
+logger = logging.getLogger("app.sql")
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+class SqlLogFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        """SQL 로그 record 를 JSON 한 줄로 만드는 함수"""
+        return json.dumps(
+            {
+                "time": self.formatTime(record),
+                "level": record.levelname,
+                **getattr(record, "sql", {}),
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+
+
+def _redact(parameters: Any) -> Any:
+    if isinstance(parameters, dict):
+        return {key: _redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact(value) for value in parameters]
+    return type(parameters).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 실행마다 만들어지는 context 에 기록하므로 실패한 쿼리의 시각이 남지 않음
+    context.sql_log_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - context.sql_log_started_at
+    slow = duration >= settings.SQL_LOG_SLOW_THRESHOLD
+    if not slow and random.random() >= settings.SQL_LOG_SAMPLE_RATE:
+        return
+
+    logger.log(
+        logging.WARNING if slow else logging.INFO,
+        "sql",
+        extra={
+            "sql": {
+                "request_id": request_id_var.get(),
+                "duration_ms": round(duration * 1000, 3),
+                "slow": slow,
+                "executemany": executemany,
+                "rowcount": cursor.rowcount,
+                "statement": statement[:MAX_STATEMENT_LENGTH],
+                "parameters": (
+                    _redact(parameters)
+                    if settings.SQL_LOG_REDACT_PARAMETERS
+                    else parameters
+                ),
+            }
+        },
+    )
+
+
+def install_sql_logging(engine: AsyncEngine, *handlers: logging.Handler) -> None:
+    """
+    engine 의 쿼리를 SQL 로그로 남기도록 등록하는 함수 (앱 시작 시 호출)
+    Args:
+        engine: 쿼리를 남길 engine
+        handlers: 로그를 받을 handler, 없으면 표준 출력에 JSON 으로 출력
+    """
+    global _listener, _queue_handler
+    if not handlers:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(SqlLogFormatter())
+        handlers = (stream_handler,)
+
+    queue = SimpleQueue()
+    _queue_handler = QueueHandler(queue)
+    _listener = QueueListener(queue, *handlers)
+    _listener.start()
+    logger.addHandler(_queue_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def uninstall_sql_logging(engine: AsyncEngine) -> None:
+    """
+    SQL 로그 등록을 해제하고 queue 에 남은 로그를 모두 출력하는 함수 (앱 종료 시 호출)
+    Args:
+        engine: 쿼리를 남기던 engine
+    """
+    global _listener, _queue_handler
+    event.remove(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    if _listener is not None:
+        _listener.stop()
+        logger.removeHandler(_queue_handler)
+        _listener = _queue_handler = None
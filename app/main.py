@@ -1,10 +1,41 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.api.v1.router import api_router
+from app.core.process_pool import shutdown_process_pool
+from app.core.pubsub import listen_invalidations
+from app.core.request_id import RequestIdMiddleware
+from app.db.leak_detector import watch_leaked_connections
+from app.db.session import RedisClient, async_engine, warm_up_db_pool
+from app.db.sql_log import install_sql_logging, uninstall_sql_logging
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작, 종료 시 공용 자원을 준비하고 정리하는 함수"""
+    if settings.SQL_LOG_ENABLED:
+        install_sql_logging(async_engine)
+    await warm_up_db_pool()
+    leak_watcher = asyncio.create_task(watch_leaked_connections())
+    # 다른 worker 의 변경 알림으로 worker 캐시(게임 목록, 인증)를 비움
+    invalidation_listener = asyncio.create_task(listen_invalidations(RedisClient))
+    yield
+    for task in (invalidation_listener, leak_watcher):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await RedisClient.aclose()  # pool 의 모든 연결을 닫음
+    await async_engine.dispose()
+    if settings.SQL_LOG_ENABLED:
+        uninstall_sql_logging(async_engine)
+    shutdown_process_pool()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # CORS 해결
 origins = [f"http://{settings.BASE_IP}", settings.FRONTEND_URL]
@@ -15,6 +46,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
+app.add_middleware(RequestIdMiddleware)
 
 app.include_router(api_router, prefix="/api")
@@ -1,11 +1,52 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    ForeignKey,
+    DateTime,
+    Text,
+    Index,
+    DDL,
+    event,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
+from app.db.search import (
+    SEARCH_DOCUMENT,
+    SEARCH_VECTOR,
+    POSTGRESQL_CREATE_EXTENSION,
+    SQLITE_CREATE_SEARCH,
+    SQLITE_DROP_SEARCH,
+)
 
 
 class GameLog(Base):
     __tablename__ = "game_logs"
+    __table_args__ = (
+        # 목록 API 의 keyset pagination 정렬 순서 (date, id) 와 일치하는 인덱스
+        Index("ix_game_logs_date_id", "date", "id"),
+        Index("ix_game_logs_user_name_date_id", "user_name", "date", "id"),
+        Index("ix_game_logs_game_name_date_id", "game_name", "date", "id"),
+        # 사용자의 특정 게임 기록 목록과 사용자별 게임 통계 재계산
+        Index(
+            "ix_game_logs_user_name_game_name_date", "user_name", "game_name", "date"
+        ),
+        # 거의 시간순으로만 쌓이는 date 의 범위 검색용 (SQLite 는 ix_game_logs_date_id 사용)
+        Index("ix_game_logs_date_brin", "date", postgresql_using="brin").ddl_if(
+            dialect="postgresql"
+        ),
+        # subject, content 전문 검색 (SQLite 는 FTS5 테이블 사용)
+        Index(
+            "ix_game_logs_search_vector", text(SEARCH_VECTOR), postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_game_logs_search_trgm",
+            text(f"({SEARCH_DOCUMENT}) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_name = Column(
@@ -23,3 +64,18 @@ class GameLog(Base):
 
     user = relationship("User", back_populates="played_the_games")
     game = relationship("Game", back_populates="logs")
+
+
+event.listen(
+    GameLog.__table__,
+    "before_create",
+    DDL(POSTGRESQL_CREATE_EXTENSION).execute_if(dialect="postgresql"),
+)
+for statement in SQLITE_CREATE_SEARCH:
+    event.listen(
+        GameLog.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite")
+    )
+for statement in SQLITE_DROP_SEARCH:
+    event.listen(
+        GameLog.__table__, "before_drop", DDL(statement).execute_if(dialect="sqlite")
+    )
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index
+
+from app.db.database import Base
+
+
+class GameSimilarity(Base):
+    __tablename__ = "game_similarities"
+    __table_args__ = (
+        # 비슷한 게임 목록 조회 (유사도 높은 순)
+        Index("ix_game_similarities_game_name_score", "game_name", "score"),
+    )
+
+    # 게임마다 가장 비슷한 게임 RECOMMENDATION_TOP_K 개를 저장하는 배치 결과 테이블
+    game_name = Column(
+        String, ForeignKey("games.name", ondelete="CASCADE"), primary_key=True
+    )  # 기준 게임의 이름
+    similar_game_name = Column(
+        String, ForeignKey("games.name", ondelete="CASCADE"), primary_key=True
+    )  # 비슷한 게임의 이름
+    score = Column(
+        Float, nullable=False
+    )  # 두 게임을 플레이한 사용자 집합의 cosine 유사도
+    common_user_num = Column(
+        Integer, nullable=False
+    )  # 두 게임을 모두 플레이한 사용자 수
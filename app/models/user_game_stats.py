@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+
+from app.db.database import Base
+
+
+class UserGameStats(Base):
+    __tablename__ = "user_game_stats"
+
+    # 사용자와 게임 쌍마다 하나의 행을 가지는 집계 테이블
+    user_name = Column(
+        String, ForeignKey("users.name", ondelete="CASCADE"), primary_key=True
+    )  # 기록한 사용자의 이름
+    game_name = Column(
+        String, ForeignKey("games.name", ondelete="CASCADE"), primary_key=True
+    )  # 기록된 게임의 이름
+    play_count = Column(Integer, nullable=False)  # 플레이 횟수
+    total_during_time = Column(Integer, nullable=False)  # 총 플레이 시간
+    max_during_time = Column(Integer, nullable=False)  # 가장 길었던 플레이 시간
+    total_participant_num = Column(Integer, nullable=False)  # 평균 인원 계산용 합계
+    first_played_at = Column(DateTime, nullable=False)  # 처음 기록한 일시
+    last_played_at = Column(DateTime, nullable=False)  # 마지막으로 기록한 일시
@@ -1,6 +1,11 @@
-from pydantic import BaseModel, field_validator
+from dataclasses import dataclass
+from typing import Literal
+
+from pydantic import BaseModel, Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
+from app.config import settings
+
 
 class Game(BaseModel):
     id: int
@@ -21,6 +26,15 @@ class GameResponse(BaseModel):
         exclude = {"id"}
 
 
+@dataclass(slots=True)
+class GameRow:
+    # db 에서 읽은 값을 검증 없이 GameResponse 와 같은 JSON 으로 보내는 목록용 객체
+    name: str
+    weight: float
+    max_possible_num: int
+    min_possible_num: int
+
+
 class GameCreate(BaseModel):
     name: str
     weight: float
@@ -53,3 +67,58 @@ class GameUpdate(BaseModel):
     weight: float = None
     max_possible_num: int = None
     min_possible_num: int = None
+
+
+class LeaderboardParams(BaseModel):
+    by: Literal["plays", "minutes"] = "plays"  # 플레이 수 또는 플레이 시간(분)
+    limit: int = Field(
+        default=settings.LEADERBOARD_SIZE, ge=1, le=settings.LEADERBOARD_MAX_SIZE
+    )
+
+
+class LeaderboardEntry(BaseModel):
+    name: str  # 게임 또는 사용자 이름
+    score: int
+
+
+class TrendingParams(BaseModel):
+    window: str = "24h"  # TRENDING_WINDOWS 의 기간 이름
+    limit: int = Field(
+        default=settings.LEADERBOARD_SIZE, ge=1, le=settings.LEADERBOARD_MAX_SIZE
+    )
+
+    @field_validator("window")
+    def check_window(cls, v: str) -> str:
+        if v not in settings.TRENDING_WINDOWS:
+            raise ValueError(
+                f"window 는 {', '.join(settings.TRENDING_WINDOWS)} 중 하나여야 합니다."
+            )
+        return v
+
+
+class TrendingEntry(BaseModel):
+    name: str  # 게임 이름
+    score: float  # 최근 bucket 일수록 가중치가 큰 플레이 수
+
+
+class RecommendationParams(BaseModel):
+    limit: int = Field(
+        default=settings.RECOMMENDATION_SIZE, ge=1, le=settings.RECOMMENDATION_TOP_K
+    )
+
+
+class SimilarGame(BaseModel):
+    name: str  # 게임 이름
+    score: float  # 유사도 또는 추천 점수
+
+
+class NearestGameParams(BaseModel):
+    participant_num: int | None = Field(default=None, ge=1)  # 플레이할 인원
+    limit: int = Field(
+        default=settings.NEAREST_GAME_SIZE, ge=1, le=settings.NEAREST_GAME_MAX_SIZE
+    )
+
+
+class NearestGame(BaseModel):
+    name: str  # 게임 이름
+    distance: float  # 표준화한 속성 사이의 거리
@@ -1,6 +1,13 @@
-from pydantic import BaseModel, field_validator
+from datetime import datetime
+from typing import Any, Literal
 
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from app.config import settings
+from app.schemas.game import GameResponse
+from app.schemas.user import UserResponse
 from app.core.exceptions import NotAcceptableException
+from app.db.search import TRIGRAM_MIN_LENGTH
 
 
 class GameLog(BaseModel):
@@ -14,6 +21,63 @@ class GameLog(BaseModel):
     picture: str | None = None
 
 
+class GameLogResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_name: str
+    game_name: str
+    date: datetime
+    during_time: int
+    participant_num: int
+    subject: str
+    content: str | None = None
+    picture: str | None = None
+
+
+# 목록 API 의 fields 로 고를 수 있는 필드
+GAME_LOG_FIELDS = (
+    "id",
+    "user_name",
+    "game_name",
+    "date",
+    "during_time",
+    "participant_num",
+    "subject",
+    "content",
+    "picture",
+)
+# fields 가 없을 때 보내는 필드 (길이가 긴 content, picture 제외)
+GAME_LOG_SUMMARY_FIELDS = GAME_LOG_FIELDS[:7]
+# include 로 함께 받을 수 있는 관련 데이터와 그 key 필드
+GAME_LOG_RELATIONS = {"game": "game_name", "user": "user_name"}
+
+
+class GameLogListItem(BaseModel):
+    # fields 로 고른 필드와 include 로 요청한 관련 데이터만 응답에 포함
+    id: int
+    user_name: str = None
+    game_name: str = None
+    date: datetime = None
+    during_time: int = None
+    participant_num: int = None
+    subject: str = None
+    content: str | None = None
+    picture: str | None = None
+    game: GameResponse | None = None
+    user: UserResponse | None = None
+
+
+class GameLogPage(BaseModel):
+    items: list[GameLogListItem]
+    next_cursor: str | None = None  # 마지막 페이지면 None
+
+
+class GameLogSearchPage(BaseModel):
+    items: list[GameLogListItem]
+    next_offset: int | None = None  # 마지막 페이지면 None
+
+
 class GameLogCreate(BaseModel):
     game_name: str
     during_time: int
@@ -37,6 +101,34 @@ class GameLogCreate(BaseModel):
         return v
 
 
+class GameLogBulkCreate(BaseModel):
+    # 항목별로 오류를 알려주기 위해 각 기록은 GameLogCreate 로 따로 검증
+    game_logs: list[dict[str, Any]] = Field(
+        min_length=1, max_length=settings.GAME_LOG_BULK_MAX_SIZE
+    )
+
+
+class GameLogBulkError(BaseModel):
+    index: int  # 요청한 game_logs 에서의 위치
+    detail: Any
+
+
+class GameLogBulkResult(BaseModel):
+    created: int
+    errors: list[GameLogBulkError]
+
+
+class GameLogImportError(BaseModel):
+    row: int  # header 를 제외한 CSV 행 번호
+    detail: Any
+
+
+class GameLogImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: list[GameLogImportError]
+
+
 class GameLogUpdate(BaseModel):
     game_name: str = None
     during_time: int = None
@@ -44,3 +136,105 @@ class GameLogUpdate(BaseModel):
     subject: str = None
     content: str | None = None
     picture: str | None = None
+
+
+class GameLogFilterParams(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    order: Literal["desc", "asc"] = "desc"  # (date, id) 정렬 방향
+    date_from: datetime | None = Field(default=None, alias="from")  # 이 일시부터
+    date_to: datetime | None = Field(default=None, alias="to")  # 이 일시 전까지
+
+    @field_validator("date_from", "date_to")
+    def to_local_time(cls, v: datetime | None) -> datetime | None:
+        # 기록은 서버 시간대 기준으로 저장되어 있음
+        if v and v.tzinfo:
+            return v.astimezone().replace(tzinfo=None)
+        return v
+
+    @model_validator(mode="after")
+    def check_date_range(self) -> "GameLogFilterParams":
+        if self.date_from and self.date_to and self.date_from >= self.date_to:
+            raise ValueError("from 은 to 보다 이전이어야 합니다.")
+        return self
+
+
+class GameLogFieldsParams(BaseModel):
+    # summary(기본), detail(모든 필드) 또는 쉼표로 구분한 필드 이름
+    fields: str = "summary"
+    # 쉼표로 구분한 관련 데이터 이름 (game, user)
+    include: str = ""
+
+    @field_validator("fields")
+    def check_fields(cls, v: str) -> str:
+        if v not in ("summary", "detail"):
+            unknown = {field.strip() for field in v.split(",")} - set(GAME_LOG_FIELDS)
+            if unknown:
+                raise ValueError(f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}")
+        return v
+
+    @field_validator("include")
+    def check_include(cls, v: str) -> str:
+        unknown = {name.strip() for name in v.split(",") if name.strip()} - set(
+            GAME_LOG_RELATIONS
+        )
+        if unknown:
+            raise ValueError(
+                f"알 수 없는 관련 데이터입니다: {', '.join(sorted(unknown))}"
+            )
+        return v
+
+    @property
+    def selected_fields(self) -> tuple[str, ...]:
+        """응답에 포함할 필드 (id 는 항상 포함)"""
+        if self.fields == "summary":
+            return GAME_LOG_SUMMARY_FIELDS
+        if self.fields == "detail":
+            return GAME_LOG_FIELDS
+        fields = {"id"} | {field.strip() for field in self.fields.split(",")}
+        return tuple(field for field in GAME_LOG_FIELDS if field in fields)
+
+    @property
+    def included(self) -> tuple[str, ...]:
+        """응답에 포함할 관련 데이터"""
+        names = {name.strip() for name in self.include.split(",")}
+        return tuple(name for name in GAME_LOG_RELATIONS if name in names)
+
+    @property
+    def loaded_fields(self) -> tuple[str, ...]:
+        """db 에서 읽어야 하는 필드 (관련 데이터의 key 필드 포함)"""
+        fields = set(self.selected_fields)
+        fields |= {GAME_LOG_RELATIONS[name] for name in self.included}
+        return tuple(field for field in GAME_LOG_FIELDS if field in fields)
+
+
+class GameLogPageParams(GameLogFilterParams, GameLogFieldsParams):
+    cursor: str | None = None  # 이전 응답의 next_cursor
+    limit: int = Field(
+        default=settings.GAME_LOG_PAGE_SIZE, ge=1, le=settings.GAME_LOG_MAX_PAGE_SIZE
+    )
+
+
+class GameLogSearchParams(GameLogFieldsParams):
+    q: str = Field(
+        min_length=1, max_length=100
+    )  # 공백으로 나눈 단어를 모두 포함하는 기록 검색
+    limit: int = Field(
+        default=settings.GAME_LOG_PAGE_SIZE, ge=1, le=settings.GAME_LOG_MAX_PAGE_SIZE
+    )
+    offset: int = Field(default=0, ge=0, le=settings.GAME_LOG_SEARCH_MAX_OFFSET)
+
+    @field_validator("q")
+    def not_blank(cls, v: str) -> str:
+        if not v.strip():
+            raise ValueError("검색어가 비어 있습니다.")
+        # 짧은 단어만으로는 색인을 쓸 수 없어 전체 기록을 읽어야 하므로 거절
+        if all(len(word) < TRIGRAM_MIN_LENGTH for word in v.split()):
+            raise ValueError(
+                f"검색어에 {TRIGRAM_MIN_LENGTH}글자 이상인 단어가 하나 이상 있어야 합니다."
+            )
+        return v.strip()
+
+
+class GameLogExportParams(GameLogFilterParams):
+    format: Literal["ndjson", "csv"] = "ndjson"
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, field_validator, EmailStr
+from dataclasses import dataclass
+from datetime import datetime
+from pydantic import BaseModel, Field, field_validator, computed_field, EmailStr
 from pydantic_core.core_schema import ValidationInfo
 from typing import Optional
 
@@ -20,6 +22,39 @@ class UserResponse(BaseModel):
         exclude = {"id", "password"}
 
 
+@dataclass(slots=True)
+class UserRow:
+    # db 에서 읽은 값을 검증 없이 UserResponse 와 같은 JSON 으로 보내는 목록용 객체
+    name: str
+    email: str
+
+
+@dataclass(slots=True, frozen=True)
+class Principal:
+    # 인증한 토큰의 사용자, worker 마다 캐시되어 요청 사이에 공유되므로 수정하지 않음
+    name: str
+    email: str
+    is_admin: bool
+
+
+class UserGameStatsResponse(BaseModel):
+    game_name: str
+    play_count: int
+    total_during_time: int
+    max_during_time: int
+    total_participant_num: int = Field(exclude=True)
+    first_played_at: datetime
+    last_played_at: datetime
+
+    @computed_field
+    @property
+    def avg_participant_num(self) -> float:
+        return self.total_participant_num / self.play_count
+
+    class Config:
+        from_attributes = True
+
+
 class UserCreate(BaseModel):
     name: str
     password: str
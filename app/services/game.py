@@ -1,19 +1,70 @@
+import asyncio
+
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.game_catalog import (
+    get_game_catalog,
+    set_game_catalog,
+    game_catalog_generation,
+)
+from app.core.game_index import (
+    get_game_index,
+    set_game_index,
+    game_index_generation,
+)
 from app.core.exceptions import NotFoundException, ConflictException
 from app.models.game import Game
-from app.crud.game import get_game_in_db
+from app.schemas.game import GameRow
+from app.crud.game import (
+    get_game_in_db,
+    get_game_rows_in_db,
+    get_game_features_in_db,
+)
+
+GAME_LIST_ADAPTER = TypeAdapter(list[GameRow])
+
+_game_catalog_lock = asyncio.Lock()
+_game_index_lock = asyncio.Lock()
+
+
+async def is_existing_game(db: AsyncSession, game_name: str) -> GameRow:
+    """
+    존재하는 게임인지 worker 의 게임 캐시로 확인하는 함수
+    캐시가 없거나 오래되었으면 동시에 들어온 요청 중 하나만 db 에서 전체 게임을 읽음
+    Args:
+        db: AsyncSession
+        game_name: 찾고자 하는 게임 이름
+
+    Returns:
+        찾은 게임의 정보 (수정, 삭제할 게임은 get_existing_game_in_db 사용)
+    """
+    catalog = get_game_catalog()
+    if catalog is None:
+        async with _game_catalog_lock:
+            catalog = get_game_catalog()
+            if catalog is None:
+                generation = game_catalog_generation()
+                catalog = set_game_catalog(await get_game_rows_in_db(db), generation)
+
+    game = catalog.get(game_name.lower())
+    if not game:
+        raise NotFoundException(
+            detail=f"Game [{game_name.lower()}] is not found.",
+        )
 
+    return game
 
-async def is_existing_game(db: AsyncSession, game_name: str) -> Game:
+
+async def get_existing_game_in_db(db: AsyncSession, game_name: str) -> Game:
     """
-    db에 존재하는 게임인지 확인하는 함수
+    수정, 삭제하기 위해 db 에서 게임을 찾는 함수
     Args:
         db: AsyncSession
         game_name: 찾고자 하는 게임 이름
 
     Returns:
-        찾은 게임의 정보
+        찾은 게임
     """
     game = await get_game_in_db(db, name=game_name.lower())
     if not game:
@@ -34,3 +85,34 @@ async def is_not_existing_game(db: AsyncSession, game_name: str) -> None:
     game = await get_game_in_db(db, name=game_name.lower())
     if game:
         raise ConflictException(f"Game [{game_name.lower()}] already exists.")
+
+
+async def find_nearest_games(
+    db: AsyncSession, game: GameRow, participant_num: int | None, limit: int
+) -> list[dict]:
+    """
+    속성(weight, 인원, 평균 플레이 시간)이 비슷한 게임을 찾는 함수
+    index 를 다시 만들어야 하면 동시에 들어온 요청 중 하나만 db 를 읽음
+    Args:
+        db: AsyncSession
+        game: 기준 게임
+        participant_num: 이 인원으로 플레이할 수 있는 게임만 찾을 때의 인원
+        limit: 반환할 게임 수
+
+    Returns:
+        거리가 가까운 순으로 정렬된 게임 이름과 거리
+    """
+    game_index = get_game_index()
+    if game_index is None:
+        async with _game_index_lock:
+            game_index = get_game_index()
+            if game_index is None:
+                generation = game_index_generation()
+                game_index = set_game_index(
+                    await get_game_features_in_db(db), generation
+                )
+
+    return [
+        {"name": name, "distance": distance}
+        for name, distance in game_index.nearest(game.name, participant_num, limit)
+    ]
@@ -1,9 +1,35 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Sequence
+
+from fastapi import HTTPException, Response
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import UnprocessableEntityException, NotFoundException
+from app.core.loader import Loaders
+from app.core.responses import render_json
 from app.models.game import Game
+from app.schemas.user import Principal
 from app.models.game_log import GameLog
-from app.crud.game_log import get_game_log_in_db
+from app.crud.game import get_games_by_names_in_db
+from app.crud.game_log import get_game_log_in_db, stream_game_log_in_db
+from app.schemas.game_log import (
+    GAME_LOG_RELATIONS,
+    GameLogCreate,
+    GameLogFieldsParams,
+    GameLogFilterParams,
+    GameLogPage,
+    GameLogSearchPage,
+)
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# 목록 응답의 검증, 직렬화 스키마는 한 번만 만들어 재사용
+GAME_LOG_PAGE_ADAPTER = TypeAdapter(GameLogPage)
+GAME_LOG_SEARCH_PAGE_ADAPTER = TypeAdapter(GameLogSearchPage)
 
 
 async def validate_participant_num(game: Game, participant_num: int) -> None:
@@ -22,6 +48,56 @@ async def validate_participant_num(game: Game, participant_num: int) -> None:
         )
 
 
+async def validate_game_log_bulk(
+    db: AsyncSession, raw_game_logs: list[dict[str, Any]]
+) -> tuple[list[tuple[GameLogCreate, Game]], list[dict[str, Any]]]:
+    """
+    여러 게임 기록을 한 번에 검증하는 함수
+    참조하는 게임은 한 번의 쿼리로 불러오고, 참석 인원은 메모리에서 확인
+    Args:
+        db: AsyncSession
+        raw_game_logs: 생성할 게임 기록들
+
+    Returns:
+        검증을 통과한 (게임 기록, 게임) 목록, 통과하지 못한 기록의 위치와 이유
+    """
+    errors = []
+    game_log_infos = []
+    for index, raw_game_log in enumerate(raw_game_logs):
+        try:
+            game_log_infos.append((index, GameLogCreate.model_validate(raw_game_log)))
+        except ValidationError as e:
+            errors.append(
+                {
+                    "index": index,
+                    "detail": e.errors(include_url=False, include_context=False),
+                }
+            )
+        except HTTPException as e:
+            errors.append({"index": index, "detail": e.detail})
+
+    games = await get_games_by_names_in_db(
+        db, (game_log_info.game_name.lower() for _, game_log_info in game_log_infos)
+    )
+
+    game_logs = []
+    for index, game_log_info in game_log_infos:
+        game = games.get(game_log_info.game_name.lower())
+        try:
+            if not game:
+                raise NotFoundException(
+                    detail=f"Game [{game_log_info.game_name.lower()}] is not found.",
+                )
+            await validate_participant_num(game, game_log_info.participant_num)
+        except HTTPException as e:
+            errors.append({"index": index, "detail": e.detail})
+            continue
+        game_logs.append((game_log_info, game))
+
+    errors.sort(key=lambda error: error["index"])
+    return game_logs, errors
+
+
 async def is_existing_game_log(db: AsyncSession, game_log_id: int) -> GameLog:
     """
     주어진 id가 존재하는 게임 기록의 id인지 확인하는 함수
@@ -38,3 +114,145 @@ async def is_existing_game_log(db: AsyncSession, game_log_id: int) -> GameLog:
             detail=f"Game log [{game_log_id}] is not found.",
         )
     return game_log
+
+
+def _to_export_value(value: Any) -> Any:
+    """datetime 을 ISO 8601 문자열로 바꾸는 함수"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def export_game_log(
+    db: AsyncSession,
+    export_format: str,
+    user: Principal = None,
+    game: Game = None,
+    filters: GameLogFilterParams = None,
+) -> AsyncIterator[str]:
+    """
+    게임 기록을 NDJSON 또는 CSV 로 조금씩 만들어 반환하는 함수
+    Args:
+        db: 스트리밍이 끝나면 닫을 AsyncSession
+        export_format: ndjson 또는 csv
+        user: 내보낼 기록을 작성한 사용자
+        game: 내보낼 기록에 포함된 게임
+        filters: 내보낼 기록의 작성 일시 범위와 정렬 방향
+
+    Returns:
+        chunk 단위로 직렬화된 게임 기록
+    """
+    try:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == "csv":
+            # 첫 바이트를 쿼리 결과보다 먼저 보내기 위해 header 를 바로 전송
+            writer.writerow(GameLog.__table__.columns.keys())
+            yield buffer.getvalue()
+
+        async for rows in stream_game_log_in_db(
+            db, user=user, game=game, filters=filters
+        ):
+            if export_format == "csv":
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(
+                    [_to_export_value(value) for value in row] for row in rows
+                )
+                yield buffer.getvalue()
+            else:
+                yield "".join(
+                    json.dumps(
+                        row._asdict(), default=_to_export_value, ensure_ascii=False
+                    )
+                    + "\n"
+                    for row in rows
+                )
+    finally:
+        await db.close()
+
+
+async def _game_log_items(
+    game_logs: Sequence[GameLog],
+    params: GameLogFieldsParams,
+    loaders: Loaders | None,
+) -> list[dict[str, Any]]:
+    """
+    게임 기록 목록의 응답 항목을 만드는 함수
+    읽어 둔 필드만 꺼내고(읽지 않은 컬럼을 건드리면 다시 조회함),
+    include 로 요청한 관련 데이터는 관계마다 한 번의 IN 쿼리로 읽어 붙임
+    Args:
+        game_logs: 한 페이지의 게임 기록
+        params: 응답에 포함할 필드와 관련 데이터
+        loaders: 요청 단위 loader
+
+    Returns:
+        응답 항목
+    """
+    items = [
+        {field: getattr(game_log, field) for field in params.selected_fields}
+        for game_log in game_logs
+    ]
+    for name in params.included:
+        loader = {"game": loaders.games, "user": loaders.users}[name]
+        keys = [getattr(game_log, GAME_LOG_RELATIONS[name]) for game_log in game_logs]
+        related = await loader.load_many(keys)
+        for item, key in zip(items, keys):
+            item[name] = related[key]
+    return items
+
+
+async def game_log_page_response(
+    response: Response,
+    game_logs: Sequence[GameLog],
+    next_cursor: str | None,
+    params: GameLogFieldsParams,
+    loaders: Loaders | None = None,
+) -> Response:
+    """
+    게임 기록 목록 한 페이지의 응답을 만드는 함수
+    Args:
+        response: 의존성에서 설정한 헤더(ETag 등)를 가진 응답
+        game_logs: 한 페이지의 게임 기록
+        next_cursor: 다음 페이지의 cursor
+        params: 응답에 포함할 필드와 관련 데이터
+        loaders: 요청 단위 loader (include 가 있을 때 필요)
+
+    Returns:
+        GameLogPage 형식의 JSON 응답
+    """
+    items = await _game_log_items(game_logs, params, loaders)
+    return render_json(
+        GAME_LOG_PAGE_ADAPTER,
+        {"items": items, "next_cursor": next_cursor},
+        response,
+        exclude_unset=True,
+    )
+
+
+async def game_log_search_response(
+    response: Response,
+    game_logs: Sequence[GameLog],
+    next_offset: int | None,
+    params: GameLogFieldsParams,
+    loaders: Loaders | None = None,
+) -> Response:
+    """
+    게임 기록 검색 결과 한 페이지의 응답을 만드는 함수
+    Args:
+        response: 의존성에서 설정한 헤더를 가진 응답
+        game_logs: 한 페이지의 게임 기록
+        next_offset: 다음 페이지의 offset
+        params: 응답에 포함할 필드와 관련 데이터
+        loaders: 요청 단위 loader (include 가 있을 때 필요)
+
+    Returns:
+        GameLogSearchPage 형식의 JSON 응답
+    """
+    items = await _game_log_items(game_logs, params, loaders)
+    return render_json(
+        GAME_LOG_SEARCH_PAGE_ADAPTER,
+        {"items": items, "next_offset": next_offset},
+        response,
+        exclude_unset=True,
+    )
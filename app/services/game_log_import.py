@@ -0,0 +1,165 @@
+import csv
+import io
+from datetime import datetime
+from itertools import islice
+from typing import Any, BinaryIO, Callable, TypeVar
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.core.after_commit import run_after_commit
+from app.core.exceptions import UnprocessableEntityException, NotFoundException
+from app.crud.game import get_game_catalog_in_db
+from app.crud.game_log import copy_game_logs_in_db
+from app.crud.leaderboard import tally_game_logs, apply_tally_to_leaderboard_in_redis
+from app.crud.trending import trending_since, add_game_logs_to_trending_in_redis
+from app.crud.version import GAME_LOGS, bump_version_in_redis
+from app.crud.user_game_stats import add_game_logs_to_stats_in_db
+from app.schemas.game_log import GameLogCreate
+from app.services.game_log import validate_participant_num
+
+T = TypeVar("T")
+
+IMPORT_REQUIRED_COLUMNS = {
+    "date",
+    "game_name",
+    "during_time",
+    "participant_num",
+    "subject",
+}
+
+
+def _read_chunk(reader: csv.DictReader) -> list[dict[str, str]]:
+    """CSV 에서 GAME_LOG_IMPORT_CHUNK_SIZE 개의 행만 읽는 함수"""
+    return list(islice(reader, settings.GAME_LOG_IMPORT_CHUNK_SIZE))
+
+
+async def _read_csv(function: Callable[..., T], *args: Any) -> T:
+    """
+    CSV 를 읽는 함수를 threadpool 에서 실행하고, 인코딩이나 형식 오류를 422 로 바꾸는 함수
+    Args:
+        function: CSV 를 읽는 함수
+        args: function 의 인자
+
+    Returns:
+        function 의 반환값
+    """
+    try:
+        return await run_in_threadpool(function, *args)
+    except UnicodeDecodeError:
+        raise UnprocessableEntityException(detail="CSV file must be UTF-8 encoded.")
+    except csv.Error as e:
+        raise UnprocessableEntityException(detail=f"Invalid CSV file: {e}")
+
+
+async def _validate_row(
+    row: dict[str, str], catalog: dict[str, Any], user_name: str
+) -> dict[str, Any]:
+    """
+    CSV 한 행을 게임 기록 값으로 바꾸는 함수
+    Args:
+        row: CSV 의 한 행
+        catalog: 게임 이름을 key 로 하는 게임 목록
+        user_name: 기록을 가져오는 사용자 이름
+
+    Returns:
+        적재할 게임 기록의 값
+    """
+    try:
+        date = datetime.fromisoformat(row["date"])
+    except (TypeError, ValueError):
+        raise UnprocessableEntityException(detail="Date must be ISO 8601 format.")
+    if date.tzinfo:  # 다른 기록과 같이 서버 시간대 기준으로 저장
+        date = date.astimezone().replace(tzinfo=None)
+
+    game_log_info = GameLogCreate.model_validate(
+        {key: value or None for key, value in row.items() if key}
+    )
+    game = catalog.get(game_log_info.game_name.lower())
+    if not game:
+        raise NotFoundException(
+            detail=f"Game [{game_log_info.game_name.lower()}] is not found.",
+        )
+    await validate_participant_num(game, game_log_info.participant_num)
+
+    return dict(
+        user_name=user_name,
+        game_name=game.name,
+        date=date,
+        during_time=game_log_info.during_time,
+        participant_num=game_log_info.participant_num,
+        subject=game_log_info.subject,
+        content=game_log_info.content,
+        picture=game_log_info.picture,
+    )
+
+
+async def import_game_log(
+    db: AsyncSession, redis_db: Redis, file: BinaryIO, user_name: str
+) -> dict[str, Any]:
+    """
+    CSV 파일의 게임 기록을 chunk 단위로 검증하고 적재하는 함수
+    게임 목록은 한 번만 읽어 메모리에서 검증하고, 전체 적재는 하나의 트랜잭션으로 처리
+    Args:
+        db: AsyncSession
+        redis_db: 순위표, 목록 버전을 갱신할 redis db
+        file: date, game_name, during_time, participant_num, subject, content, picture
+            컬럼을 가진 UTF-8 CSV 파일
+        user_name: 기록을 가져오는 사용자 이름
+
+    Returns:
+        적재된 기록 수, 적재하지 못한 행 수, 적재하지 못한 앞쪽 행의 위치와 이유
+    """
+    catalog = await get_game_catalog_in_db(db)
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+
+    fieldnames = await _read_csv(lambda: reader.fieldnames)
+    missing_columns = IMPORT_REQUIRED_COLUMNS - set(fieldnames or [])
+    if missing_columns:
+        raise UnprocessableEntityException(
+            detail=f"Missing columns: {', '.join(sorted(missing_columns))}"
+        )
+
+    imported, failed, row_num, errors, tally = 0, 0, 0, [], {}
+    recent, since = [], trending_since()
+    while rows := await _read_csv(_read_chunk, reader):
+        values = []
+        for row in rows:
+            row_num += 1
+            try:
+                values.append(await _validate_row(row, catalog, user_name))
+                continue
+            except ValidationError as e:
+                detail = e.errors(include_url=False, include_context=False)
+            except HTTPException as e:
+                detail = e.detail
+
+            # 잘못된 행이 많아도 메모리가 늘지 않도록 앞쪽 오류만 보관
+            failed += 1
+            if len(errors) < settings.GAME_LOG_IMPORT_MAX_ERRORS:
+                errors.append({"row": row_num, "detail": detail})
+
+        if values:
+            await copy_game_logs_in_db(db, values)
+            await add_game_logs_to_stats_in_db(
+                db, user_name=user_name, game_logs=values
+            )
+            tally_game_logs(values, tally)
+            recent += [
+                {"game_name": value["game_name"], "date": value["date"]}
+                for value in values
+                if value["date"] >= since
+            ]
+            imported += len(values)
+
+    await db.commit()
+    await run_after_commit(
+        bump_version_in_redis(redis_db, GAME_LOGS),
+        apply_tally_to_leaderboard_in_redis(redis_db, tally),
+        add_game_logs_to_trending_in_redis(redis_db, recent),
+    )
+    return {"imported": imported, "failed": failed, "errors": errors}
@@ -0,0 +1,257 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette import status
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.core.conditional import is_not_modified
+from app.core.exceptions import (
+    ContentTooLargeException,
+    UnprocessableEntityException,
+    NotFoundException,
+)
+from app.core.image import PICTURE_FORMAT, make_picture_variants
+from app.core.process_pool import get_process_pool
+
+PICTURE_FIELD_NAME = "file"  # 사진을 담는 multipart 필드 이름
+# Content-Length 로 미리 거를 때 사진 외의 multipart 헤더, boundary 에 허용할 크기
+MULTIPART_OVERHEAD = 16 * 1024
+# 본문을 직접 파싱하므로 문서에 보일 요청 형식을 따로 지정
+PICTURE_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": [PICTURE_FIELD_NAME],
+                    "properties": {
+                        PICTURE_FIELD_NAME: {"type": "string", "format": "binary"}
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+def picture_dir(key: str) -> str:
+    """
+    사진이 저장된 디렉토리를 반환하는 함수
+    Args:
+        key: 사진 원본의 SHA-256
+
+    Returns:
+        PICTURE_STORAGE_DIR/ab/cd/abcd... 형식의 경로
+    """
+    return os.path.join(settings.PICTURE_STORAGE_DIR, key[:2], key[2:4], key)
+
+
+def picture_path(key: str, size: str) -> str:
+    """
+    크기별 사진 파일의 경로를 반환하는 함수
+    Args:
+        key: 사진 원본의 SHA-256
+        size: PICTURE_SIZES 의 크기 이름
+
+    Returns:
+        사진 파일 경로
+    """
+    return os.path.join(picture_dir(key), f"{size}.{PICTURE_FORMAT}")
+
+
+def is_stored_picture(key: str) -> bool:
+    """모든 크기의 사진이 이미 저장되어 있는지 확인하는 함수"""
+    return all(
+        os.path.exists(picture_path(key, size)) for size in settings.PICTURE_SIZES
+    )
+
+
+class _PicturePartParser:
+    """
+    multipart 본문에서 사진 필드의 내용만 골라내는 parser
+    Args:
+        boundary: Content-Type 의 multipart boundary
+    """
+
+    def __init__(self, boundary: bytes):
+        self.found = False
+        self.data = bytearray()  # 아직 파일에 쓰지 않은 사진 내용
+        self._in_picture = False
+        self._header_field = b""
+        self._header_value = b""
+        self._parser = MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    def write(self, chunk: bytes) -> None:
+        try:
+            self._parser.write(chunk)
+        except MultipartParseError:
+            raise UnprocessableEntityException(detail="Invalid multipart body.")
+
+    def finalize(self) -> None:
+        self._parser.finalize()
+
+    def _on_part_begin(self) -> None:
+        self._in_picture = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        if self._header_field.lower() == b"content-disposition":
+            _, options = parse_options_header(self._header_value)
+            name = options.get(b"name", b"").decode("latin-1")
+            self._in_picture = name == PICTURE_FIELD_NAME and not self.found
+            self.found = self.found or self._in_picture
+        self._header_field = self._header_value = b""
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_picture:
+            self.data += data[start:end]
+
+    def _on_part_end(self) -> None:
+        self._in_picture = False
+
+
+async def _save_upload(request: Request, temp_path: str) -> str:
+    """
+    multipart 요청 본문을 받는 대로 파싱해 사진을 임시 파일에 쓰면서 SHA-256 을 계산하는 함수
+    - Content-Length 가 PICTURE_MAX_SIZE 를 넘으면 본문을 읽기 전에 거절
+    - 본문 전체를 먼저 받아두지 않고, 사진 크기가 PICTURE_MAX_SIZE 를 넘는 즉시 거절
+    Args:
+        request: 사진을 담은 multipart/form-data 요청
+        temp_path: 쓸 임시 파일 경로
+
+    Returns:
+        사진 내용의 SHA-256
+    """
+    too_large = ContentTooLargeException(
+        detail=f"Picture must be {settings.PICTURE_MAX_SIZE} bytes or less."
+    )
+    content_length = request.headers.get("content-length", "")
+    if (
+        content_length.isdigit()
+        and int(content_length) > settings.PICTURE_MAX_SIZE + MULTIPART_OVERHEAD
+    ):
+        raise too_large
+
+    content_type, options = parse_options_header(request.headers.get("content-type"))
+    if content_type != b"multipart/form-data" or b"boundary" not in options:
+        raise UnprocessableEntityException(
+            detail="Picture must be sent as multipart/form-data."
+        )
+
+    parser = _PicturePartParser(options[b"boundary"])
+    digest, size = hashlib.sha256(), 0
+
+    async def flush(temp) -> None:
+        nonlocal size
+        data = bytes(parser.data)
+        parser.data.clear()
+        size += len(data)
+        digest.update(data)
+        await run_in_threadpool(temp.write, data)
+
+    with open(temp_path, "wb") as temp:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if size + len(parser.data) > settings.PICTURE_MAX_SIZE:
+                raise too_large
+            # 작은 chunk 마다 파일에 쓰지 않도록 PICTURE_UPLOAD_CHUNK_SIZE 만큼 모아서 씀
+            if len(parser.data) >= settings.PICTURE_UPLOAD_CHUNK_SIZE:
+                await flush(temp)
+        parser.finalize()
+        await flush(temp)
+
+    if not parser.found:
+        raise UnprocessableEntityException(
+            detail=f"'{PICTURE_FIELD_NAME}' field is required."
+        )
+    return digest.hexdigest()
+
+
+async def store_picture(request: Request) -> str:
+    """
+    업로드된 사진을 내용 기준 경로(SHA-256)에 크기별로 저장하는 함수
+    같은 사진은 한 번만 저장하고, 변환은 이벤트 루프를 막지 않도록 별도 프로세스에서 실행
+    Args:
+        request: 사진을 담은 multipart/form-data 요청
+
+    Returns:
+        저장된 사진의 key
+    """
+    os.makedirs(settings.PICTURE_STORAGE_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=settings.PICTURE_STORAGE_DIR, suffix=".upload")
+    os.close(fd)
+    try:
+        key = await _save_upload(request, temp_path)
+        if not is_stored_picture(key):
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    get_process_pool(),
+                    make_picture_variants,
+                    temp_path,
+                    picture_dir(key),
+                    settings.PICTURE_SIZES,
+                )
+            except ValueError:
+                raise UnprocessableEntityException(detail="Invalid picture file.")
+    finally:
+        os.remove(temp_path)
+    return key
+
+
+def picture_response(key: str, size: str, if_none_match: str | None) -> Response:
+    """
+    저장된 사진을 반환하는 응답을 만드는 함수
+    - 내용 기준 key 라 파일이 바뀌지 않으므로 key 로 ETag 를 만들고 오래 캐시
+    - FileResponse 는 파일을 chunk 단위로 읽어 보내고 Range 요청을 처리
+    - PICTURE_ACCEL_REDIRECT_PREFIX 가 있으면 본문 없이 X-Accel-Redirect 로 nginx 가 전송
+    Args:
+        key: 사진 원본의 SHA-256
+        size: PICTURE_SIZES 의 크기 이름
+        if_none_match: 요청의 If-None-Match 헤더
+
+    Returns:
+        304 응답, X-Accel-Redirect 응답 또는 FileResponse
+    """
+    path = picture_path(key, size)
+    if size not in settings.PICTURE_SIZES or not os.path.isfile(path):
+        raise NotFoundException(detail="Picture is not found.")
+
+    etag = f'"{key}-{size}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.PICTURE_CACHE_MAX_AGE}, immutable",
+    }
+    if is_not_modified(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    media_type = f"image/{PICTURE_FORMAT}"
+    if settings.PICTURE_ACCEL_REDIRECT_PREFIX:
+        relative_path = os.path.relpath(path, settings.PICTURE_STORAGE_DIR)
+        headers["X-Accel-Redirect"] = (
+            f"{settings.PICTURE_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{relative_path}"
+        )
+        return Response(media_type=media_type, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
@@ -0,0 +1,121 @@
+import math
+from typing import Any, Sequence
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.crud.game_similarity import (
+    replace_game_similarities_in_db,
+    get_similar_games_in_db,
+)
+from app.crud.user_game_stats import get_user_game_stats_in_db
+from app.models.user_game_stats import UserGameStats
+
+
+def compute_game_similarities(
+    pairs: Sequence[tuple[str, str]], top_k: int, min_common_users: int
+) -> list[dict[str, Any]]:
+    """
+    (사용자, 게임) 쌍으로 게임 간 cosine 유사도를 계산하고, 게임마다 상위 top_k 개를 반환하는 함수
+    사용자 x 게임 희소 행렬 X 에 대해 X^T X 로 모든 게임 쌍의 공통 사용자 수를 한 번에 계산
+    Args:
+        pairs: 중복 없는 (user_name, game_name) 쌍
+        top_k: 게임마다 남길 비슷한 게임 수
+        min_common_users: 비슷한 게임으로 볼 최소 공통 사용자 수
+
+    Returns:
+        game_name, similar_game_name, score, common_user_num 을 가진 값들
+    """
+    if not pairs:
+        return []
+
+    user_names, game_names = zip(*pairs)
+    _, user_index = np.unique(user_names, return_inverse=True)
+    games, game_index = np.unique(game_names, return_inverse=True)
+    played = sparse.csr_matrix(
+        (np.ones(len(pairs), dtype=np.float64), (user_index, game_index)),
+        shape=(user_index.max() + 1, len(games)),
+    )
+
+    common = (played.T @ played).tocsr()  # 게임 x 게임 공통 사용자 수
+    norms = 1 / np.sqrt(common.diagonal())  # 대각선은 게임별 사용자 수
+    common.setdiag(0)
+    common.data[common.data < min_common_users] = 0
+    common.eliminate_zeros()
+
+    # cosine 유사도 = 공통 사용자 수 / sqrt(두 게임의 사용자 수 곱), 0 이 아닌 값만 계산
+    rows = np.repeat(np.arange(len(games)), np.diff(common.indptr))
+    scores = common.data * norms[rows] * norms[common.indices]
+
+    game_list, similarities = games.tolist(), []
+    for row in range(len(games)):
+        start, end = common.indptr[row], common.indptr[row + 1]
+        top = start + np.argsort(-scores[start:end], kind="stable")[:top_k]
+        for index in top:
+            similarities.append(
+                {
+                    "game_name": game_list[row],
+                    "similar_game_name": game_list[common.indices[index]],
+                    "score": float(scores[index]),
+                    "common_user_num": int(common.data[index]),
+                }
+            )
+    return similarities
+
+
+async def refresh_game_similarities(db: AsyncSession) -> int:
+    """
+    사용자별 게임 통계로 비슷한 게임 목록을 다시 계산하여 저장하는 함수
+    Args:
+        db: AsyncSession
+
+    Returns:
+        저장한 (게임, 비슷한 게임) 쌍의 수
+    """
+    results = await db.execute(select(UserGameStats.user_name, UserGameStats.game_name))
+    pairs = [tuple(row) for row in results]
+
+    similarities = await run_in_threadpool(
+        compute_game_similarities,
+        pairs,
+        settings.RECOMMENDATION_TOP_K,
+        settings.RECOMMENDATION_MIN_COMMON_USERS,
+    )
+    await replace_game_similarities_in_db(db, similarities)
+    return len(similarities)
+
+
+async def recommend_games(
+    db: AsyncSession, user_name: str, limit: int
+) -> list[dict[str, Any]]:
+    """
+    사용자가 플레이한 게임들과 비슷한 게임을 합쳐 추천하는 함수
+    비슷한 게임의 유사도를 기준 게임의 플레이 횟수(log)로 가중합하고, 이미 플레이한 게임은 제외
+    Args:
+        db: AsyncSession
+        user_name: 추천받을 사용자 이름
+        limit: 추천할 게임 수
+
+    Returns:
+        게임 이름과 추천 점수
+    """
+    stats = await get_user_game_stats_in_db(db, user_name=user_name)
+    play_counts = {stat.game_name: stat.play_count for stat in stats}
+    if not play_counts:
+        return []
+
+    scores: dict[str, float] = {}
+    for similarity in await get_similar_games_in_db(db, play_counts):
+        if similarity.similar_game_name in play_counts:
+            continue
+        weight = math.log1p(play_counts[similarity.game_name])
+        scores[similarity.similar_game_name] = (
+            scores.get(similarity.similar_game_name, 0) + similarity.score * weight
+        )
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return [{"name": name, "score": round(score, 3)} for name, score in ranked[:limit]]
@@ -1,7 +1,11 @@
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ConflictException, NotFoundException
 from app.crud.user import get_user_in_db
+from app.schemas.user import UserRow
+
+USER_LIST_ADAPTER = TypeAdapter(list[UserRow])
 
 
 async def is_existing_user(
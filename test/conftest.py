@@ -1,6 +1,7 @@
 import pytest
 from typing import Any
 from httpx import AsyncClient, ASGITransport
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -8,9 +9,13 @@ from sqlalchemy.pool import StaticPool
 from app.main import app
 from app.db.database import Base
 from app.config import settings
-from app.api.dependencies import get_db
+from app.api.dependencies import get_db, get_stream_db, get_redis
 from app.models.user import User
 from app.core.security import pwd_context
+from app.crud.leaderboard import LEADERBOARD_KEY_PREFIX
+from app.crud.trending import TRENDING_KEY_PREFIX
+from app.core.game_catalog import invalidate_game_catalog
+from app.core.principal_cache import invalidate_principals
 
 
 USER_DATA = dict[str, str]
@@ -90,6 +95,55 @@ def override_get_async_session(db_session: AsyncSession):
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_async_session
+    app.dependency_overrides[get_stream_db] = lambda: db_session
+
+
+@pytest.fixture(scope="function")
+async def redis_db():
+    """
+    테스트 용 redis 연결을 반환하는 함수
+    Returns:
+        Redis
+    """
+    client = Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DATABASE,
+        decode_responses=True,
+    )
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture(autouse=True)
+def override_get_redis(redis_db: Redis):
+    """
+    테스트마다 event loop 가 바뀌므로 앱의 공용 redis 대신 테스트 용 redis 를 사용하는 함수
+    Args:
+        redis_db: 테스트 용 redis
+    """
+    app.dependency_overrides[get_redis] = lambda: redis_db
+
+
+@pytest.fixture(autouse=True)
+async def clear_leaderboard(redis_db: Redis):
+    """테스트마다 db 가 초기화되므로 순위표와 인기 게임 bucket 도 비우는 함수"""
+    for prefix in (LEADERBOARD_KEY_PREFIX, TRENDING_KEY_PREFIX):
+        keys = [key async for key in redis_db.scan_iter(f"{prefix}:*")]
+        if keys:
+            await redis_db.delete(*keys)
+
+
+@pytest.fixture(autouse=True)
+def clear_game_catalog():
+    """테스트마다 db 가 초기화되므로 worker 의 게임 캐시도 비우는 함수"""
+    invalidate_game_catalog()
+
+
+@pytest.fixture(autouse=True)
+def clear_principal_cache():
+    """테스트마다 db 가 초기화되므로 worker 의 인증 캐시도 비우는 함수"""
+    invalidate_principals()
 
 
 @pytest.fixture(scope="function")
@@ -391,3 +445,14 @@ async def create_test_all_game_log(
             headers={f"Authorization": f"Bearer {login_admin_user["access_token"]}"},
         )
     return login_test_user, game_log_data_list
+
+
+@pytest.fixture(scope="function")
+def picture_storage(tmp_path, monkeypatch) -> str:
+    """
+    사진 저장 디렉토리를 테스트용 임시 디렉토리로 바꾸는 함수
+    Returns:
+        사진 저장 디렉토리
+    """
+    monkeypatch.setattr(settings, "PICTURE_STORAGE_DIR", str(tmp_path))
+    return str(tmp_path)
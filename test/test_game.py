@@ -1,12 +1,35 @@
-import pytest
+import pytest, asyncio, warnings
+from datetime import datetime, timedelta
 from httpx import AsyncClient
 from fastapi import status
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_redis
+from app.config import settings
+from app.core.game_catalog import (
+    GAME_CATALOG_CHANNEL,
+    get_game_catalog,
+    handle_game_catalog_message,
+)
+from app.core.game_index import get_game_index, mark_game_index_dirty
+from app.core.pubsub import listen_invalidations
+from app.crud.leaderboard import rebuild_leaderboard_in_redis
+from app.db.session import RedisClient
+from app.main import app
+from app.services import game as game_service
+from app.services.recommendation import refresh_game_similarities
 
 from test.conftest import (
     USER_DATA,
     GAME_DATA,
     GAME_DATA_LIST,
+    GAME_LOG_DATA_LIST,
     GAME_API_URL,
+    GAME_LOG_API_URL,
     login_admin_user,
 )
 
@@ -116,6 +139,66 @@ async def test_read_all_game(
     assert len(response.json()) == len(game_data_list)
 
 
+@pytest.mark.asyncio
+async def test_read_all_game_not_modified(
+    async_client: AsyncClient,
+    login_admin_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+):
+    """바뀌지 않은 게임 목록은 304 로 응답하는 테스트"""
+    response = await async_client.get(f"{GAME_API_URL}/list")
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"].startswith("public")
+
+    response = await async_client.get(
+        f"{GAME_API_URL}/list", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+
+    # 게임이 수정되면 다시 내려받음
+    await async_client.patch(
+        f"{GAME_API_URL}/patch/캐스캐디아",
+        json={"weight": 2.0},
+        headers={f"Authorization": f"Bearer {login_admin_user["access_token"]}"},
+    )
+    response = await async_client.get(
+        f"{GAME_API_URL}/list", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_read_all_game_version_bump_error(
+    async_client: AsyncClient,
+    login_admin_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+    monkeypatch,
+):
+    """버전을 바꾸지 못해도 수정된 게임 목록을 304 로 응답하지 않는지 테스트"""
+    response = await async_client.get(f"{GAME_API_URL}/list")
+    etag = response.headers["ETag"]
+
+    async def fail(*args, **kwargs):
+        raise RedisConnectionError("redis is down")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Pipeline, "execute", fail)
+        response = await async_client.patch(
+            f"{GAME_API_URL}/patch/캐스캐디아",
+            json={"weight": 2.0},
+            headers={f"Authorization": f"Bearer {login_admin_user["access_token"]}"},
+        )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await async_client.get(
+        f"{GAME_API_URL}/list", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+
 @pytest.mark.asynico
 async def test_read_game(
     async_client: AsyncClient,
@@ -172,6 +255,115 @@ async def test_update_game_data(
     assert 6 == response["max_possible_num"]
 
 
+@pytest.mark.asyncio
+async def test_read_game_cached(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    create_test_game: GAME_DATA,
+    login_admin_user: USER_DATA,
+):
+    """게임 조회가 worker 캐시를 사용하고, 게임을 수정하면 캐시가 비워지는 테스트"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    url = f"{GAME_API_URL}/list/{create_test_game["name"]}"
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        for _ in range(3):
+            response = await async_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    # 처음 한 번만 게임 목록을 읽음
+    assert sum("FROM games" in statement for statement in statements) == 1
+
+    response = await async_client.patch(
+        f"{GAME_API_URL}/patch/{create_test_game["name"]}",
+        headers={f"Authorization": f"Bearer {login_admin_user["access_token"]}"},
+        json={"weight": create_test_game["weight"] + 1},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await async_client.get(url)
+    assert response.json()["weight"] == create_test_game["weight"] + 1
+
+
+@pytest.mark.asyncio
+async def test_game_catalog_invalidated_by_other_worker(
+    async_client: AsyncClient,
+    redis_db: Redis,
+    create_test_game: GAME_DATA,
+):
+    """다른 worker 의 게임 변경 알림을 받으면 캐시가 비워지는 테스트"""
+    listener = asyncio.create_task(listen_invalidations(redis_db))
+    try:
+        # 구독할 때까지 대기
+        for _ in range(100):
+            if (await redis_db.pubsub_numsub(GAME_CATALOG_CHANNEL))[0][1]:
+                break
+            await asyncio.sleep(0.01)
+
+        await async_client.get(f"{GAME_API_URL}/list/{create_test_game["name"]}")
+        assert get_game_catalog() is not None
+
+        await redis_db.publish(GAME_CATALOG_CHANNEL, create_test_game["name"])
+        for _ in range(100):
+            if get_game_catalog() is None:
+                break
+            await asyncio.sleep(0.01)
+        assert get_game_catalog() is None
+    finally:
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+
+@pytest.mark.asyncio
+async def test_game_catalog_survives_requests(
+    async_client: AsyncClient,
+    create_test_game: GAME_DATA,
+    monkeypatch,
+):
+    """요청이 공용 redis 를 닫지 않아 구독과 게임 캐시가 유지되는지 테스트"""
+    # 테스트 용 redis 대신 앱의 get_redis 사용
+    monkeypatch.delitem(app.dependency_overrides, get_redis)
+    monkeypatch.setattr(settings, "PUBSUB_POLL_INTERVAL", 0.05)
+    monkeypatch.setattr(settings, "PUBSUB_RESUBSCRIBE_DELAY", 0.05)
+    subscriptions = []
+
+    def handle(game_name: str | None) -> None:
+        if game_name is None:
+            subscriptions.append(game_name)
+        handle_game_catalog_message(game_name)
+
+    listener = asyncio.create_task(
+        listen_invalidations(RedisClient, {GAME_CATALOG_CHANNEL: handle})
+    )
+    try:
+        for _ in range(100):
+            if (await RedisClient.pubsub_numsub(GAME_CATALOG_CHANNEL))[0][1]:
+                break
+            await asyncio.sleep(0.01)
+
+        await async_client.get(f"{GAME_API_URL}/list/{create_test_game["name"]}")
+        for _ in range(5):
+            response = await async_client.get(f"{GAME_LOG_API_URL}/list")
+            assert response.status_code == status.HTTP_200_OK
+        await asyncio.sleep(0.2)
+
+        assert subscriptions == [None]
+        assert get_game_catalog() is not None
+    finally:
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+        await RedisClient.aclose()
+
+
 @pytest.mark.asynico
 async def test_update_game_data_no_permission(
     async_client: AsyncClient,
@@ -274,3 +466,194 @@ async def test_delete_game_no_permission(
     )
     status_code = response.status_code
     assert status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_game_leaderboard(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_LOG_DATA_LIST),
+):
+    """가장 많이 플레이한 게임과 사용자 순위 테스트"""
+    test_user = create_test_all_game_log[0]
+    headers = {"Authorization": f"Bearer {test_user['access_token']}"}
+
+    response = await async_client.get(
+        f"{GAME_API_URL}/leaderboard", params={"by": "minutes"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"name": "아크노바", "score": 360},
+        {"name": "캐스캐디아", "score": 60},
+    ]
+
+    response = await async_client.get(
+        f"{GAME_API_URL}/leaderboard", params={"limit": 1}
+    )
+    assert len(response.json()) == 1
+
+    # 기록을 수정, 삭제하면 순위에 반영
+    await async_client.patch(
+        f"{GAME_LOG_API_URL}/patch/my/1", json={"during_time": 100}, headers=headers
+    )
+    response = await async_client.get(
+        f"{GAME_API_URL}/list/캐스캐디아/leaderboard", params={"by": "minutes"}
+    )
+    assert response.json() == [
+        {"name": test_user["name"], "score": 100},
+        {"name": "testadmin", "score": 30},
+    ]
+
+    await async_client.delete(f"{GAME_LOG_API_URL}/delete/my/1", headers=headers)
+    response = await async_client.get(f"{GAME_API_URL}/list/캐스캐디아/leaderboard")
+    assert response.json() == [{"name": "testadmin", "score": 1}]
+
+    response = await async_client.get(f"{GAME_API_URL}/list/없는게임/leaderboard")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_rebuild_leaderboard(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    redis_db: Redis,
+    create_test_all_game_log: (USER_DATA, GAME_LOG_DATA_LIST),
+):
+    """db 의 통계로 순위표를 다시 만드는 테스트"""
+    response = await async_client.get(f"{GAME_API_URL}/leaderboard")
+    before = response.json()
+    await redis_db.delete(*[key async for key in redis_db.scan_iter("leaderboard:*")])
+
+    assert await rebuild_leaderboard_in_redis(db_session, redis_db) == 4
+    response = await async_client.get(f"{GAME_API_URL}/leaderboard")
+    assert response.json() == before
+
+
+async def test_trending_game(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+):
+    """최근 기간 동안 많이 플레이된 게임 순위 테스트"""
+    now = datetime.now().replace(microsecond=0)
+    csv_data = "date,game_name,during_time,participant_num,subject\n" + "".join(
+        f"{(now - ago).isoformat()},{game_name},40,2,기록\n"
+        for ago, game_name in [
+            (timedelta(hours=1), "아크노바"),
+            (timedelta(days=3), "캐스캐디아"),
+            (timedelta(days=3), "캐스캐디아"),
+            (timedelta(days=40), "캐스캐디아"),  # 어느 기간에도 포함되지 않음
+        ]
+    )
+    headers = {"Authorization": f"Bearer {login_test_user['access_token']}"}
+    await async_client.post(
+        f"{GAME_LOG_API_URL}/import",
+        files={"file": ("logs.csv", csv_data.encode(), "text/csv")},
+        headers=headers,
+    )
+
+    response = await async_client.get(f"{GAME_API_URL}/trending")
+    assert response.status_code == status.HTTP_200_OK
+    assert [res["name"] for res in response.json()] == ["아크노바"]
+    assert 0 < response.json()[0]["score"] <= 1
+
+    response = await async_client.get(
+        f"{GAME_API_URL}/trending", params={"window": "30d"}
+    )
+    assert [res["name"] for res in response.json()] == ["캐스캐디아", "아크노바"]
+    assert response.json()[0]["score"] < 2  # 오래된 기록은 가중치가 낮음
+
+    # 기록을 삭제하면 순위에서 제외
+    await async_client.delete(f"{GAME_LOG_API_URL}/delete/my/1", headers=headers)
+    response = await async_client.get(f"{GAME_API_URL}/trending")
+    assert response.json() == []
+
+    response = await async_client.get(
+        f"{GAME_API_URL}/trending", params={"window": "1y"}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_similar_game(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    create_test_all_game_log: (USER_DATA, GAME_LOG_DATA_LIST),
+):
+    """함께 플레이한 게임 테스트"""
+    # 계산 전에는 비어 있음
+    response = await async_client.get(f"{GAME_API_URL}/list/캐스캐디아/similar")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+    # 두 사용자가 모두 두 게임을 플레이
+    assert await refresh_game_similarities(db_session) == 2
+    response = await async_client.get(f"{GAME_API_URL}/list/캐스캐디아/similar")
+    assert response.json() == [{"name": "아크노바", "score": pytest.approx(1.0)}]
+
+    response = await async_client.get(f"{GAME_API_URL}/list/없는게임/similar")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_nearest_game(
+    async_client: AsyncClient,
+    login_admin_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+):
+    """속성이 비슷한 게임 테스트"""
+    # 기록이 없어 평균 플레이 시간이 모두 비어 있어도 경고 없이 index 를 만듦
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        response = await async_client.get(f"{GAME_API_URL}/list/캐스캐디아/nearest")
+    assert response.status_code == status.HTTP_200_OK
+    assert [game["name"] for game in response.json()] == ["아크노바"]
+
+    # 게임을 추가하면 index 를 다시 만듦
+    response = await async_client.post(
+        f"{GAME_API_URL}/create",
+        json={
+            "name": "스플렌더",
+            "weight": 1.79,
+            "min_possible_num": 2,
+            "max_possible_num": 5,
+        },
+        headers={f"Authorization": f"Bearer {login_admin_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await async_client.get(f"{GAME_API_URL}/list/캐스캐디아/nearest")
+    assert [game["name"] for game in response.json()] == ["아크노바", "스플렌더"]
+
+    # 5명이 플레이할 수 있는 게임만
+    response = await async_client.get(
+        f"{GAME_API_URL}/list/캐스캐디아/nearest", params={"participant_num": 5}
+    )
+    assert [game["name"] for game in response.json()] == ["스플렌더"]
+
+    response = await async_client.get(f"{GAME_API_URL}/list/없는게임/nearest")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_nearest_game_changed_while_building(
+    async_client: AsyncClient,
+    create_test_all_game: GAME_DATA_LIST,
+    monkeypatch,
+):
+    """index 를 만드는 동안 게임이 바뀌면 만든 index 를 저장하지 않는지 테스트"""
+    get_game_features_in_db = game_service.get_game_features_in_db
+
+    async def changed_while_reading(db):
+        rows = await get_game_features_in_db(db)
+        mark_game_index_dirty()  # 다른 요청이 게임을 수정함
+        return rows
+
+    mark_game_index_dirty()
+    monkeypatch.setattr(game_service, "get_game_features_in_db", changed_while_reading)
+    response = await async_client.get(f"{GAME_API_URL}/list/캐스캐디아/nearest")
+    assert response.status_code == status.HTTP_200_OK
+    assert get_game_index() is None
+
+    monkeypatch.setattr(
+        game_service, "get_game_features_in_db", get_game_features_in_db
+    )
+    response = await async_client.get(f"{GAME_API_URL}/list/캐스캐디아/nearest")
+    assert response.status_code == status.HTTP_200_OK
+    assert get_game_index() is not None
@@ -1,6 +1,16 @@
-import pytest, json
+import pytest, json, csv, io, os, hashlib
 from httpx import AsyncClient
 from fastapi import status
+from PIL import Image
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.endpoints import game_log as game_log_endpoint
+from app.config import settings
+from app.core.responses import ClosingStreamingResponse
+from app.crud.version import GAMES, bump_version_in_redis
 
 from test.conftest import (
     USER_DATA,
@@ -9,6 +19,7 @@ from test.conftest import (
     GAME_LOG_DATA,
     GAME_LOG_DATA_LIST,
     GAME_LOG_API_URL,
+    USER_API_URL,
     login_test_user,
     logout_test_user,
 )
@@ -30,6 +41,33 @@ async def test_create_game_log(
     assert response.status_code == status.HTTP_201_CREATED
 
 
+@pytest.mark.asyncio
+async def test_create_game_log_redis_error(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+    game_log_data_list: GAME_LOG_DATA_LIST,
+    monkeypatch,
+):
+    """커밋 뒤 redis 갱신이 실패해도 생성된 기록은 성공으로 응답하는지 테스트"""
+
+    async def fail(*args, **kwargs):
+        raise RedisConnectionError("redis is down")
+
+    monkeypatch.setattr("app.crud.game_log.bump_version_in_redis", fail)
+    monkeypatch.setattr("app.crud.game_log.add_game_logs_to_leaderboard_in_redis", fail)
+
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/create",
+        json=game_log_data_list[0],
+        headers={f"Authorization": f"Bearer {login_test_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await async_client.get(f"{GAME_LOG_API_URL}/list")
+    assert len(response.json()["items"]) == 1
+
+
 @pytest.mark.asyncio
 async def test_create_game_log_no_permission(
     async_client: AsyncClient,
@@ -94,7 +132,139 @@ async def test_create_game_log_invalid_data(
     assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
 
 
+async def test_create_game_log_bulk(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+    game_log_data_list: GAME_LOG_DATA_LIST,
+):
+    """여러 게임 기록을 한 번에 생성하는 테스트"""
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/bulk",
+        json={"game_logs": game_log_data_list * 2},
+        headers={f"Authorization": f"Bearer {login_test_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json() == {"created": len(game_log_data_list) * 2, "errors": []}
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list/my",
+        headers={f"Authorization": f"Bearer {login_test_user["access_token"]}"},
+    )
+    assert len(response.json()["items"]) == len(game_log_data_list) * 2
+
+
+async def test_create_game_log_bulk_partial_error(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+    game_log_data_list: GAME_LOG_DATA_LIST,
+):
+    """일부 기록이 잘못 되었을 때 나머지는 생성되고 항목별 오류를 반환하는지 테스트"""
+    game_logs = [
+        game_log_data_list[0],
+        {**game_log_data_list[0], "participant_num": 10},  # 인원 초과
+        {**game_log_data_list[0], "game_name": "없는 게임"},
+        {**game_log_data_list[0], "subject": ""},  # 빈 제목
+        {**game_log_data_list[0], "during_time": "long"},  # 잘못된 타입
+        game_log_data_list[1],
+    ]
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/bulk",
+        json={"game_logs": game_logs},
+        headers={f"Authorization": f"Bearer {login_test_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = response.json()
+
+    assert response["created"] == 2
+    assert [error["index"] for error in response["errors"]] == [1, 2, 3, 4]
+
+
+async def test_create_game_log_bulk_too_many(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    game_log_data_list: GAME_LOG_DATA_LIST,
+):
+    """한 번에 생성할 수 있는 수를 넘었을 때"""
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/bulk",
+        json={"game_logs": game_log_data_list * settings.GAME_LOG_BULK_MAX_SIZE},
+        headers={f"Authorization": f"Bearer {login_test_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_import_game_log(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+):
+    """CSV 파일로 과거 게임 기록을 가져오는 테스트"""
+    csv_data = (
+        "date,game_name,during_time,participant_num,subject,content\n"
+        '2024-01-01T20:00:00,캐스캐디아,40,2,첫 판,"여러 줄,\n내용"\n'
+        "2024-01-02T20:00:00,아크노바,200,3,두 번째 판,\n"
+        "2024-01-03T20:00:00,없는 게임,30,2,없는 게임,\n"
+        "어제,캐스캐디아,30,2,잘못된 날짜,\n"
+        "2024-01-04T20:00:00,캐스캐디아,30,9,인원 초과,\n"
+    )
+    headers = {"Authorization": f"Bearer {login_test_user["access_token"]}"}
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/import",
+        files={"file": ("logs.csv", csv_data.encode(), "text/csv")},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = response.json()
+
+    assert response["imported"] == 2
+    assert response["failed"] == 3
+    assert [error["row"] for error in response["errors"]] == [3, 4, 5]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list/my",
+        params={"order": "asc", "fields": "detail"},
+        headers=headers,
+    )
+    response = response.json()["items"]
+    assert [res["subject"] for res in response] == ["첫 판", "두 번째 판"]
+    assert response[0]["content"] == "여러 줄,\n내용"
+
+
+async def test_import_game_log_missing_columns(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+):
+    """필수 컬럼이 없는 CSV 파일을 가져오려 할 때"""
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/import",
+        files={"file": ("logs.csv", b"game_name,subject\n", "text/csv")},
+        headers={"Authorization": f"Bearer {login_test_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.asyncio
+async def test_import_game_log_not_utf8(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+):
+    """UTF-8 이 아닌 CSV 파일을 가져오려 할 때"""
+    csv_data = (
+        "date,game_name,during_time,participant_num,subject\n"
+        "2024-01-01T20:00:00,캐스캐디아,40,2,첫 판\n"
+    )
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/import",
+        files={"file": ("logs.csv", csv_data.encode("cp949"), "text/csv")},
+        headers={"Authorization": f"Bearer {login_test_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 async def test_read_all_game_log(
     async_client: AsyncClient,
     create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
@@ -102,7 +272,7 @@ async def test_read_all_game_log(
     """전체 게임 기록을 가져오는 테스트"""
     response = await async_client.get(f"{GAME_LOG_API_URL}/list")
     status_code = response.status_code
-    response = response.json()
+    response = response.json()["items"]
 
     assert status_code == status.HTTP_200_OK
     assert (
@@ -110,6 +280,79 @@ async def test_read_all_game_log(
     )  # 게임 기록을 중복으로 생성했음
 
 
+async def test_read_game_log_fields(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """게임 기록 목록의 응답 필드를 고르는 테스트"""
+    # 기본은 content, picture 를 제외한 요약
+    response = await async_client.get(f"{GAME_LOG_API_URL}/list")
+    item = response.json()["items"][0]
+    assert "content" not in item and "picture" not in item
+    assert item["subject"]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list", params={"fields": "detail"}
+    )
+    assert "content" in response.json()["items"][0]
+
+    # 고른 필드와 id 만 포함
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list", params={"fields": "game_name,content", "limit": 1}
+    )
+    body = response.json()
+    assert body["items"][0].keys() == {"id", "game_name", "content"}
+    assert body["next_cursor"]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list", params={"fields": "game_name,password"}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_read_game_log_include(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """게임 기록 목록에 게임, 사용자 정보를 함께 받는 테스트"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await async_client.get(
+            f"{GAME_LOG_API_URL}/list", params={"include": "game,user"}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    items = response.json()["items"]
+    assert len(items) == len(create_test_all_game_log[1]) * 2
+    for item in items:
+        assert item["game"]["name"] == item["game_name"]
+        assert item["game"].keys() == {
+            "name",
+            "weight",
+            "max_possible_num",
+            "min_possible_num",
+        }
+        assert item["user"]["name"] == item["user_name"]
+        assert item["user"].keys() == {"name", "email"}
+
+    # 기록 수와 관계없이 관련 데이터마다 한 번의 IN 쿼리
+    assert sum("FROM games" in statement for statement in statements) == 1
+    assert sum("FROM users" in statement for statement in statements) == 1
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list", params={"include": "comments"}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 async def test_read_my_game_log(
     async_client: AsyncClient,
     create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
@@ -123,7 +366,7 @@ async def test_read_my_game_log(
         headers={f"Authorization": f"Bearer {test_user["access_token"]}"},
     )
     status_code = response.status_code
-    response = response.json()
+    response = response.json()["items"]
 
     assert status_code == status.HTTP_200_OK
     assert len(response) == len(my_game_log_data)
@@ -131,6 +374,90 @@ async def test_read_my_game_log(
         assert res["user_name"] == test_user["name"]
 
 
+async def test_read_my_game_log_not_modified(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """바뀌지 않은 게임 기록 목록은 304 로 응답하는 테스트"""
+    test_user = create_test_all_game_log[0]
+    headers = {f"Authorization": f"Bearer {test_user['access_token']}"}
+
+    response = await async_client.get(f"{GAME_LOG_API_URL}/list/my", headers=headers)
+    etag = response.headers["ETag"]
+    assert etag.startswith("W/")
+    assert response.headers["Cache-Control"].startswith("private")
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list/my", headers=headers | {"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    # query 가 다르면 다른 ETag
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list/my",
+        params={"limit": 1},
+        headers=headers | {"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    # 기록이 바뀌면 다시 내려받음
+    await async_client.delete(f"{GAME_LOG_API_URL}/delete/my/1", headers=headers)
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list/my", headers=headers | {"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+
+async def test_read_game_log_include_not_modified(
+    async_client: AsyncClient,
+    redis_db: Redis,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """include 로 받은 관련 데이터가 바뀌면 304 가 아니라 다시 내려받는 테스트"""
+    test_user = create_test_all_game_log[0]
+    headers = {f"Authorization": f"Bearer {test_user['access_token']}"}
+    params = {"include": "game,user"}
+
+    response = await async_client.get(f"{GAME_LOG_API_URL}/list", params=params)
+    etag = response.headers["ETag"]
+
+    # 관련 데이터를 받지 않는 목록은 사용자가 바뀌어도 그대로
+    plain = await async_client.get(f"{GAME_LOG_API_URL}/list")
+    plain_etag = plain.headers["ETag"]
+
+    # 사용자 정보가 바뀜
+    response = await async_client.patch(
+        f"{USER_API_URL}/patch", json={"email": "changed@test.com"}, headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    emails = {
+        item["user"]["email"]
+        for item in response.json()["items"]
+        if item["user"]["name"] == test_user["name"]
+    }
+    assert emails == {"changed@test.com"}
+    etag = response.headers["ETag"]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list", headers={"If-None-Match": plain_etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # 게임 정보가 바뀜
+    await bump_version_in_redis(redis_db, GAMES)
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list", params=params, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+
 async def test_read_my_game_log_no_permission(
     async_client: AsyncClient,
     create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
@@ -155,7 +482,7 @@ async def test_read_game_log_one_game(
         headers={f"Authorization": f"Bearer {test_user["access_token"]}"},
     )
     status_code = response.status_code
-    response = response.json()
+    response = response.json()["items"]
 
     assert status_code == status.HTTP_200_OK
     assert len(response) == len(game_log_data)
@@ -193,13 +520,287 @@ async def test_read_my_game_log_one_game(
         headers={f"Authorization": f"Bearer {test_user["access_token"]}"},
     )
     status_code = response.status_code
-    response = response.json()
+    response = response.json()["items"]
 
     assert status_code == status.HTTP_200_OK
     assert len(response) == 1
     assert response[0]["game_name"] == game_log_data[0]["game_name"]
 
 
+async def test_read_game_log_pagination(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """cursor 를 따라가며 게임 기록을 한 페이지씩 가져오는 테스트"""
+    game_log_data = create_test_all_game_log[1]
+
+    ids, cursor = [], None
+    while True:
+        params = {"limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        response = await async_client.get(f"{GAME_LOG_API_URL}/list", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        response = response.json()
+
+        assert len(response["items"]) <= 1
+        ids.extend(res["id"] for res in response["items"])
+        cursor = response["next_cursor"]
+        if cursor is None:
+            break
+
+    # 기본 정렬은 최신 기록 먼저, 중복 없이 전체 기록을 순회
+    assert ids == sorted(ids, reverse=True)
+    assert len(ids) == len(game_log_data) * 2
+
+
+async def test_read_game_log_pagination_ascending(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """오름차순으로 게임 기록을 가져오는 테스트"""
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list", params={"limit": 3, "order": "asc"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = response.json()
+    assert [res["id"] for res in response["items"]] == [1, 2, 3]
+    assert response["next_cursor"] is not None
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list",
+        params={"limit": 3, "order": "asc", "cursor": response["next_cursor"]},
+    )
+    response = response.json()
+    assert [res["id"] for res in response["items"]] == [4]
+    assert response["next_cursor"] is None
+
+
+async def test_read_game_log_invalid_page(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """잘못된 cursor 나 페이지 크기로 요청했을 때"""
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list", params={"cursor": "invalid"}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await async_client.get(f"{GAME_LOG_API_URL}/list", params={"limit": 0})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_read_game_log_date_range(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+):
+    """작성 일시 범위로 게임 기록을 거르는 테스트"""
+    csv_data = (
+        "date,game_name,during_time,participant_num,subject\n"
+        "2024-01-31T20:00:00,캐스캐디아,40,2,1월\n"
+        "2024-02-01T00:00:00,캐스캐디아,40,2,2월 첫 판\n"
+        "2024-02-29T23:00:00,아크노바,200,3,2월 마지막 판\n"
+        "2024-03-01T00:00:00,아크노바,200,3,3월\n"
+    )
+    headers = {"Authorization": f"Bearer {login_test_user["access_token"]}"}
+    await async_client.post(
+        f"{GAME_LOG_API_URL}/import",
+        files={"file": ("logs.csv", csv_data.encode(), "text/csv")},
+        headers=headers,
+    )
+    params = {"from": "2024-02-01T00:00:00", "to": "2024-03-01T00:00:00"}
+
+    response = await async_client.get(f"{GAME_LOG_API_URL}/list", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    response = response.json()["items"]
+    assert [res["subject"] for res in response] == ["2월 마지막 판", "2월 첫 판"]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list/my/아크노바", params=params, headers=headers
+    )
+    assert [res["subject"] for res in response.json()["items"]] == ["2월 마지막 판"]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/export/my", params=params, headers=headers
+    )
+    assert len(response.text.splitlines()) == 2
+
+
+async def test_read_game_log_invalid_date_range(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """from 이 to 보다 늦을 때"""
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/list",
+        params={"from": "2024-03-01T00:00:00", "to": "2024-02-01T00:00:00"},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_search_game_log(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    create_test_all_game: GAME_DATA_LIST,
+):
+    """제목과 내용으로 게임 기록을 검색하는 테스트"""
+    csv_data = (
+        "date,game_name,during_time,participant_num,subject,content\n"
+        "2024-01-01T20:00:00,캐스캐디아,40,2,연어 전략,연어를 모아서 이겼다\n"
+        "2024-01-02T20:00:00,아크노바,200,3,첫 아크노바,동물원을 크게 지었다\n"
+        "2024-01-03T20:00:00,아크노바,200,3,두 번째 판,동물원 연어는 없다\n"
+    )
+    headers = {"Authorization": f"Bearer {login_test_user["access_token"]}"}
+    await async_client.post(
+        f"{GAME_LOG_API_URL}/import",
+        files={"file": ("logs.csv", csv_data.encode(), "text/csv")},
+        headers=headers,
+    )
+
+    # 조사가 붙은 한국어도 부분 문자열로 검색
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/search", params={"q": "동물원"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = response.json()
+    assert sorted(res["id"] for res in response["items"]) == [2, 3]
+    assert response["next_offset"] is None
+
+    # 짧은 검색어는 긴 검색어로 찾은 기록 중에서 거름
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/search", params={"q": "동물원 판"}
+    )
+    assert [res["id"] for res in response.json()["items"]] == [3]
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/search", params={"q": "동물원 연어"}
+    )
+    assert [res["id"] for res in response.json()["items"]] == [3]
+
+    # 페이지
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/search", params={"q": "동물원", "limit": 1}
+    )
+    response = response.json()
+    assert len(response["items"]) == 1
+    assert response["next_offset"] == 1
+
+    # 수정한 기록도 검색에 반영
+    await async_client.patch(
+        f"{GAME_LOG_API_URL}/patch/my/1",
+        json={"subject": "바다의 전략가"},
+        headers=headers,
+    )
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/search", params={"q": "바다의 전략가"}
+    )
+    assert [res["id"] for res in response.json()["items"]] == [1]
+
+
+async def test_search_game_log_invalid_query(async_client: AsyncClient):
+    """검색어가 없거나 비어 있을 때"""
+    response = await async_client.get(f"{GAME_LOG_API_URL}/search")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    response = await async_client.get(f"{GAME_LOG_API_URL}/search", params={"q": " "})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    # 3글자 이상인 단어가 없으면 색인으로 찾을 수 없음
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/search", params={"q": "연어 판"}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_export_my_game_log(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """내 게임 기록을 NDJSON 으로 내려받는 테스트"""
+    test_user = create_test_all_game_log[0]
+    game_log_data = create_test_all_game_log[1]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/export/my",
+        headers={f"Authorization": f"Bearer {test_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == len(game_log_data)
+    for row in rows:
+        assert row["user_name"] == test_user["name"]
+
+
+async def test_export_game_log_by_game_csv(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """특정 게임의 기록을 CSV 로 내려받는 테스트"""
+    game_log_data = create_test_all_game_log[1]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/export/{game_log_data[0]["game_name"]}",
+        params={"format": "csv", "order": "asc"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 2
+    assert [row["id"] for row in rows] == ["1", "2"]
+    for row in rows:
+        assert row["game_name"] == game_log_data[0]["game_name"]
+
+
+async def test_export_closes_body_on_disconnect():
+    """내려받는 중 연결이 끊겨도 본문 generator 를 닫아 세션을 정리하는 테스트"""
+    closed = []
+
+    async def body():
+        try:
+            yield "first\n"
+            yield "second\n"
+        finally:
+            closed.append(True)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            raise OSError("client disconnected")
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    with pytest.raises(Exception):
+        await ClosingStreamingResponse(body())(scope, receive, send)
+    assert closed == [True]
+
+
+async def test_export_all_game_log(
+    async_client: AsyncClient,
+    login_admin_user: USER_DATA,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """관리자만 전체 게임 기록을 내려받을 수 있는지 테스트"""
+    test_user = create_test_all_game_log[0]
+    game_log_data = create_test_all_game_log[1]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/export",
+        headers={f"Authorization": f"Bearer {test_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/export",
+        headers={f"Authorization": f"Bearer {login_admin_user["access_token"]}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.text.splitlines()) == len(game_log_data) * 2
+
+
 async def test_update_game_log(
     async_client: AsyncClient,
     create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
@@ -245,6 +846,220 @@ async def test_update_game_log_no_permission(
     assert status_code == status.HTTP_403_FORBIDDEN
 
 
+def make_picture(width: int, height: int) -> bytes:
+    """테스트용 PNG 사진을 만드는 함수"""
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color=(200, 30, 30)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+async def test_upload_game_log_picture(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+    picture_storage: str,
+):
+    """게임 기록에 사진을 올리는 테스트"""
+    test_user = create_test_all_game_log[0]
+    headers = {"Authorization": f"Bearer {test_user['access_token']}"}
+    picture = make_picture(3000, 1500)
+    key = hashlib.sha256(picture).hexdigest()
+
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/1",
+        files={"file": ("board.png", picture, "image/png")},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["picture"] == key
+
+    # 크기별로 줄여서 내용 기준 경로에 저장
+    picture_dir = os.path.join(picture_storage, key[:2], key[2:4], key)
+    for size, max_size in settings.PICTURE_SIZES.items():
+        with Image.open(os.path.join(picture_dir, f"{size}.webp")) as image:
+            assert image.size == (max_size, max_size // 2)
+
+    # 같은 사진은 한 번만 저장하고, 임시 파일은 남기지 않음
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/3",
+        files={"file": ("same.png", picture, "image/png")},
+        headers=headers,
+    )
+    assert response.json()["picture"] == key
+    assert os.listdir(picture_storage) == [key[:2]]
+
+
+async def test_upload_game_log_picture_releases_connection(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+    picture_storage: str,
+    monkeypatch,
+):
+    """사진을 받는 동안 db 연결을 잡고 있지 않는지 테스트"""
+    test_user = create_test_all_game_log[0]
+    store_picture = game_log_endpoint.store_picture
+    in_transaction = []
+
+    async def check_connection(request):
+        in_transaction.append(db_session.in_transaction())
+        return await store_picture(request)
+
+    monkeypatch.setattr(game_log_endpoint, "store_picture", check_connection)
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/1",
+        files={"file": ("board.png", make_picture(10, 10), "image/png")},
+        headers={"Authorization": f"Bearer {test_user['access_token']}"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["picture"]
+    assert in_transaction == [False]
+
+
+async def test_get_game_log_picture(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+    picture_storage: str,
+):
+    """저장된 사진을 크기별, 범위별로 가져오는 테스트"""
+    test_user = create_test_all_game_log[0]
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/1",
+        files={"file": ("board.png", make_picture(800, 400), "image/png")},
+        headers={"Authorization": f"Bearer {test_user['access_token']}"},
+    )
+    key = response.json()["picture"]
+
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/picture/{key}", params={"size": "thumbnail"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "image/webp"
+    assert "immutable" in response.headers["cache-control"]
+    with Image.open(io.BytesIO(response.content)) as image:
+        assert image.size == (320, 160)
+    etag = response.headers["etag"]
+
+    # 이미 받은 사진
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/picture/{key}",
+        params={"size": "thumbnail"},
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    # 일부만 요청
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/picture/{key}", headers={"Range": "bytes=0-9"}
+    )
+    assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert response.content[:4] == b"RIFF"
+    assert len(response.content) == 10
+
+    # 없는 크기, 없는 사진, 잘못된 key
+    response = await async_client.get(
+        f"{GAME_LOG_API_URL}/picture/{key}", params={"size": "huge"}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await async_client.get(f"{GAME_LOG_API_URL}/picture/{'0' * 64}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await async_client.get(f"{GAME_LOG_API_URL}/picture/not-a-key")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_upload_game_log_picture_invalid(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+    picture_storage: str,
+    monkeypatch,
+):
+    """사진이 아니거나, 너무 크거나, 다른 사람의 기록일 때"""
+    test_user = create_test_all_game_log[0]
+    headers = {"Authorization": f"Bearer {test_user['access_token']}"}
+
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/1",
+        files={"file": ("board.png", b"not a picture", "image/png")},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/2",
+        files={"file": ("board.png", make_picture(10, 10), "image/png")},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    monkeypatch.setattr(settings, "PICTURE_MAX_SIZE", 100)
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/1",
+        files={"file": ("board.png", make_picture(100, 100), "image/png")},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert os.listdir(picture_storage) == []
+
+    # 사진 필드가 없거나 multipart 가 아닐 때
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/1",
+        files={"other": ("board.png", b"x", "image/png")},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/1", content=b"x", headers=headers
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_upload_game_log_picture_rejects_before_reading(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+    picture_storage: str,
+    monkeypatch,
+):
+    """너무 큰 사진은 본문을 끝까지 받지 않고 거절하는지 테스트"""
+    test_user = create_test_all_game_log[0]
+    monkeypatch.setattr(settings, "PICTURE_MAX_SIZE", 1024)
+    monkeypatch.setattr(settings, "PICTURE_UPLOAD_CHUNK_SIZE", 256)
+    boundary = "picture-boundary"
+    sent = []
+
+    async def body():
+        sent.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; '
+            f'filename="board.png"\r\n\r\n'.encode()
+        )
+        yield sent[-1]
+        for _ in range(100):
+            sent.append(b"x" * 512)
+            yield sent[-1]
+        sent.append(f"\r\n--{boundary}--\r\n".encode())
+        yield sent[-1]
+
+    headers = {
+        "Authorization": f"Bearer {test_user['access_token']}",
+        "Content-Type": f"multipart/form-data; boundary={boundary}",
+    }
+    # Content-Length 가 너무 크면 본문을 읽지 않음
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/1",
+        content=body(),
+        headers={**headers, "Content-Length": str(100 * 1024 * 1024)},
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert sent == []
+
+    # Content-Length 가 없어도 한도를 넘는 즉시 거절
+    response = await async_client.post(
+        f"{GAME_LOG_API_URL}/picture/my/1", content=body(), headers=headers
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert len(sent) < 10
+    assert os.listdir(picture_storage) == []
+
+
 async def test_delete_game_log(
     async_client: AsyncClient,
     create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
@@ -264,7 +1079,7 @@ async def test_delete_game_log(
         f"{GAME_LOG_API_URL}/list/my",
         headers={f"Authorization": f"Bearer {test_user['access_token']}"},
     )
-    response = response.json()
+    response = response.json()["items"]
 
     assert len(response) == len(game_log_data) - 1
 
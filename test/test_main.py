@@ -1,7 +1,13 @@
-import pytest
+import pytest, asyncio, logging
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
+from app.config import settings
+from app.core.request_id import request_id_var
+from app.db.leak_detector import install_leak_detector, find_leaked_connections
+from app.db.sql_log import install_sql_logging, uninstall_sql_logging
+from app.db.session import async_engine, warm_up_db_pool
 from app.main import app
 
 
@@ -12,3 +18,106 @@ async def test_async_read_main(db_session: AsyncSession):
     ) as client:
         response = await client.get("/docs")
         assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_lifespan_db_pool():
+    """앱 시작 시 db 연결을 미리 맺고, 종료 시 모두 닫는 테스트"""
+    async with app.router.lifespan_context(app):
+        assert async_engine.pool.checkedin() == min(
+            settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE
+        )
+    assert async_engine.pool.checkedin() == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_up_db_pool_error(monkeypatch):
+    """연결 하나를 맺지 못해도 맺어진 연결을 모두 pool 로 돌려주는 테스트"""
+    connect = AsyncEngine.connect
+    calls = []
+
+    class FailingConnection:
+        async def start(self):
+            raise ConnectionRefusedError("db is down")
+
+    def connect_or_fail(engine):
+        calls.append(None)
+        return FailingConnection() if len(calls) == 2 else connect(engine)
+
+    monkeypatch.setattr(AsyncEngine, "connect", connect_or_fail)
+    with pytest.raises(ConnectionRefusedError):
+        await warm_up_db_pool(3)
+    assert async_engine.pool.checkedout() == 0
+    assert async_engine.pool.checkedin() == 2
+    await async_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_find_leaked_connections(caplog: pytest.LogCaptureFixture):
+    """오래 반환되지 않은 db 연결을 한 번만 경고하는 테스트"""
+    engine = create_async_engine(settings.TEST_DATABASE_URL)
+    install_leak_detector(engine)
+    caplog.set_level(logging.WARNING, logger="app.db.leak_detector")
+    try:
+        async with engine.connect():
+            await asyncio.sleep(0.05)
+            assert find_leaked_connections(threshold=10) == []
+
+            leaked = find_leaked_connections(threshold=0.01)
+            assert len(leaked) == 1
+            assert leaked[0][0] == asyncio.current_task().get_name()
+            find_leaked_connections(threshold=0.01)
+        assert find_leaked_connections(threshold=0.01) == []
+    finally:
+        await engine.dispose()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert sum("without being returned" in message for message in messages) == 1
+    assert sum("returned after" in message for message in messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_request_id(async_client: AsyncClient):
+    """요청 id 를 응답 헤더로 돌려주는 테스트"""
+    response = await async_client.get("/docs")
+    assert len(response.headers["X-Request-ID"]) == 32
+
+    response = await async_client.get("/docs", headers={"X-Request-ID": "abc"})
+    assert response.headers["X-Request-ID"] == "abc"
+
+
+@pytest.mark.asyncio
+async def test_sql_log(monkeypatch: pytest.MonkeyPatch):
+    """샘플링한 쿼리와 느린 쿼리를 요청 id, 가려진 인자와 함께 남기는 테스트"""
+    records = []
+
+    class CollectHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            records.append(record)
+
+    engine = create_async_engine(settings.TEST_DATABASE_URL)
+    install_sql_logging(engine, CollectHandler())
+    token = request_id_var.set("test-request")
+    try:
+        async with engine.connect() as conn:
+            monkeypatch.setattr(settings, "SQL_LOG_SAMPLE_RATE", 0.0)
+            await conn.execute(text("SELECT :password"), {"password": "secret"})
+
+            monkeypatch.setattr(settings, "SQL_LOG_SAMPLE_RATE", 1.0)
+            await conn.execute(text("SELECT :password"), {"password": "secret"})
+
+            monkeypatch.setattr(settings, "SQL_LOG_SAMPLE_RATE", 0.0)
+            monkeypatch.setattr(settings, "SQL_LOG_SLOW_THRESHOLD", 0.0)
+            await conn.execute(text("SELECT 1"))
+    finally:
+        request_id_var.reset(token)
+        uninstall_sql_logging(engine)  # queue 에 남은 로그까지 출력
+        await engine.dispose()
+
+    assert [record.levelno for record in records] == [logging.INFO, logging.WARNING]
+    sampled, slow = (record.sql for record in records)
+    assert sampled["request_id"] == "test-request"
+    assert sampled["statement"] == "SELECT ?"
+    assert "secret" not in str(sampled["parameters"])
+    assert slow["slow"] is True
+    assert slow["statement"] == "SELECT 1"
@@ -1,11 +1,27 @@
-import pytest
+import pytest, asyncio
 from httpx import AsyncClient
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from fastapi import status
 
+from app.core.principal_cache import PRINCIPAL_CHANNEL, get_cached_principal
+from app.core.security import create_token, restore_user
+from app.crud.leaderboard import rebuild_leaderboard_in_redis
+from app.crud.user import soft_delete_user_in_db, hard_delete_user_in_db
+from app.core.pubsub import listen_invalidations
 from app.models.user import User
-from test.conftest import USER_DATA, USER_DATA_LIST, USER_API_URL
+from app.services.recommendation import refresh_game_similarities
+from test.conftest import (
+    USER_DATA,
+    USER_DATA_LIST,
+    USER_API_URL,
+    GAME_DATA_LIST,
+    GAME_LOG_API_URL,
+    GAME_API_URL,
+)
 
 
 async def make_check_password(user_data: USER_DATA) -> USER_DATA:
@@ -175,6 +191,27 @@ async def test_logout(
     assert response.status_code == status.HTTP_200_OK
 
 
+@pytest.mark.asyncio
+async def test_logout_publish_error(
+    async_client: AsyncClient,
+    login_test_user: USER_DATA,
+    monkeypatch,
+):
+    """인증 캐시 변경 알림이 실패하면 로그아웃이 오류를 그대로 올리는지 테스트"""
+
+    async def fail(*args, **kwargs):
+        raise RedisConnectionError("redis is down")
+
+    monkeypatch.setattr("app.core.security.publish_principal_change_in_redis", fail)
+
+    access_token = login_test_user["access_token"]
+    with pytest.raises(RedisConnectionError):
+        await async_client.post(
+            f"{USER_API_URL}/logout",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+
 @pytest.mark.asyncio
 async def test_logout_not_matched_access_token(
     async_client: AsyncClient,
@@ -247,6 +284,10 @@ async def test_read_all_user(
 
     assert response.status_code == status.HTTP_200_OK
     assert len(response.json()) == len(user_data_list)
+    assert sorted(user["name"] for user in response.json()) == sorted(
+        user["name"] for user in user_data_list
+    )
+    assert all(user.keys() == {"name", "email"} for user in response.json())
 
 
 @pytest.mark.asyncio
@@ -266,6 +307,74 @@ async def test_read_me(
     assert response["name"] == login_test_user["name"]
 
 
+@pytest.mark.asyncio
+async def test_read_me_cached(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    login_test_user: USER_DATA,
+):
+    """확인한 토큰은 db 를 거치지 않고 인증하고, 로그아웃하면 캐시가 비워지는 테스트"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    headers = {"Authorization": f"Bearer {login_test_user["access_token"]}"}
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        for _ in range(3):
+            response = await async_client.get(
+                f"{USER_API_URL}/list/me", headers=headers
+            )
+            assert response.status_code == status.HTTP_200_OK
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    # 처음 한 번만 사용자를 읽음
+    assert sum("FROM users" in statement for statement in statements) == 1
+
+    response = await async_client.post(f"{USER_API_URL}/logout", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await async_client.get(f"{USER_API_URL}/list/me", headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_invalidated_by_other_worker(
+    async_client: AsyncClient,
+    redis_db: Redis,
+    login_test_user: USER_DATA,
+):
+    """다른 worker 의 사용자 변경 알림을 받으면 그 사용자의 토큰이 캐시에서 비워지는 테스트"""
+    access_token = login_test_user["access_token"]
+    listener = asyncio.create_task(listen_invalidations(redis_db))
+    try:
+        # 구독할 때까지 대기
+        for _ in range(100):
+            if (await redis_db.pubsub_numsub(PRINCIPAL_CHANNEL))[0][1]:
+                break
+            await asyncio.sleep(0.01)
+
+        await async_client.get(
+            f"{USER_API_URL}/list/me",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert get_cached_principal(access_token) is not None
+
+        await redis_db.publish(PRINCIPAL_CHANNEL, login_test_user["name"])
+        for _ in range(100):
+            if get_cached_principal(access_token) is None:
+                break
+            await asyncio.sleep(0.01)
+        assert get_cached_principal(access_token) is None
+    finally:
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+
 @pytest.mark.asyncio
 async def test_read_me_not_matched_access_token(
     async_client: AsyncClient,
@@ -492,9 +601,137 @@ async def test_restore_user_login_state(
     assert status_code == status.HTTP_404_NOT_FOUND
 
 
+async def test_deleted_user_leaderboard(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    redis_db: Redis,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """휴면, 복구, 영구 삭제된 사용자가 순위표에 반영되는지 테스트"""
+    test_user = create_test_all_game_log[0]
+    headers = {"Authorization": f"Bearer {test_user['access_token']}"}
+    players_url = f"{GAME_API_URL}/list/캐스캐디아/leaderboard"
+
+    async def player_names() -> list[str]:
+        response = await async_client.get(players_url)
+        return [player["name"] for player in response.json()]
+
+    games = (await async_client.get(f"{GAME_API_URL}/leaderboard")).json()
+    assert test_user["name"] in await player_names()
+
+    # 휴면 사용자는 사용자 순위에서만 빠짐
+    await async_client.patch(f"{USER_API_URL}/deactivate", headers=headers)
+    assert await player_names() == ["testadmin"]
+    assert (await async_client.get(f"{GAME_API_URL}/leaderboard")).json() == games
+
+    # 복구하면 다시 들어감
+    token = await create_token(expire_time=30, user_name=test_user["name"])
+    await restore_user(token=token, db=db_session, redis_db=redis_db)
+    assert test_user["name"] in await player_names()
+
+    # 영구 삭제하면 기록과 함께 게임 순위에서도 빠지고, 다시 만든 순위표와 같음
+    # (처음 휴면할 때 로그아웃되었으므로 직접 휴면 처리)
+    user = await db_session.scalar(select(User).where(User.name == test_user["name"]))
+    await soft_delete_user_in_db(db_session, redis_db, user)
+    await hard_delete_user_in_db(db_session, redis_db, delete_threshold_day=0)
+    players = await player_names()
+    assert players == ["testadmin"]
+    before, games = (
+        games,
+        (await async_client.get(f"{GAME_API_URL}/leaderboard")).json(),
+    )
+    assert games != before
+
+    await rebuild_leaderboard_in_redis(db_session, redis_db)
+    assert await player_names() == players
+    assert (await async_client.get(f"{GAME_API_URL}/leaderboard")).json() == games
+
+
 # TODO 리스토어 토큰이 담긴 url로 접속했을 때, 잘 동작하는지 확인하는 테스트 필요
 @pytest.mark.asyncio
 async def test_restore_user_confirm(
     async_client: AsyncClient, create_test_user: USER_DATA
 ):
     pass
+
+
+async def test_read_user_stats(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """사용자의 게임별 통계를 가져오는 테스트"""
+    test_user = create_test_all_game_log[0]
+    game_log_data = create_test_all_game_log[1]
+
+    response = await async_client.get(f"{USER_API_URL}/list/{test_user['name']}/stats")
+    assert response.status_code == status.HTTP_200_OK
+    response = {res["game_name"]: res for res in response.json()}
+
+    assert len(response) == len(game_log_data)
+    for game_log in game_log_data:
+        stats = response[game_log["game_name"]]
+        assert stats["play_count"] == 1
+        assert stats["total_during_time"] == game_log["during_time"]
+        assert stats["max_during_time"] == game_log["during_time"]
+        assert stats["avg_participant_num"] == game_log["participant_num"]
+
+
+async def test_read_user_stats_after_update_and_delete(
+    async_client: AsyncClient,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """게임 기록을 수정, 삭제하면 통계도 함께 바뀌는지 테스트"""
+    test_user = create_test_all_game_log[0]
+    headers = {"Authorization": f"Bearer {test_user['access_token']}"}
+
+    # 캐스캐디아 기록을 아크노바 기록으로 변경
+    await async_client.patch(
+        f"{GAME_LOG_API_URL}/patch/my/1",
+        headers=headers,
+        json={"game_name": "아크노바", "during_time": 80, "participant_num": 4},
+    )
+    response = await async_client.get(f"{USER_API_URL}/list/{test_user['name']}/stats")
+    response = response.json()
+
+    assert len(response) == 1
+    assert response[0]["game_name"] == "아크노바"
+    assert response[0]["play_count"] == 2
+    assert response[0]["total_during_time"] == 260
+    assert response[0]["max_during_time"] == 180
+    assert response[0]["avg_participant_num"] == 3
+
+    await async_client.delete(f"{GAME_LOG_API_URL}/delete/my/3", headers=headers)
+    response = await async_client.get(f"{USER_API_URL}/list/{test_user['name']}/stats")
+    response = response.json()
+
+    assert response[0]["play_count"] == 1
+    assert response[0]["max_during_time"] == 80
+
+
+async def test_read_user_stats_not_existed_user(async_client: AsyncClient):
+    """없는 사용자의 통계를 가져오는 테스트"""
+    response = await async_client.get(f"{USER_API_URL}/list/nobody/stats")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_read_recommendations(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    create_test_all_game_log: (USER_DATA, GAME_DATA_LIST),
+):
+    """플레이한 게임과 비슷한 게임을 추천하는 테스트"""
+    test_user = create_test_all_game_log[0]
+    headers = {"Authorization": f"Bearer {test_user['access_token']}"}
+
+    # 다른 사용자만 두 게임을 플레이한 상태로 만듦
+    await async_client.delete(f"{GAME_LOG_API_URL}/delete/my/3", headers=headers)
+    await refresh_game_similarities(db_session)
+
+    response = await async_client.get(
+        f"{USER_API_URL}/list/me/recommendations", headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [res["name"] for res in response.json()] == ["아크노바"]
+
+    response = await async_client.get(f"{USER_API_URL}/list/me/recommendations")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,146 @@
+import sys, os, asyncio, argparse, random, time
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncConnection
+
+# 명시적 선언
+from app.db.database import Base
+from app.models.game_log import GameLog
+from app.models.game import Game
+from app.models.user import User
+
+# 게임 기록의 접근 경로별 쿼리
+QUERIES = {
+    "list": "SELECT * FROM game_logs ORDER BY date DESC, id DESC LIMIT 21",
+    "list by user": "SELECT * FROM game_logs WHERE user_name = 'user0' "
+    "ORDER BY date DESC, id DESC LIMIT 21",
+    "list by game": "SELECT * FROM game_logs WHERE game_name = 'game0' "
+    "ORDER BY date DESC, id DESC LIMIT 21",
+    "list by user and game": "SELECT * FROM game_logs "
+    "WHERE user_name = 'user0' AND game_name = 'game0' "
+    "ORDER BY date DESC, id DESC LIMIT 21",
+    "stats refresh": "SELECT COUNT(id), SUM(during_time), MAX(during_time), "
+    "MIN(date), MAX(date) FROM game_logs "
+    "WHERE user_name = 'user0' AND game_name = 'game0'",
+    "cascade by user": "SELECT id FROM game_logs WHERE user_name = 'user0'",
+    "cascade by game": "SELECT id FROM game_logs WHERE game_name = 'game0'",
+}
+
+# 기존 id 인덱스를 제외하고 이번에 비교할 인덱스
+INDEXES = [
+    index for index in GameLog.__table__.indexes if index.name != "ix_game_logs_id"
+]
+
+
+async def seed(conn: AsyncConnection, rows: int, users: int, games: int) -> None:
+    """벤치마크용 사용자, 게임, 게임 기록을 생성하는 함수"""
+    await conn.execute(
+        User.__table__.insert(),
+        [
+            {"name": f"user{i}", "email": f"user{i}@example.com", "password": "-"}
+            for i in range(users)
+        ],
+    )
+    await conn.execute(
+        Game.__table__.insert(),
+        [
+            {
+                "name": f"game{i}",
+                "weight": 2.5,
+                "min_possible_num": 1,
+                "max_possible_num": 4,
+            }
+            for i in range(games)
+        ],
+    )
+    start = datetime(2020, 1, 1)
+    for offset in range(0, rows, 10000):
+        await conn.execute(
+            GameLog.__table__.insert(),
+            [
+                {
+                    "user_name": f"user{random.randrange(users)}",
+                    "game_name": f"game{random.randrange(games)}",
+                    "date": start + timedelta(minutes=i * 7),
+                    "during_time": random.randint(10, 240),
+                    "participant_num": random.randint(1, 4),
+                    "subject": f"subject {i}",
+                    "content": "content " * 20,
+                }
+                for i in range(offset, min(offset + 10000, rows))
+            ],
+        )
+
+
+async def explain(conn: AsyncConnection, query: str) -> str:
+    """dialect 에 맞게 쿼리 실행 계획을 반환하는 함수"""
+    if conn.dialect.name == "postgresql":
+        results = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"))
+        return "\n".join(row[0] for row in results)
+    results = await conn.execute(text(f"EXPLAIN QUERY PLAN {query}"))
+    return "\n".join(row[-1] for row in results)
+
+
+async def measure(conn: AsyncConnection, query: str, repeat: int) -> float:
+    """쿼리를 반복 실행한 평균 시간(ms)을 반환하는 함수"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        (await conn.execute(text(query))).all()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def run(conn: AsyncConnection, label: str, repeat: int) -> dict[str, float]:
+    """모든 접근 경로의 실행 계획과 시간을 출력하는 함수"""
+    if conn.dialect.name == "postgresql":
+        await conn.execute(text("ANALYZE game_logs"))
+    timings = {}
+    print(f"\n===== {label} =====")
+    for name, query in QUERIES.items():
+        timings[name] = await measure(conn, query, repeat)
+        print(f"\n[{name}] {timings[name]:.3f} ms")
+        print(await explain(conn, query))
+    return timings
+
+
+async def main(url: str, rows: int, users: int, games: int, repeat: int) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await seed(conn, rows, users, games)
+
+        for index in INDEXES:
+            await conn.run_sync(index.drop)
+        before = await run(conn, "before", repeat)
+
+        for index in INDEXES:
+            await conn.run_sync(index.create)
+        after = await run(conn, "after", repeat)
+
+        print("\n===== summary (ms) =====")
+        for name in QUERIES:
+            print(f"{name:<24}{before[name]:>10.3f}{after[name]:>10.3f}")
+
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="game_logs 인덱스 유무에 따른 실행 계획과 시간 비교"
+    )
+    parser.add_argument(
+        "--url",
+        default="sqlite+aiosqlite:///:memory:",
+        help="벤치마크에 사용할 빈 db (테이블을 지우고 다시 만듦)",
+    )
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--games", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.rows, args.users, args.games, args.repeat))
@@ -0,0 +1,90 @@
+import sys, os, asyncio, argparse, time
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi import FastAPI, Response
+from httpx import ASGITransport, AsyncClient
+
+# 명시적 선언
+from app.models.game_log import GameLog
+from app.models.game import Game
+from app.models.user import User
+from app.schemas.game_log import GameLogPageParams
+from app.services.game_log import game_log_page_response
+
+
+# 이전 방식과 같은 모든 필드를 응답
+DETAIL = GameLogPageParams(fields="detail")
+
+
+def make_game_logs(rows: int) -> list[GameLog]:
+    """db 없이 직렬화만 비교하기 위한 게임 기록 ORM 객체를 만드는 함수"""
+    start = datetime(2020, 1, 1)
+    return [
+        GameLog(
+            id=i,
+            user_name=f"user{i % 100}",
+            game_name=f"game{i % 30}",
+            date=start + timedelta(minutes=i * 7),
+            during_time=60 + i % 120,
+            participant_num=1 + i % 4,
+            subject=f"subject {i}",
+            content="content " * 20,
+            picture=None,
+        )
+        for i in range(rows)
+    ]
+
+
+def make_app(game_logs: list[GameLog]) -> FastAPI:
+    """이전 방식(jsonable_encoder)과 TypeAdapter 방식의 목록 API 를 가진 앱"""
+    app = FastAPI()
+
+    @app.get("/before")
+    async def before():
+        return {"items": game_logs, "next_cursor": None}
+
+    @app.get("/after")
+    async def after(response: Response):
+        return await game_log_page_response(response, game_logs, None, DETAIL)
+
+    return app
+
+
+async def measure(client: AsyncClient, path: str, requests: int) -> float:
+    """요청을 반복해 초당 요청 수를 반환하는 함수"""
+    await client.get(path)  # warm up
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path)
+        response.raise_for_status()
+    return requests / (time.perf_counter() - start)
+
+
+async def main(rows: int, requests: int) -> None:
+    app = make_app(make_game_logs(rows))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        before = (await client.get("/before")).json()
+        after = (await client.get("/after")).json()
+        assert before == after, "두 방식의 응답이 다릅니다."
+
+        before_rps = await measure(client, "/before", requests)
+        after_rps = await measure(client, "/after", requests)
+
+    print(f"rows per response: {rows}")
+    print(f"{'before (jsonable_encoder)':<28}{before_rps:>10.1f} req/s")
+    print(f"{'after (TypeAdapter)':<28}{after_rps:>10.1f} req/s")
+    print(f"{'speedup':<28}{after_rps / before_rps:>10.2f} x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="게임 기록 목록 응답의 직렬화 방식별 초당 요청 수 비교"
+    )
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.requests))
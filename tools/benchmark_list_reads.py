@@ -0,0 +1,126 @@
+import sys, os, asyncio, argparse, gc, time, tracemalloc
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+# 명시적 선언
+from app.db.database import Base
+from app.models.game_log import GameLog
+from app.models.game import Game
+from app.models.user import User
+from app.core.responses import render_json
+from app.crud.game import get_game_in_db, get_game_rows_in_db
+from app.crud.user import get_user_in_db, get_user_rows_in_db
+from app.schemas.game import GameResponse
+from app.schemas.user import UserResponse
+from app.services.game import GAME_LIST_ADAPTER
+from app.services.user import USER_LIST_ADAPTER
+
+# 목록별 [(방식, 읽는 함수, 응답 스키마, 응답 전 검증 여부)]
+# orm: ORM 객체를 읽어 응답 스키마로 검증 (이전 방식)
+# core: 필요한 컬럼만 읽은 slots 객체를 검증 없이 직렬화
+READS = {
+    "games": [
+        ("orm", get_game_in_db, TypeAdapter(list[GameResponse]), True),
+        ("core", get_game_rows_in_db, GAME_LIST_ADAPTER, False),
+    ],
+    "users": [
+        ("orm", get_user_in_db, TypeAdapter(list[UserResponse]), True),
+        ("core", get_user_rows_in_db, USER_LIST_ADAPTER, False),
+    ],
+}
+
+
+async def seed(session_factory: async_sessionmaker, rows: int) -> None:
+    """벤치마크용 사용자, 게임을 생성하는 함수"""
+    async with session_factory() as db:
+        await db.execute(
+            User.__table__.insert(),
+            [
+                {"name": f"user{i}", "email": f"user{i}@example.com", "password": "-"}
+                for i in range(rows)
+            ],
+        )
+        await db.execute(
+            Game.__table__.insert(),
+            [
+                {
+                    "name": f"game{i}",
+                    "weight": 2.5,
+                    "min_possible_num": 1,
+                    "max_possible_num": 4,
+                }
+                for i in range(rows)
+            ],
+        )
+        await db.commit()
+
+
+async def respond(
+    session_factory: async_sessionmaker, read, adapter: TypeAdapter, validate: bool
+) -> None:
+    """목록을 읽어 JSON 응답을 만드는 함수 (매번 새 세션을 사용해 identity map 을 재사용하지 않음)"""
+    async with session_factory() as db:
+        render_json(adapter, await read(db), validate=validate)
+
+
+async def measure(
+    session_factory: async_sessionmaker,
+    read,
+    adapter: TypeAdapter,
+    validate: bool,
+    repeat: int,
+) -> tuple[float, float]:
+    """
+    목록 응답을 만드는 평균 시간(ms)과 최대 할당 메모리(MB)를 반환하는 함수
+    tracemalloc 이 시간을 늘리므로 시간과 메모리는 따로 측정
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await respond(session_factory, read, adapter, validate)
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+
+    gc.collect()
+    tracemalloc.start()
+    await respond(session_factory, read, adapter, validate)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+async def main(url: str, rows: int, repeat: int) -> None:
+    engine = create_async_engine(url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await seed(session_factory, rows)
+
+    print(f"rows: {rows}, repeat: {repeat}")
+    print(f"{'':<8}{'':<6}{'ms':>10}{'peak MB':>10}")
+    for name, reads in READS.items():
+        for label, read, adapter, validate in reads:
+            ms, mb = await measure(session_factory, read, adapter, validate, repeat)
+            print(f"{name:<8}{label:<6}{ms:>10.1f}{mb:>10.2f}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="ORM 객체와 컬럼 row 로 목록을 읽을 때의 시간, 메모리 비교"
+    )
+    parser.add_argument(
+        "--url",
+        default="sqlite+aiosqlite:///:memory:",
+        help="벤치마크에 사용할 빈 db (테이블을 지우고 다시 만듦)",
+    )
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.rows, args.repeat))
@@ -0,0 +1,23 @@
+import sys, os, asyncio
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# 명시적 선언
+from app.models.game_log import GameLog
+from app.models.game import Game
+from app.models.user import User
+from app.api.dependencies import get_db
+from app.services.recommendation import refresh_game_similarities
+
+
+async def compute_game_similarities():
+    async for db in get_db():  # 스크립트에선 의존성 동작 안 함
+        count = await refresh_game_similarities(db)
+        print(f"✅ {count}개의 비슷한 게임 쌍을 저장했습니다.")
+        await db.close()
+
+
+if __name__ == "__main__":
+    # cron 등으로 주기적으로 실행하여 비슷한 게임, 추천 목록을 갱신
+    asyncio.run(compute_game_similarities())
@@ -0,0 +1,42 @@
+import sys, os, asyncio, argparse
+from datetime import date
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.config import settings
+from app.db.session import async_engine
+from app.db.partition import is_game_logs_partitioned, create_game_log_partitions
+
+
+async def create_partitions(months_ahead: int):
+    if async_engine.dialect.name != "postgresql":
+        print("⚠️ 파티션은 PostgreSQL 에서만 지원합니다.")
+        return
+
+    async with async_engine.begin() as conn:
+        if not await conn.run_sync(is_game_logs_partitioned):
+            print(
+                "⚠️ game_logs 가 파티션 테이블이 아닙니다. (alembic upgrade head 로 변환)"
+            )
+            return
+
+        names = await conn.run_sync(
+            create_game_log_partitions, date.today(), months_ahead
+        )
+        print(f"✅ 파티션 준비 완료: {', '.join(names)}")
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    # 매달 cron 등으로 실행하여 기록이 default 파티션에 쌓이지 않도록 미래 파티션을 미리 생성
+    parser = argparse.ArgumentParser(description="game_logs 월별 파티션 미리 만들기")
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=settings.GAME_LOG_PARTITION_MONTHS_AHEAD,
+        help="이번 달 이후로 미리 만들어 둘 달의 수",
+    )
+    args = parser.parse_args()
+    asyncio.run(create_partitions(args.months_ahead))
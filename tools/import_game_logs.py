@@ -0,0 +1,45 @@
+import sys, os, asyncio, argparse
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# 명시적 선언
+from app.models.game_log import GameLog
+from app.models.game import Game
+from app.models.user import User
+from app.api.dependencies import get_db
+from app.db.session import RedisClient
+from app.crud.user import get_user_in_db
+from app.services.game_log_import import import_game_log
+
+
+async def import_game_logs(user_name: str, csv_path: str):
+    async for db in get_db():  # 스크립트에선 의존성 동작 안 함
+        user = await get_user_in_db(db=db, name=user_name)
+        if not user:
+            print(f"⚠️ 사용자 [{user_name}] 를 찾을 수 없습니다.")
+            return
+
+        with open(csv_path, "rb") as file:
+            result = await import_game_log(db, RedisClient, file, user_name=user.name)
+
+        print(f"✅ {result['imported']}개의 게임 기록을 가져왔습니다.")
+        if result["failed"]:
+            print(f"⚠️ {result['failed']}개의 행을 가져오지 못했습니다.")
+            for error in result["errors"]:
+                print(f"  - {error['row']}행: {error['detail']}")
+
+        await db.close()
+        await RedisClient.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CSV 파일로 과거 게임 기록 가져오기")
+    parser.add_argument("user_name", help="기록을 가져올 사용자 이름")
+    parser.add_argument(
+        "csv_path",
+        help="date, game_name, during_time, participant_num, subject, content, "
+        "picture 컬럼을 가진 UTF-8 CSV 파일",
+    )
+    args = parser.parse_args()
+    asyncio.run(import_game_logs(args.user_name, args.csv_path))
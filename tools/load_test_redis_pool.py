@@ -0,0 +1,144 @@
+import sys, os, asyncio, argparse, time
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis
+from redis.asyncio.connection import Connection
+
+from app.config import settings
+
+
+class CountingConnection(Connection):
+    """실제로 맺고 닫은 연결 수를 세는 redis 연결"""
+
+    opened = 0
+    closed = 0
+    peak = 0
+
+    async def _connect(self):
+        await super()._connect()
+        self._counted = True
+        cls = CountingConnection
+        cls.opened += 1
+        cls.peak = max(cls.peak, cls.opened - cls.closed)
+
+    async def disconnect(self, nowait: bool = False) -> None:
+        # 같은 연결을 동시에 여러 번 닫을 수 있으므로 처음 한 번만 셈
+        if getattr(self, "_counted", False):
+            self._counted = False
+            CountingConnection.closed += 1
+        await super().disconnect(nowait=nowait)
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.opened = cls.closed = cls.peak = 0
+
+
+def make_pool(blocking: bool) -> ConnectionPool:
+    """
+    측정할 connection pool 을 만드는 함수
+    Args:
+        blocking: True 면 app.db.session 과 같은 설정의 pool, False 면 이전의 기본 pool
+    """
+    options = dict(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DATABASE,
+        decode_responses=True,
+        connection_class=CountingConnection,
+    )
+    if not blocking:
+        return ConnectionPool(**options)
+    return BlockingConnectionPool(
+        **options,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    )
+
+
+def make_app(client: Redis, close_per_request: bool) -> FastAPI:
+    """
+    요청마다 redis 명령을 몇 번 실행하는 앱
+    Args:
+        client: 모든 요청이 공유하는 redis 연결 객체
+        close_per_request: True 면 이전 get_redis 처럼 요청이 끝날 때마다 client 를 닫음
+    """
+    app = FastAPI()
+    errors = app.state.errors = []
+
+    async def get_redis():
+        try:
+            yield client
+        finally:
+            if close_per_request:
+                await client.aclose()
+
+    @app.exception_handler(Exception)
+    async def log_error(request, exc):
+        errors.append(f"{type(exc).__name__}: {exc}")
+        raise exc
+
+    @app.get("/")
+    async def index(redis_db: Redis = Depends(get_redis)):
+        await redis_db.incr("load_test:hits")
+        await redis_db.get("load_test:hits")
+        return {}
+
+    return app
+
+
+async def run(mode: str, concurrency: int, rounds: int) -> None:
+    """동시 요청을 rounds 번 보내고 라운드마다 연결 수를 출력하는 함수"""
+    CountingConnection.reset()
+    pool = make_pool(blocking=mode == "after")
+    client = Redis.from_pool(pool)
+    app = make_app(client, close_per_request=mode == "before")
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+
+    async def request(http: AsyncClient) -> bool:
+        try:
+            return (await http.get("/")).status_code == 200
+        except Exception:
+            return False
+
+    print(f"[{mode}]")
+    print(f"{'round':<7}{'errors':>8}{'opened':>8}{'peak':>8}{'open':>8}{'req/s':>10}")
+    async with AsyncClient(transport=transport, base_url="http://test") as http:
+        for number in range(1, rounds + 1):
+            start = time.perf_counter()
+            results = await asyncio.gather(*(request(http) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+            cls = CountingConnection
+            print(
+                f"{number:<7}{results.count(False):>8}{cls.opened:>8}{cls.peak:>8}"
+                f"{cls.opened - cls.closed:>8}{concurrency / elapsed:>10.1f}"
+            )
+    await client.delete("load_test:hits")
+    await client.aclose()
+
+
+async def main(concurrency: int, rounds: int) -> None:
+    print(
+        f"concurrency: {concurrency}, max connections: {settings.REDIS_MAX_CONNECTIONS}"
+    )
+    print(
+        "opened: 누적으로 맺은 연결 수, peak: 동시에 열려 있던 최대 연결 수, open: 라운드 후 열려 있는 연결 수"
+    )
+    await run("before", concurrency, rounds)  # 요청마다 client 를 닫던 이전 방식
+    await run("after", concurrency, rounds)  # 공용 pool 을 재사용하는 현재 방식
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="동시 요청에서 redis 연결을 요청마다 닫을 때와 pool 을 재사용할 때의 연결 수 비교"
+    )
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.rounds))
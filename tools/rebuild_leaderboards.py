@@ -0,0 +1,25 @@
+import sys, os, asyncio
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# 명시적 선언
+from app.models.game_log import GameLog
+from app.models.game import Game
+from app.models.user import User
+from app.api.dependencies import get_db
+from app.db.session import RedisClient
+from app.crud.leaderboard import rebuild_leaderboard_in_redis
+
+
+async def rebuild_leaderboards():
+    async for db in get_db():  # 스크립트에선 의존성 동작 안 함
+        count = await rebuild_leaderboard_in_redis(db, RedisClient)
+        print(f"✅ {count}개의 (사용자, 게임) 통계로 순위표를 다시 만들었습니다.")
+        await db.close()
+    await RedisClient.close()
+
+
+if __name__ == "__main__":
+    # 순위표가 db 와 어긋났을 때 (redis 장애, 게임 이름 변경, 사용자 삭제 등) 실행
+    asyncio.run(rebuild_leaderboards())